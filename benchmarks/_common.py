@@ -0,0 +1,305 @@
+"""Shared helpers for pysfmc benchmarks.
+
+The benchmarks run against a local stand-in for the SFMC REST host so that
+they are repeatable and need no credentials.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import ssl
+import subprocess
+import tempfile
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pysfmc import SFMCSettings
+from pysfmc.auth import TokenResponse
+from pysfmc.config import RateLimitConfig
+
+BENCH_SETTINGS = SFMCSettings(
+    client_id="bench_client_id",
+    client_secret="bench_client_secret",
+    account_id="123456789",
+    subdomain="bench-subdomain",
+)
+
+# Benchmarks sending more requests than the burst limit would time the limiter
+NO_RATE_LIMIT = RateLimitConfig(enabled=False)
+
+Responder = Callable[[str, str, dict[str, list[str]], bytes], tuple[int, bytes]]
+
+
+def make_self_signed_cert(directory: str) -> tuple[str, str]:
+    """Create a throwaway certificate for ``localhost`` with openssl."""
+    certfile = str(Path(directory) / "cert.pem")
+    keyfile = str(Path(directory) / "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost",
+            "-keyout",
+            keyfile,
+            "-out",
+            certfile,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return certfile, keyfile
+
+
+class JSONResponder:
+    """Responder answering every request with the same JSON body."""
+
+    def __init__(self, payload: Any):
+        self.body = json.dumps(payload).encode()
+
+    def __call__(self, method, path, query, request_body):
+        return 200, self.body
+
+
+class PagedResponder:
+    """Responder serving ``total`` small assets in pages, like the list endpoints."""
+
+    def __init__(self, total: int):
+        self.total = total
+
+    def __call__(self, method, path, query, request_body):
+        page = int(query.get("$page", ["1"])[0])
+        page_size = int(query.get("$pageSize", ["50"])[0])
+        first = (page - 1) * page_size + 1
+        last = min(page * page_size, self.total)
+        items = [{"id": i, "name": f"Asset {i}"} for i in range(first, last + 1)]
+        body = {"count": self.total, "page": page, "pageSize": page_size}
+        return 200, json.dumps({**body, "items": items}).encode()
+
+
+def json_responder(payload: Any) -> Responder:
+    """Build a responder that answers every request with the same JSON body."""
+    return JSONResponder(payload)
+
+
+async def _handle_connection(reader, writer, state):
+    state["connections"].value += 1
+    if state["connect_latency"]:
+        # Round trips of a TCP + TLS handshake to a remote host
+        await asyncio.sleep(state["connect_latency"])
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length") or 0)
+            request_body = await reader.readexactly(length) if length else b""
+            state["requests"].value += 1
+            if state["latency"]:
+                await asyncio.sleep(state["latency"])
+            parts = urlsplit(target)
+            status, body = state["responder"](
+                method, parts.path, parse_qs(parts.query), request_body
+            )
+            writer.write(
+                f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _serve(state, port, ready, certfile, keyfile):
+    context = None
+    if certfile:
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(certfile, keyfile)
+
+    async def main():
+        server = await asyncio.start_server(
+            lambda r, w: _handle_connection(r, w, state),
+            "127.0.0.1",
+            0,
+            ssl=context,
+            backlog=1024,
+        )
+        port.value = server.sockets[0].getsockname()[1]
+        ready.set()
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class StandInServer:
+    """HTTP(S) server standing in for the SFMC REST host.
+
+    Runs an asyncio server in a child process, so that it does not compete
+    with the benchmarked client for the GIL. Counts accepted connections (one
+    TLS handshake each) and requests, and can inject a fixed per-request
+    latency and a per-connection setup latency.
+    """
+
+    def __init__(
+        self,
+        responder: Responder,
+        latency: float = 0.0,
+        tls: bool = False,
+        connect_latency: float = 0.0,
+    ):
+        self.responder = responder
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.tls = tls
+        self._connections = multiprocessing.Value("i", 0)
+        self._requests = multiprocessing.Value("i", 0)
+        self._port = multiprocessing.Value("i", 0)
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+        self._process: multiprocessing.Process | None = None
+        self.certfile: str | None = None
+
+    @property
+    def connections(self) -> int:
+        return self._connections.value
+
+    @property
+    def requests(self) -> int:
+        return self._requests.value
+
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.tls else "http"
+        host = "localhost" if self.tls else "127.0.0.1"
+        return f"{scheme}://{host}:{self._port.value}/"
+
+    def reset_counters(self) -> None:
+        self._connections.value = 0
+        self._requests.value = 0
+
+    def __enter__(self) -> "StandInServer":
+        keyfile = None
+        if self.tls:
+            self._tmpdir = tempfile.TemporaryDirectory()
+            self.certfile, keyfile = make_self_signed_cert(self._tmpdir.name)
+            # httpx honours SSL_CERT_FILE when building its default SSL context
+            os.environ["SSL_CERT_FILE"] = self.certfile
+        state = {
+            "connections": self._connections,
+            "requests": self._requests,
+            "latency": self.latency,
+            "connect_latency": self.connect_latency,
+            "responder": self.responder,
+        }
+        ready = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=_serve,
+            args=(state, self._port, ready, self.certfile, keyfile),
+            daemon=True,
+        )
+        self._process.start()
+        ready.wait(10)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._process.terminate()
+        self._process.join()
+        if self._tmpdir is not None:
+            os.environ.pop("SSL_CERT_FILE", None)
+            self._tmpdir.cleanup()
+
+
+def seed_token(client: Any, rest_url: str) -> None:
+    """Give a client a long-lived token pointing at the stand-in REST host."""
+    authenticator = client._authenticator
+    authenticator._token = TokenResponse(
+        access_token="bench_token",
+        expires_in=3600,
+        scope="asset_read",
+        soap_instance_url=rest_url,
+        rest_instance_url=rest_url,
+    )
+    authenticator._token_expires_at = datetime.now() + timedelta(hours=1)
+
+
+def email_asset(asset_id: int, html_size: int = 20_000) -> dict[str, Any]:
+    """Build an HTML email asset as returned by the asset endpoints.
+
+    Template-based emails carry their full HTML in several views and slots,
+    which makes them the heaviest payloads of the API.
+    """
+    paragraph = (
+        '<tr><td class="stack-column" style="padding:10px;font-family:Arial;">'
+        "Bonjour %%FirstName%%, découvrez nos offres de printemps !</td></tr>\n"
+    )
+    html = paragraph * (html_size // len(paragraph))
+    user = {"id": 7001, "email": "owner@example.com", "name": "Bench Owner"}
+    return {
+        "id": asset_id,
+        "customerKey": f"spring-sale-{asset_id}",
+        "objectID": f"0b6c1d2e-{asset_id:04d}-4f5a-9b8c-7d6e5f4a3b2c",
+        "assetType": {"id": 208, "name": "htmlemail", "displayName": "HTML Email"},
+        "name": f"Spring sale {asset_id}",
+        "description": "Seasonal promotion",
+        "owner": user,
+        "createdDate": "2024-03-01T10:00:00.000-06:00",
+        "createdBy": user,
+        "modifiedDate": "2024-03-02T11:30:00.000-06:00",
+        "modifiedBy": user,
+        "enterpriseId": 100012345,
+        "memberId": 100012345,
+        "status": {"id": 1, "name": "Draft"},
+        "category": {"id": 1001, "name": "Content Builder", "parentId": 0},
+        "availableViews": ["html", "text", "subjectline", "preheader"],
+        "modelVersion": 2,
+        "views": {
+            "html": {
+                "content": html,
+                "slots": {
+                    "banner": {
+                        "content": html[: html_size // 4],
+                        "blocks": {
+                            "b1": {
+                                "assetType": {"id": 196, "name": "textblock"},
+                                "content": html[: html_size // 4],
+                            }
+                        },
+                    }
+                },
+            },
+            "text": {"content": "Bonjour %%FirstName%%", "generateFrom": "html"},
+            "subjectline": {"content": "Spring sale"},
+            "preheader": {"content": "Our best offers"},
+        },
+        "data": {"email": {"options": {"characterEncoding": "utf-8"}}},
+    }
+
+
+def asset_page(page_size: int = 50, html_size: int = 20_000) -> dict[str, Any]:
+    """Build a page of email assets as returned by the asset query endpoint."""
+    return {
+        "count": 10_000,
+        "page": 1,
+        "pageSize": page_size,
+        "links": {},
+        "items": [email_asset(i, html_size) for i in range(1, page_size + 1)],
+    }
@@ -0,0 +1,80 @@
+"""Benchmark: repeated reads of hot templates with and without the asset cache.
+
+Reads ``--templates`` HTML email assets ``--reads`` times each, round-robin,
+from a local stand-in that adds ``--latency`` seconds to every request. Runs
+without the cache, then with each revalidation mode of the asset cache.
+
+Run with ``python benchmarks/bench_asset_cache.py``.
+"""
+
+import argparse
+import json
+import time
+
+from _common import (
+    BENCH_SETTINGS,
+    NO_RATE_LIMIT,
+    StandInServer,
+    email_asset,
+    seed_token,
+)
+
+from pysfmc import SFMCClient, SFMCConfig
+from pysfmc.config import CacheConfig
+
+
+class AssetResponder:
+    """Responder serving assets by ID and their version checks."""
+
+    def __init__(self, html_size: int):
+        self.html_size = html_size
+
+    def __call__(self, method, path, query, request_body):
+        if path.rstrip("/").endswith("/assets"):
+            asset_id = int(query["$filter"][0].removeprefix("id eq "))
+            item = {"id": asset_id, "modifiedDate": "2024-03-02T11:30:00.000-06:00"}
+            page = {"count": 1, "page": 1, "pageSize": 1, "items": [item]}
+            return 200, json.dumps(page).encode()
+        asset_id = int(path.rsplit("/", 1)[1])
+        return 200, json.dumps(email_asset(asset_id, self.html_size)).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=20)
+    parser.add_argument("--reads", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--html-size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    modes = {
+        "no cache": CacheConfig(),
+        "ttl": CacheConfig(assets=True, assets_revalidation="ttl"),
+        "always": CacheConfig(assets=True, assets_revalidation="always"),
+        "stale-while-reval.": CacheConfig(
+            assets=True, assets_revalidation="stale-while-revalidate"
+        ),
+    }
+    reads = [i % args.templates + 1 for i in range(args.templates * args.reads)]
+    print(
+        f"{len(reads)} reads of {args.templates} templates, "
+        f"{args.latency * 1000:.0f} ms per request"
+    )
+    print(f"{'mode':<20}{'seconds':>10}{'requests':>10}{'us/read':>10}")
+
+    with StandInServer(AssetResponder(args.html_size), latency=args.latency) as server:
+        for mode, cache in modes.items():
+            config = SFMCConfig(rate_limit=NO_RATE_LIMIT, cache=cache)
+            with SFMCClient(settings=BENCH_SETTINGS, config=config) as client:
+                seed_token(client, server.base_url)
+                server.reset_counters()
+                started = time.perf_counter()
+                for asset_id in reads:
+                    client.assets.query.get_asset_by_id(asset_id)
+                elapsed = time.perf_counter() - started
+            per_read = elapsed / len(reads) * 1e6
+            print(f"{mode:<20}{elapsed:>10.2f}{server.requests:>10}{per_read:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: sequential versus concurrent asset creation with the sync client.
+
+Creates ``--total`` HTML email assets on a local stand-in that adds
+``--latency`` seconds to every request, once with a ``create_asset()`` loop and
+once with ``ContentClient.create_assets()`` for each pool size in
+``--workers``.
+
+Run with ``python benchmarks/bench_bulk_create.py``.
+"""
+
+import argparse
+import time
+
+from _common import (
+    BENCH_SETTINGS,
+    NO_RATE_LIMIT,
+    StandInServer,
+    email_asset,
+    json_responder,
+    seed_token,
+)
+
+from pysfmc import SFMCClient, SFMCConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.15)
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    html_email = {"name": "htmlemail", "id": 208}
+    specs = [
+        {"name": f"Email {i}", "asset_type": html_email, "content": "<p>Hi</p>"}
+        for i in range(args.total)
+    ]
+    with (
+        StandInServer(
+            json_responder(email_asset(1, 2_000)), latency=args.latency
+        ) as server,
+        SFMCClient(
+            settings=BENCH_SETTINGS, config=SFMCConfig(rate_limit=NO_RATE_LIMIT)
+        ) as client,
+    ):
+        seed_token(client, server.base_url)
+        content = client.assets.content
+        print(f"{args.total} assets, {args.latency * 1000:.0f} ms per request")
+        print(f"{'mode':<20}{'seconds':>10}{'created':>10}")
+
+        started = time.perf_counter()
+        for spec in specs:
+            content.create_asset(
+                spec["name"],
+                "htmlemail",
+                208,
+                content=spec["content"],
+            )
+        elapsed = time.perf_counter() - started
+        print(f"{'sequential':<20}{elapsed:>10.2f}{len(specs):>10}")
+
+        for workers in args.workers:
+            started = time.perf_counter()
+            created = sum(
+                result.ok
+                for result in content.create_assets(specs, max_workers=workers)
+            )
+            elapsed = time.perf_counter() - started
+            print(f"{f'{workers} threads':<20}{elapsed:>10.2f}{created:>10}")
+
+
+if __name__ == "__main__":
+    main()
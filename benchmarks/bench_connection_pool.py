@@ -0,0 +1,77 @@
+"""Benchmark: connection reuse of the tuned pool against a local TLS stand-in.
+
+Runs concurrent workers issuing asset requests through ``AsyncSFMCClient`` and
+reports how many TLS handshakes the stand-in server saw and the resulting
+throughput, for a bare ``httpx.AsyncClient`` pool (what the clients used to
+build) and for the pool built from the default ``ClientConfig``.
+
+The stand-in adds ``--connect-latency`` to every new connection to model the
+round trips of a TCP + TLS handshake to the SFMC hosts.
+
+Run with ``python benchmarks/bench_connection_pool.py``.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from _common import (
+    BENCH_SETTINGS,
+    NO_RATE_LIMIT,
+    StandInServer,
+    json_responder,
+    seed_token,
+)
+
+from pysfmc import AsyncSFMCClient, SFMCConfig
+
+PAGE = {"count": 1, "page": 1, "pageSize": 50, "items": [{"id": 1, "name": "x"}]}
+
+
+async def run_scenario(
+    server: StandInServer, bare: bool, workers: int, requests: int
+) -> tuple[int, float]:
+    server.reset_counters()
+    http_client = httpx.AsyncClient(timeout=30.0) if bare else None
+    async with AsyncSFMCClient(
+        settings=BENCH_SETTINGS,
+        http_client=http_client,
+        config=SFMCConfig(rate_limit=NO_RATE_LIMIT),
+    ) as client:
+        seed_token(client, server.base_url)
+
+        async def worker() -> None:
+            for _ in range(requests):
+                await client.get("/asset/v1/content/assets")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        elapsed = time.perf_counter() - started
+    return server.connections, workers * requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--connect-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with StandInServer(
+        json_responder(PAGE),
+        latency=args.latency,
+        connect_latency=args.connect_latency,
+        tls=True,
+    ) as server:
+        print(f"{'pool':<8}{'handshakes':>12}{'req/s':>10}")
+        for name, bare in (("bare", True), ("tuned", False)):
+            handshakes, throughput = asyncio.run(
+                run_scenario(server, bare, args.workers, args.requests)
+            )
+            print(f"{name:<8}{handshakes:>12}{throughput:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
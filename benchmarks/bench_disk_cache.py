@@ -0,0 +1,81 @@
+"""Benchmark: re-running a batch read with the on-disk response cache.
+
+Lists ``--total`` assets page by page, then reads ``--reads`` of them by ID,
+from a local stand-in that adds ``--latency`` seconds to every request. The
+job runs once without the cache, then twice with a fresh cache file: the
+first run fills it, the second stands for a restart after a crash.
+
+Run with ``python benchmarks/bench_disk_cache.py``.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from _common import (
+    BENCH_SETTINGS,
+    NO_RATE_LIMIT,
+    PagedResponder,
+    StandInServer,
+    seed_token,
+)
+
+from pysfmc import SFMCClient, SFMCConfig
+from pysfmc.config import CacheConfig
+
+
+class JobResponder(PagedResponder):
+    """Responder serving asset pages and single assets."""
+
+    def __call__(self, method, path, query, request_body):
+        last = path.rstrip("/").rsplit("/", 1)[1]
+        if last.isdigit():
+            return 200, f'{{"id": {last}, "name": "Asset {last}"}}'.encode()
+        return super().__call__(method, path, query, request_body)
+
+
+def run_job(server: StandInServer, config: SFMCConfig, reads: int) -> tuple:
+    with SFMCClient(settings=BENCH_SETTINGS, config=config) as client:
+        seed_token(client, server.base_url)
+        server.reset_counters()
+        started = time.perf_counter()
+        ids = [asset.id for asset in client.assets.query.iter_assets()]
+        for asset_id in ids[:reads]:
+            client.assets.query.get_asset_by_id(asset_id)
+        return time.perf_counter() - started, server.requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=2_500)
+    parser.add_argument("--reads", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(
+        f"{args.total} assets listed, {args.reads} read by ID, "
+        f"{args.latency * 1000:.0f} ms per request"
+    )
+    print(f"{'run':<20}{'seconds':>10}{'requests':>10}")
+    with (
+        StandInServer(JobResponder(args.total), latency=args.latency) as server,
+        tempfile.TemporaryDirectory() as directory,
+    ):
+        cached = SFMCConfig(
+            rate_limit=NO_RATE_LIMIT,
+            cache=CacheConfig(
+                disk=True, disk_path=os.path.join(directory, "responses.sqlite")
+            ),
+        )
+        for run, config in [
+            ("no cache", SFMCConfig(rate_limit=NO_RATE_LIMIT)),
+            ("cold cache", cached),
+            ("after restart", cached),
+        ]:
+            elapsed, requests = run_job(server, config, args.reads)
+            print(f"{run:<20}{elapsed:>10.2f}{requests:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: JSON codec cost on pages of email assets.
+
+Measures, per available codec, the time to decode a page of ``--page-size``
+HTML email assets (what every asset list call does) and to encode an asset
+creation payload. The encode benchmark also compares the previous model path
+(``model_dump`` to a dict, then stdlib ``json`` in httpx) with serializing the
+model straight to bytes with ``model_dump_json``.
+
+Run with ``python benchmarks/bench_json_codec.py``.
+"""
+
+import argparse
+import json
+import timeit
+
+from _common import asset_page, email_asset
+
+from pysfmc.codec import get_codec
+from pysfmc.models.assets import CreateAsset
+
+
+def best_of(func, repeat: int, number: int) -> float:
+    """Best time per call in milliseconds."""
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--html-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    page = asset_page(args.page_size, args.html_size)
+    body = json.dumps(page).encode()
+    print(f"page: {args.page_size} assets, {len(body) / 1e6:.1f} MB")
+    print(f"{'decode page':<28}{'ms':>10}")
+    for codec in codecs:
+        ms = best_of(lambda c=codec: c.loads(body), args.repeat, args.number)
+        print(f"{codec.name:<28}{ms:>10.2f}")
+
+    source = email_asset(1, args.html_size)
+    asset = CreateAsset(
+        name=source["name"],
+        customer_key=source["customerKey"],
+        asset_type={"id": 208, "name": "htmlemail"},
+        views=source["views"],
+        category={"id": 1001},
+    )
+    print(f"{'encode CreateAsset':<28}{'ms':>10}")
+    ms = best_of(
+        lambda: json.dumps(
+            asset.model_dump(exclude_none=True, by_alias=True),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode(),
+        args.repeat,
+        args.number * 10,
+    )
+    print(f"{'model_dump + json':<28}{ms:>10.3f}")
+    ms = best_of(
+        lambda: asset.model_dump_json(exclude_none=True, by_alias=True).encode(),
+        args.repeat,
+        args.number * 10,
+    )
+    print(f"{'model_dump_json':<28}{ms:>10.3f}")
+    print(f"{'encode dict payload':<28}{'ms':>10}")
+    for codec in codecs:
+        ms = best_of(lambda c=codec: c.dumps(source), args.repeat, args.number * 10)
+        print(f"{codec.name:<28}{ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
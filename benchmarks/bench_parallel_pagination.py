@@ -0,0 +1,61 @@
+"""Benchmark: sequential versus thread pool pagination with the sync client.
+
+Lists ``--total`` assets from a local stand-in that adds ``--latency`` seconds
+to every request, once page after page with ``QueryClient.iter_assets()`` and
+once with ``QueryClient.iter_asset_pages()`` on a thread pool of each size in
+``--workers``.
+
+Run with ``python benchmarks/bench_parallel_pagination.py``.
+"""
+
+import argparse
+import time
+
+from _common import (
+    BENCH_SETTINGS,
+    NO_RATE_LIMIT,
+    PagedResponder,
+    StandInServer,
+    seed_token,
+)
+
+from pysfmc import SFMCClient, SFMCConfig
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=2500)
+    parser.add_argument("--latency", type=float, default=0.15)
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    with (
+        StandInServer(PagedResponder(args.total), latency=args.latency) as server,
+        SFMCClient(
+            settings=BENCH_SETTINGS, config=SFMCConfig(rate_limit=NO_RATE_LIMIT)
+        ) as client,
+    ):
+        seed_token(client, server.base_url)
+        query = client.assets.query
+        print(f"{args.total} assets, {args.latency * 1000:.0f} ms per request")
+        print(f"{'mode':<20}{'seconds':>10}{'assets':>10}")
+
+        started = time.perf_counter()
+        count = sum(1 for _ in query.iter_assets(order_by="id asc"))
+        elapsed = time.perf_counter() - started
+        print(f"{'sequential':<20}{elapsed:>10.2f}{count:>10}")
+
+        for workers in args.workers:
+            started = time.perf_counter()
+            count = sum(
+                len(page.items)
+                for page in query.iter_asset_pages(
+                    order_by="id asc", max_workers=workers
+                )
+            )
+            elapsed = time.perf_counter() - started
+            print(f"{f'{workers} threads':<20}{elapsed:>10.2f}{count:>10}")
+
+
+if __name__ == "__main__":
+    main()
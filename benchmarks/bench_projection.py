@@ -0,0 +1,70 @@
+"""Benchmark: listing asset IDs, names and dates with and without projection.
+
+Compares a page of ``--page-size`` full HTML email assets validated into
+``AssetResponse`` with the same page as returned for
+``$fields=id,name,modifiedDate`` and validated into the generated slim model.
+Reports the body size, the time per page and the peak memory allocated while
+validating it.
+
+Run with ``python benchmarks/bench_projection.py``.
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from _common import asset_page
+from pydantic import TypeAdapter
+
+from pysfmc.models.assets import AssetResponse, asset_projection
+
+
+def peak_memory(func) -> float:
+    """Peak memory allocated by one call, in MB."""
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--html-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    projection = asset_projection(["id", "name", "modified_date"])
+    page = asset_page(args.page_size, args.html_size)
+    full_body = json.dumps(page).encode()
+    slim_page = {
+        **page,
+        "items": [
+            {key: item[key] for key in ("id", "name", "modifiedDate")}
+            for item in page["items"]
+        ],
+    }
+    slim_body = json.dumps(slim_page).encode()
+    full_adapter = TypeAdapter(AssetResponse)
+
+    paths = {
+        "full Asset": (full_body, lambda: full_adapter.validate_json(full_body)),
+        "projection": (
+            slim_body,
+            lambda: projection.response_adapter.validate_json(slim_body),
+        ),
+    }
+    print(f"{'page of':<14}{'KB':>10}{'ms':>10}{'peak KB':>10}")
+    for name, (body, func) in paths.items():
+        timings = timeit.repeat(func, repeat=args.repeat, number=args.number)
+        ms = min(timings) / args.number * 1000
+        peak = peak_memory(func) * 1000
+        print(f"{name:<14}{len(body) / 1000:>10.1f}{ms:>10.3f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
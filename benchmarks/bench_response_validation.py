@@ -0,0 +1,66 @@
+"""Benchmark: validating asset pages from dicts versus straight from bytes.
+
+Compares, for each installed codec, the previous list call path (decode the
+body to Python objects, then ``AssetResponse(**data)``) with validating the raw
+body through a cached ``TypeAdapter`` with ``JSONCodec.validate``, on a page of
+``--page-size`` HTML email assets. Every codec validates the bytes in
+pydantic-core directly, so that path is measured once. Reports the time per
+page and the peak memory allocated while validating it.
+
+Run with ``python benchmarks/bench_response_validation.py``.
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from _common import asset_page
+from pydantic import TypeAdapter
+
+from pysfmc.codec import get_codec
+from pysfmc.models.assets import AssetResponse
+
+
+def peak_memory(func) -> float:
+    """Peak memory allocated by one call, in MB."""
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--html-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    body = json.dumps(asset_page(args.page_size, args.html_size)).encode()
+    adapter = TypeAdapter(AssetResponse)
+    paths = {}
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        paths[f"{name}: loads + AssetResponse(**)"] = lambda c=codec: AssetResponse(
+            **c.loads(body)
+        )
+    validator = get_codec("json")
+    paths["any codec: validate"] = lambda: validator.validate(adapter, body)
+
+    print(f"page: {args.page_size} assets, {len(body) / 1e6:.1f} MB")
+    print(f"{'path':<38}{'ms':>8}{'peak MB':>10}")
+    for name, func in paths.items():
+        timings = timeit.repeat(func, repeat=args.repeat, number=args.number)
+        ms = min(timings) / args.number * 1000
+        print(f"{name:<38}{ms:>8.2f}{peak_memory(func):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: aggregate request rate of many worker processes.
+
+Starts ``--workers`` processes that each take tokens from the client rate
+limiter as fast as it allows for ``--duration`` seconds, then reports the
+aggregate rate. With one in-process bucket per worker the host sends
+``workers`` times the quota; with the SQLite-backed shared bucket the whole
+host stays at the configured limit.
+
+Run with ``python benchmarks/bench_shared_rate_limit.py``.
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from pysfmc.config import RateLimitConfig
+from pysfmc.ratelimit import create_rate_limiter
+
+
+def worker(config: RateLimitConfig, start_at: float, duration: float) -> int:
+    limiter = create_rate_limiter(config, key="bench-tenant")
+    while time.time() < start_at:
+        time.sleep(0.001)
+    taken = 0
+    while True:
+        limiter.acquire()
+        if time.time() >= start_at + duration:
+            break
+        taken += 1
+    limiter.close()
+    return taken
+
+
+def run(config: RateLimitConfig, workers: int, duration: float) -> float:
+    start_at = time.time() + 1.0
+    with multiprocessing.Pool(workers) as pool:
+        counts = pool.starmap(
+            worker, [(config, start_at, duration)] * workers, chunksize=1
+        )
+    # Each bucket allows its initial burst on top of the steady rate
+    buckets = 1 if config.shared_state_path else workers
+    return (sum(counts) - buckets * config.burst_limit) / duration * 60
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--requests-per-minute", type=int, default=2500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        configs = {
+            "per-process": RateLimitConfig(
+                requests_per_minute=args.requests_per_minute
+            ),
+            "shared": RateLimitConfig(
+                requests_per_minute=args.requests_per_minute,
+                shared_state_path=str(Path(directory) / "ratelimit.sqlite"),
+            ),
+        }
+        print(f"limit: {args.requests_per_minute} req/min, {args.workers} workers")
+        print(f"{'bucket':<14}{'req/min':>10}")
+        for name, config in configs.items():
+            rate = run(config, args.workers, args.duration)
+            print(f"{name:<14}{rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark: buffered versus streaming parsing of a page of heavy assets.
+
+Consumes one page of ``--page-size`` HTML email assets from a local stand-in,
+once with ``QueryClient.iter_assets()``, which reads and validates the whole
+page before yielding, and once with ``QueryClient.stream_assets()``, which
+yields each asset as soon as its JSON has arrived. Each asset is dropped once
+consumed, like in an export job. Reports the time per page and the peak
+memory allocated while consuming it.
+
+Run with ``python benchmarks/bench_streaming.py``.
+"""
+
+import argparse
+import time
+import tracemalloc
+from itertools import islice
+
+from _common import (
+    BENCH_SETTINGS,
+    StandInServer,
+    asset_page,
+    json_responder,
+    seed_token,
+)
+
+from pysfmc import SFMCClient, SFMCConfig
+
+
+def consume(assets, count: int) -> int:
+    """Consume and drop ``count`` assets, then stop the iterator."""
+    consumed = sum(1 for _ in islice(assets, count))
+    assets.close()
+    return consumed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--html-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = asset_page(args.page_size, args.html_size)
+    with (
+        StandInServer(json_responder(page)) as server,
+        SFMCClient(settings=BENCH_SETTINGS, config=SFMCConfig()) as client,
+    ):
+        seed_token(client, server.base_url)
+        query = client.assets.query
+        paths = {
+            "iter_assets": query.iter_assets,
+            "stream_assets": query.stream_assets,
+        }
+        print(f"{'mode':<16}{'ms':>10}{'peak MB':>10}")
+        for name, iterate in paths.items():
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                consume(iterate(page_size=args.page_size), args.page_size)
+                timings.append(time.perf_counter() - started)
+            tracemalloc.start()
+            consume(iterate(page_size=args.page_size), args.page_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:<16}{min(timings) * 1000:>10.1f}{peak / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
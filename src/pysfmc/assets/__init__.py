@@ -1,8 +1,10 @@
 """Assets clients for SFMC API."""
 
+from .bulk import BulkResult, CategoryTreeDeletion
 from .categories import AsyncCategoriesClient, CategoriesClient
 from .client import AssetsClient, AsyncAssetsClient
 from .query import AsyncQueryClient, QueryClient
+from .tree import CategoryTree
 
 __all__ = [
     "AssetsClient",
@@ -11,4 +13,7 @@ __all__ = [
     "AsyncCategoriesClient",
     "QueryClient",
     "AsyncQueryClient",
+    "BulkResult",
+    "CategoryTreeDeletion",
+    "CategoryTree",
 ]
@@ -0,0 +1,215 @@
+"""Helpers for running many SFMC Assets API calls with bounded concurrency."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Generic, Literal, TypeVar
+
+from ..exceptions import SFMCError
+from ..models.assets import Category
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[T, R]):
+    """Outcome of one item of a bulk operation.
+
+    Bulk operations keep going when an item fails, and report its error here
+    instead of raising it.
+
+    Attributes:
+        index: Position of the item in the input
+        item: Input item
+        result: Result of the operation, if it succeeded
+        error: Error raised by the operation, if it failed
+    """
+
+    index: int
+    item: T
+    result: R | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+
+@dataclass
+class CategoryTreeDeletion:
+    """Plan and outcome of the deletion of a category subtree.
+
+    Attributes:
+        levels: Categories of the subtree by depth, starting with the root
+        asset_ids: IDs of the assets of each category, by category ID
+        dry_run: Whether the deletions were only planned
+        asset_results: Outcome of each asset deletion
+        category_results: Outcome of each category deletion, deepest first
+    """
+
+    levels: list[list[Category]]
+    asset_ids: dict[int, list[int]] = field(default_factory=dict)
+    dry_run: bool = False
+    asset_results: list[BulkResult[int, Literal["OK"]]] = field(default_factory=list)
+    category_results: list[BulkResult[Category, Literal["OK"]]] = field(
+        default_factory=list
+    )
+
+    @property
+    def categories(self) -> list[Category]:
+        """All categories of the subtree, parents before their children."""
+        return [category for level in self.levels for category in level]
+
+    @property
+    def all_asset_ids(self) -> list[int]:
+        """IDs of the assets of all categories of the subtree."""
+        return [asset_id for ids in self.asset_ids.values() for asset_id in ids]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every planned deletion succeeded."""
+        return not self.dry_run and all(
+            result.ok for result in [*self.asset_results, *self.category_results]
+        )
+
+    def deletable(self, level: list[Category]) -> list[Category]:
+        """Get the categories of a level that the deletions so far emptied.
+
+        The API only deletes empty categories: those still holding an asset
+        or a subcategory whose deletion failed are reported as failed here
+        instead of being attempted.
+        """
+        failed_assets = {result.item for result in self.asset_results if not result.ok}
+        blocked = {
+            result.item.parent_id for result in self.category_results if not result.ok
+        }
+        blocked.update(
+            category_id
+            for category_id, ids in self.asset_ids.items()
+            if failed_assets.intersection(ids)
+        )
+        deletable = []
+        for index, category in enumerate(level):
+            if category.id in blocked:
+                error = SFMCError(
+                    f"Category {category.id} was not deleted: it is not empty"
+                )
+                self.category_results.append(BulkResult(index, category, error=error))
+            else:
+                deletable.append(category)
+        return deletable
+
+
+def map_in_threads(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[tuple[T, "Future[R]"]]:
+    """Call a function on each item from a thread pool.
+
+    Items are taken from the iterable as calls finish, so that at most
+    ``max_workers`` calls are pending and large or lazy inputs are never
+    loaded at once. Finished calls are yielded in completion order, failed
+    ones included: their ``result()`` raises the error.
+
+    Args:
+        func: Thread-safe function to call
+        items: Arguments of the calls
+        max_workers: Maximum number of calls running at the same time
+
+    Yields:
+        Tuples of an item and the finished future of its call
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    remaining = iter(items)
+    in_flight: dict[Future[R], T] = {}
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pysfmc-bulk")
+
+    def schedule() -> None:
+        for item in remaining:
+            in_flight[executor.submit(func, item)] = item
+            if len(in_flight) >= max_workers:
+                return
+
+    try:
+        schedule()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            done = [(in_flight.pop(future), future) for future in finished]
+            schedule()
+            yield from done
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def amap_concurrently(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> AsyncIterator[tuple[T, "asyncio.Task[R]"]]:
+    """Async version of ``map_in_threads()``, running the calls as tasks.
+
+    Args:
+        func: Coroutine function to call
+        items: Arguments of the calls
+        concurrency: Maximum number of calls running at the same time
+
+    Yields:
+        Tuples of an item and the finished task of its call
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    remaining = iter(items)
+    in_flight: dict[asyncio.Task[R], T] = {}
+
+    def schedule() -> None:
+        for item in remaining:
+            in_flight[asyncio.ensure_future(func(item))] = item
+            if len(in_flight) >= concurrency:
+                return
+
+    try:
+        schedule()
+        while in_flight:
+            finished, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            done = [(in_flight.pop(task), task) for task in finished]
+            schedule()
+            for item, task in done:
+                yield item, task
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+def iter_results_in_threads(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[BulkResult[T, R]]:
+    """Call a function on each item from a thread pool, capturing errors.
+
+    Like ``map_in_threads()``, but failed calls do not stop the others and
+    are reported in their ``BulkResult``.
+
+    Yields:
+        Results in completion order, ``index`` giving the input position
+    """
+    for (index, item), future in map_in_threads(
+        lambda pair: func(pair[1]), enumerate(items), max_workers
+    ):
+        error = future.exception()
+        result = None if error else future.result()
+        yield BulkResult(index, item, result, error)
+
+
+async def aiter_results_concurrently(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> AsyncIterator[BulkResult[T, R]]:
+    """Async version of ``iter_results_in_threads()``."""
+    async for (index, item), task in amap_concurrently(
+        lambda pair: func(pair[1]), enumerate(items), concurrency
+    ):
+        error = task.exception()
+        result = None if error else task.result()
+        yield BulkResult(index, item, result, error)
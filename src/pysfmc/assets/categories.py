@@ -1,18 +1,81 @@
 """Categories client for SFMC Assets (Content Builder) API."""
 
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Literal
 
+from pydantic import TypeAdapter
+
+from ..cache import TTLCache
+from ..config import CacheConfig
+from ..exceptions import SFMCError
 from ..models.assets import Category, CategoryCreate, CategoryFilter, CategoryResponse
+from .bulk import (
+    BulkResult,
+    CategoryTreeDeletion,
+    aiter_results_concurrently,
+    amap_concurrently,
+    iter_results_in_threads,
+    map_in_threads,
+)
+from .pagination import (
+    MAX_PAGE_SIZE,
+    aiter_pages,
+    iter_pages,
+    iter_pages_in_threads,
+)
+from .tree import CategoryPathPlan, CategoryTree
 
 if TYPE_CHECKING:
     from ..client import AsyncSFMCClient, SFMCClient
 
+# Validators built once, used to validate raw response bodies
+_CATEGORY_ADAPTER = TypeAdapter(Category)
+_CATEGORY_RESPONSE_ADAPTER = TypeAdapter(CategoryResponse)
+
+# Cache keys: ("id", category ID) for a category, ("page", query params) for
+# a page of get_categories()
+_CacheKey = tuple[str, object]
+
+
+def _category_cache(
+    config: CacheConfig,
+) -> TTLCache[_CacheKey, Category | CategoryResponse] | None:
+    """Create the category cache of a client, if enabled."""
+    if not config.categories:
+        return None
+    return TTLCache(config.categories_max_entries, config.categories_ttl)
+
+
+def _is_page(key: _CacheKey) -> bool:
+    return key[0] == "page"
+
+
+def _lists_children_of(parent_id: int) -> Callable[[_CacheKey], bool]:
+    """Match the cached pages that may list the subcategories of a category."""
+    clause = f"parentId eq {parent_id}"
+
+    def matches(key: _CacheKey) -> bool:
+        if not _is_page(key):
+            return False
+        filter_expr = dict(key[1]).get("$filter")  # type: ignore[call-overload]
+        return filter_expr in (None, clause) or filter_expr.endswith(f"({clause})")
+
+    return matches
+
 
 class CategoriesClient:
-    """Synchronous client for Content Builder category operations."""
+    """Synchronous client for Content Builder category operations.
+
+    With ``config.cache.categories`` enabled, categories and pages of
+    categories are cached in memory (LRU, with a time to live).
+    ``create_category()`` and ``delete_category_by_id()`` update the cache,
+    so that it stays correct for the changes made through this client.
+    """
 
     def __init__(self, client: "SFMCClient"):
         self._client = client
+        self._tree: CategoryTree | None = None
+        self._cache = _category_cache(client.config.cache)
 
     def get_categories(
         self,
@@ -54,9 +117,95 @@ class CategoriesClient:
             scope=scope,
         )
         params = filter_model.model_dump(by_alias=True, exclude_none=True)
+        key = ("page", tuple(sorted(params.items())))
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            return cached  # type: ignore[return-value]
+
+        body = self._client.get_raw("/asset/v1/content/categories", params=params)
+        response = self._client.validate_response(_CATEGORY_RESPONSE_ADAPTER, body)
+        if self._cache is not None:
+            self._cache.set(key, response)
+            for category in response.items:
+                self._cache.set(("id", category.id), category)
+        return response
+
+    def iter_categories(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        scope: str | None = None,
+        parent_id: int | None = None,
+    ) -> Iterator[Category]:
+        """Iterate over all categories matching a filter, across pages.
+
+        Pages are fetched as the iteration reaches them, and only the current
+        page is held in memory.
 
-        response_data = self._client.get("/asset/v1/content/categories", params=params)
-        return CategoryResponse(**response_data)
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'name asc', 'name desc')
+            filter_expr: Filter expression (only 'parentId eq <value>' supported)
+            scope: Scope filter (e.g., 'Shared')
+            parent_id: Filter by parent category ID
+
+        Yields:
+            Category model instances
+        """
+        for response in iter_pages(
+            lambda page: self.get_categories(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                scope=scope,
+                parent_id=parent_id,
+            )
+        ):
+            yield from response.items
+
+    def iter_category_pages(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        scope: str | None = None,
+        parent_id: int | None = None,
+        *,
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[CategoryResponse]:
+        """Fetch all pages of categories matching a filter from a thread pool.
+
+        The first page gives the total page count, then the remaining pages
+        are fetched by up to ``max_workers`` threads sharing this client (its
+        connection pool, token and rate limiter). Use a stable sort order
+        (e.g. 'id asc') so that pages do not overlap.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'name asc', 'name desc')
+            filter_expr: Filter expression (only 'parentId eq <value>' supported)
+            scope: Scope filter (e.g., 'Shared')
+            parent_id: Filter by parent category ID
+            max_workers: Maximum number of pages fetched at the same time
+            ordered: Yield pages in page order, or as soon as they finish
+
+        Yields:
+            CategoryResponse pages
+        """
+        yield from iter_pages_in_threads(
+            lambda page: self.get_categories(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                scope=scope,
+                parent_id=parent_id,
+            ),
+            max_workers,
+            ordered,
+        )
 
     def get_category_by_id(self, category_id: int) -> Category:
         """Get a specific category by ID.
@@ -67,8 +216,15 @@ class CategoriesClient:
         Returns:
             Category model instance
         """
-        response_data = self._client.get(f"/asset/v1/content/categories/{category_id}")
-        return Category(**response_data)
+        key = ("id", category_id)
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            return cached  # type: ignore[return-value]
+
+        body = self._client.get_raw(f"/asset/v1/content/categories/{category_id}")
+        category = self._client.validate_response(_CATEGORY_ADAPTER, body)
+        if self._cache is not None:
+            self._cache.set(key, category)
+        return category
 
     def create_category(
         self,
@@ -86,20 +242,223 @@ class CategoriesClient:
         """
         category_data = CategoryCreate(name=name, parent_id=parent_id)
 
-        response_data = self._client.post(
-            "/asset/v1/content/categories", json=category_data
-        )
-        return Category(**response_data)
+        body = self._client.post_raw("/asset/v1/content/categories", json=category_data)
+        category = self._client.validate_response(_CATEGORY_ADAPTER, body)
+        self._created(category)
+        return category
 
     def delete_category_by_id(self, category_id: int) -> Literal["OK"]:
-        return self._client.delete(f"/asset/v1/content/categories/{category_id}")  # type: ignore
+        response = self._client.delete(f"/asset/v1/content/categories/{category_id}")
+        self._deleted(category_id)
+        return response  # type: ignore
+
+    def delete_category_tree(
+        self, category_id: int, *, max_workers: int = 8, dry_run: bool = False
+    ) -> CategoryTreeDeletion:
+        """Delete a category with all its subcategories and assets.
+
+        The subtree is discovered level by level, querying the subcategories
+        of all categories of a level concurrently (``parentId eq``), then the
+        assets of every category are listed. Unless ``dry_run``, the assets
+        are deleted concurrently, then the categories from the deepest level
+        up, since the API only deletes empty categories. A category left
+        non-empty by a failed deletion is not attempted and reported as failed.
+        Each step runs up to ``max_workers`` requests at the same time.
+
+        Args:
+            category_id: ID of the root category of the subtree
+            max_workers: Maximum number of requests at the same time
+            dry_run: Only discover what would be deleted
+
+        Returns:
+            The categories and assets of the subtree, and unless ``dry_run``
+            the outcome of every deletion
+        """
+        deletion = CategoryTreeDeletion(
+            self._load_levels([self.get_category_by_id(category_id)], max_workers)
+        )
+        query = self._client.assets.query
+
+        def asset_ids(category: Category) -> list[int]:
+            return [
+                asset.id
+                for asset in query.iter_assets(
+                    filter_expr=f"category.id eq {category.id}", fields="id"
+                )
+            ]
+
+        for category, future in map_in_threads(
+            asset_ids, deletion.categories, max_workers
+        ):
+            deletion.asset_ids[category.id] = future.result()
+        if dry_run:
+            deletion.dry_run = True
+            return deletion
+
+        deletion.asset_results.extend(
+            self._client.assets.content.iter_delete_assets(
+                deletion.all_asset_ids, max_workers=max_workers
+            )
+        )
+        for level in reversed(deletion.levels):
+            deletion.category_results.extend(
+                iter_results_in_threads(
+                    lambda category: self.delete_category_by_id(category.id),
+                    deletion.deletable(level),
+                    max_workers,
+                )
+            )
+        return deletion
+
+    def get_category_tree(
+        self, root_id: int | None = None, *, max_workers: int = 8
+    ) -> CategoryTree:
+        """Load the category hierarchy into an index for local lookups.
+
+        The tree is loaded breadth-first: the subcategories of all categories
+        of a level are queried concurrently (``parentId eq``), so the number
+        of round trips grows with the depth of the tree rather than with its
+        size. Keep the tree to resolve IDs, paths, children and depths
+        without further API calls.
+
+        Args:
+            root_id: Only load the subtree of this category, included
+            max_workers: Maximum number of requests at the same time
+
+        Returns:
+            CategoryTree of the whole hierarchy, or of the subtree
+        """
+        if root_id is None:
+            first_level = list(self.iter_categories(parent_id=0))
+        else:
+            first_level = [self.get_category_by_id(root_id)]
+        levels = self._load_levels(first_level, max_workers)
+        return CategoryTree(category for level in levels for category in level)
+
+    def ensure_category_path(
+        self, path: str | Sequence[str], *, tree: CategoryTree | None = None
+    ) -> Category:
+        """Get the category of a path, creating the missing ones (``mkdir -p``).
+
+        The existing part of the path is resolved from ``tree``, or from the
+        whole hierarchy loaded on the first call and kept by this client, so
+        resolving an existing path makes no request. Only the missing
+        categories are created, and added to the tree. If a creation fails
+        because another writer created the category since the tree was
+        loaded, the existing category is used. The root category (e.g.
+        'Content Builder') must exist.
+
+        Args:
+            path: Category names joined with ``/``, or a sequence of names
+            tree: Tree of the existing categories, updated with the new ones
+
+        Returns:
+            Category at the end of the path
+
+        Raises:
+            SFMCNotFoundError: If the root category does not exist
+        """
+        (result,) = self.ensure_category_paths([path], tree=tree, max_workers=1)
+        if result.error is not None:
+            raise result.error
+        return result.result  # type: ignore[return-value]
+
+    def ensure_category_paths(
+        self,
+        paths: Iterable[str | Sequence[str]],
+        *,
+        tree: CategoryTree | None = None,
+        max_workers: int = 8,
+    ) -> list[BulkResult[str | Sequence[str], Category]]:
+        """Get the category of many paths, creating the missing ones.
+
+        Like ``ensure_category_path()``, creating the missing categories one
+        depth at a time: the categories of a depth, on independent branches,
+        are created concurrently, each only once however many paths share it.
+        A failed creation fails the paths below it, not the others.
+
+        Args:
+            paths: Category paths, as for ``ensure_category_path()``
+            tree: Tree of the existing categories, updated with the new ones
+            max_workers: Maximum number of requests at the same time
+
+        Returns:
+            The category of each path, or the error, in input order
+        """
+        if tree is None:
+            if self._tree is None:
+                self._tree = self.get_category_tree(max_workers=max_workers)
+            tree = self._tree
+        plan = CategoryPathPlan(tree, paths)
+        for level in plan.levels():
+            for prefix, future in map_in_threads(
+                lambda prefix: self._ensure_child(plan.parent(prefix), prefix[-1]),
+                level,
+                max_workers,
+            ):
+                plan.record(prefix, future.exception() or future.result())
+        return plan.results()
+
+    def _ensure_child(self, parent: Category, name: str) -> Category:
+        """Create a subcategory, or get it if another writer created it."""
+        try:
+            return self.create_category(name, parent.id)
+        except SFMCError:
+            # The cached pages predate the other writer's category
+            if self._cache is not None:
+                self._cache.discard_if(_lists_children_of(parent.id))
+            for category in self.iter_categories(parent_id=parent.id):
+                if category.name == name:
+                    return category
+            raise
+
+    def _created(self, category: Category) -> None:
+        """Write a created category through to the cache and the kept tree."""
+        if self._cache is not None:
+            self._cache.discard_if(_is_page)
+            self._cache.set(("id", category.id), category)
+        if self._tree is not None:
+            self._tree.add(category)
+
+    def _deleted(self, category_id: int) -> None:
+        """Drop a deleted category from the cache and the kept tree."""
+        if self._cache is not None:
+            self._cache.discard_if(_is_page)
+            self._cache.pop(("id", category_id))
+        if self._tree is not None and category_id in self._tree:
+            self._tree = None
+
+    def _load_levels(
+        self, first_level: list[Category], max_workers: int
+    ) -> list[list[Category]]:
+        """Load the categories below a level, one level at a time."""
+        levels = [first_level]
+        while levels[-1]:
+            children: list[Category] = []
+            for _, future in map_in_threads(
+                lambda category: list(self.iter_categories(parent_id=category.id)),
+                levels[-1],
+                max_workers,
+            ):
+                children.extend(future.result())
+            levels.append(children)
+        levels.pop()
+        return levels
 
 
 class AsyncCategoriesClient:
-    """Asynchronous client for Content Builder category operations."""
+    """Asynchronous client for Content Builder category operations.
+
+    With ``config.cache.categories`` enabled, categories and pages of
+    categories are cached in memory (LRU, with a time to live).
+    ``create_category()`` and ``delete_category_by_id()`` update the cache,
+    so that it stays correct for the changes made through this client.
+    """
 
     def __init__(self, client: "AsyncSFMCClient"):
         self._client = client
+        self._tree: CategoryTree | None = None
+        self._cache = _category_cache(client.config.cache)
 
     async def get_categories(
         self,
@@ -141,11 +500,53 @@ class AsyncCategoriesClient:
             scope=scope,
         )
         params = filter_model.model_dump(by_alias=True, exclude_none=True)
+        key = ("page", tuple(sorted(params.items())))
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            return cached  # type: ignore[return-value]
+
+        body = await self._client.get_raw("/asset/v1/content/categories", params=params)
+        response = self._client.validate_response(_CATEGORY_RESPONSE_ADAPTER, body)
+        if self._cache is not None:
+            self._cache.set(key, response)
+            for category in response.items:
+                self._cache.set(("id", category.id), category)
+        return response
+
+    async def iter_categories(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        scope: str | None = None,
+        parent_id: int | None = None,
+    ) -> AsyncIterator[Category]:
+        """Iterate over all categories matching a filter, across pages.
 
-        response_data = await self._client.get(
-            "/asset/v1/content/categories", params=params
-        )
-        return CategoryResponse(**response_data)
+        Pages are fetched as the iteration reaches them, and only the current
+        page is held in memory.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'name asc', 'name desc')
+            filter_expr: Filter expression (only 'parentId eq <value>' supported)
+            scope: Scope filter (e.g., 'Shared')
+            parent_id: Filter by parent category ID
+
+        Yields:
+            Category model instances
+        """
+        async for response in aiter_pages(
+            lambda page: self.get_categories(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                scope=scope,
+                parent_id=parent_id,
+            )
+        ):
+            for category in response.items:
+                yield category
 
     async def get_category_by_id(self, category_id: int) -> Category:
         """Get a specific category by ID.
@@ -156,10 +557,15 @@ class AsyncCategoriesClient:
         Returns:
             Category model instance
         """
-        response_data = await self._client.get(
-            f"/asset/v1/content/categories/{category_id}"
-        )
-        return Category(**response_data)
+        key = ("id", category_id)
+        if self._cache is not None and (cached := self._cache.get(key)) is not None:
+            return cached  # type: ignore[return-value]
+
+        body = await self._client.get_raw(f"/asset/v1/content/categories/{category_id}")
+        category = self._client.validate_response(_CATEGORY_ADAPTER, body)
+        if self._cache is not None:
+            self._cache.set(key, category)
+        return category
 
     async def create_category(
         self,
@@ -180,13 +586,215 @@ class AsyncCategoriesClient:
             parent_id=parent_id,
         )
 
-        response_data = await self._client.post(
+        body = await self._client.post_raw(
             "/asset/v1/content/categories", json=category_data
         )
-        return Category(**response_data)
+        category = self._client.validate_response(_CATEGORY_ADAPTER, body)
+        self._created(category)
+        return category
 
     async def delete_category_by_id(self, category_id: int) -> Literal["OK"]:
         response = await self._client.delete(
             f"/asset/v1/content/categories/{category_id}"
         )
+        self._deleted(category_id)
         return response  # type: ignore
+
+    async def delete_category_tree(
+        self, category_id: int, *, concurrency: int = 8, dry_run: bool = False
+    ) -> CategoryTreeDeletion:
+        """Delete a category with all its subcategories and assets.
+
+        The subtree is discovered level by level, querying the subcategories
+        of all categories of a level concurrently (``parentId eq``), then the
+        assets of every category are listed. Unless ``dry_run``, the assets
+        are deleted concurrently, then the categories from the deepest level
+        up, since the API only deletes empty categories. A category left
+        non-empty by a failed deletion is not attempted and reported as failed.
+        Each step runs up to ``concurrency`` requests at the same time.
+
+        Args:
+            category_id: ID of the root category of the subtree
+            concurrency: Maximum number of requests at the same time
+            dry_run: Only discover what would be deleted
+
+        Returns:
+            The categories and assets of the subtree, and unless ``dry_run``
+            the outcome of every deletion
+        """
+        deletion = CategoryTreeDeletion(
+            await self._load_levels(
+                [await self.get_category_by_id(category_id)], concurrency
+            )
+        )
+        query = self._client.assets.query
+
+        async def asset_ids(category: Category) -> list[int]:
+            return [
+                asset.id
+                async for asset in query.iter_assets(
+                    filter_expr=f"category.id eq {category.id}", fields="id"
+                )
+            ]
+
+        async for category, task in amap_concurrently(
+            asset_ids, deletion.categories, concurrency
+        ):
+            deletion.asset_ids[category.id] = task.result()
+        if dry_run:
+            deletion.dry_run = True
+            return deletion
+
+        async for result in self._client.assets.content.iter_delete_assets(
+            deletion.all_asset_ids, concurrency=concurrency
+        ):
+            deletion.asset_results.append(result)
+        for level in reversed(deletion.levels):
+            async for result in aiter_results_concurrently(
+                lambda category: self.delete_category_by_id(category.id),
+                deletion.deletable(level),
+                concurrency,
+            ):
+                deletion.category_results.append(result)
+        return deletion
+
+    async def get_category_tree(
+        self, root_id: int | None = None, *, concurrency: int = 8
+    ) -> CategoryTree:
+        """Load the category hierarchy into an index for local lookups.
+
+        The tree is loaded breadth-first: the subcategories of all categories
+        of a level are queried concurrently (``parentId eq``), so the number
+        of round trips grows with the depth of the tree rather than with its
+        size. Keep the tree to resolve IDs, paths, children and depths
+        without further API calls.
+
+        Args:
+            root_id: Only load the subtree of this category, included
+            concurrency: Maximum number of requests at the same time
+
+        Returns:
+            CategoryTree of the whole hierarchy, or of the subtree
+        """
+        if root_id is None:
+            first_level = [
+                category async for category in self.iter_categories(parent_id=0)
+            ]
+        else:
+            first_level = [await self.get_category_by_id(root_id)]
+        levels = await self._load_levels(first_level, concurrency)
+        return CategoryTree(category for level in levels for category in level)
+
+    async def ensure_category_path(
+        self, path: str | Sequence[str], *, tree: CategoryTree | None = None
+    ) -> Category:
+        """Get the category of a path, creating the missing ones (``mkdir -p``).
+
+        The existing part of the path is resolved from ``tree``, or from the
+        whole hierarchy loaded on the first call and kept by this client, so
+        resolving an existing path makes no request. Only the missing
+        categories are created, and added to the tree. If a creation fails
+        because another writer created the category since the tree was
+        loaded, the existing category is used. The root category (e.g.
+        'Content Builder') must exist.
+
+        Args:
+            path: Category names joined with ``/``, or a sequence of names
+            tree: Tree of the existing categories, updated with the new ones
+
+        Returns:
+            Category at the end of the path
+
+        Raises:
+            SFMCNotFoundError: If the root category does not exist
+        """
+        (result,) = await self.ensure_category_paths([path], tree=tree, concurrency=1)
+        if result.error is not None:
+            raise result.error
+        return result.result  # type: ignore[return-value]
+
+    async def ensure_category_paths(
+        self,
+        paths: Iterable[str | Sequence[str]],
+        *,
+        tree: CategoryTree | None = None,
+        concurrency: int = 8,
+    ) -> list[BulkResult[str | Sequence[str], Category]]:
+        """Get the category of many paths, creating the missing ones.
+
+        Like ``ensure_category_path()``, creating the missing categories one
+        depth at a time: the categories of a depth, on independent branches,
+        are created concurrently, each only once however many paths share it.
+        A failed creation fails the paths below it, not the others.
+
+        Args:
+            paths: Category paths, as for ``ensure_category_path()``
+            tree: Tree of the existing categories, updated with the new ones
+            concurrency: Maximum number of requests at the same time
+
+        Returns:
+            The category of each path, or the error, in input order
+        """
+        if tree is None:
+            if self._tree is None:
+                self._tree = await self.get_category_tree(concurrency=concurrency)
+            tree = self._tree
+        plan = CategoryPathPlan(tree, paths)
+        for level in plan.levels():
+            async for prefix, task in amap_concurrently(
+                lambda prefix: self._ensure_child(plan.parent(prefix), prefix[-1]),
+                level,
+                concurrency,
+            ):
+                plan.record(prefix, task.exception() or task.result())
+        return plan.results()
+
+    async def _ensure_child(self, parent: Category, name: str) -> Category:
+        """Create a subcategory, or get it if another writer created it."""
+        try:
+            return await self.create_category(name, parent.id)
+        except SFMCError:
+            # The cached pages predate the other writer's category
+            if self._cache is not None:
+                self._cache.discard_if(_lists_children_of(parent.id))
+            async for category in self.iter_categories(parent_id=parent.id):
+                if category.name == name:
+                    return category
+            raise
+
+    def _created(self, category: Category) -> None:
+        """Write a created category through to the cache and the kept tree."""
+        if self._cache is not None:
+            self._cache.discard_if(_is_page)
+            self._cache.set(("id", category.id), category)
+        if self._tree is not None:
+            self._tree.add(category)
+
+    def _deleted(self, category_id: int) -> None:
+        """Drop a deleted category from the cache and the kept tree."""
+        if self._cache is not None:
+            self._cache.discard_if(_is_page)
+            self._cache.pop(("id", category_id))
+        if self._tree is not None and category_id in self._tree:
+            self._tree = None
+
+    async def _load_levels(
+        self, first_level: list[Category], concurrency: int
+    ) -> list[list[Category]]:
+        """Load the categories below a level, one level at a time."""
+
+        async def children_of(category: Category) -> list[Category]:
+            return [
+                child async for child in self.iter_categories(parent_id=category.id)
+            ]
+
+        levels = [first_level]
+        while levels[-1]:
+            children: list[Category] = []
+            async for _, task in amap_concurrently(
+                children_of, levels[-1], concurrency
+            ):
+                children.extend(task.result())
+            levels.append(children)
+        levels.pop()
+        return levels
@@ -40,6 +40,11 @@ class AssetsClient:
             self._query = QueryClient(self._client)
         return self._query
 
+    def close(self) -> None:
+        """Stop the background work of the sub-clients."""
+        if self._query is not None:
+            self._query.close()
+
 
 class AsyncAssetsClient:
     """Asynchronous client for SFMC Assets (Content Builder) API."""
@@ -70,3 +75,8 @@ class AsyncAssetsClient:
         if self._query is None:
             self._query = AsyncQueryClient(self._client)
         return self._query
+
+    async def aclose(self) -> None:
+        """Stop the background work of the sub-clients."""
+        if self._query is not None:
+            await self._query.aclose()
@@ -1,12 +1,22 @@
 """Content client for SFMC Assets (Content Builder) API."""
 
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any, Literal
 
+from pydantic import TypeAdapter
+
 from ..models.assets import Asset, AssetTypeCreate, CreateAsset
+from .bulk import BulkResult, aiter_results_concurrently, iter_results_in_threads
 
 if TYPE_CHECKING:
     from ..client import AsyncSFMCClient, SFMCClient
 
+# Validator built once, used to validate raw response bodies
+_ASSET_ADAPTER = TypeAdapter(Asset)
+
+# Asset to create, as a model or a dict of its fields
+AssetSpec = CreateAsset | Mapping[str, Any]
+
 
 class ContentClient:
     """Synchronous client for Content Builder asset content operations."""
@@ -97,13 +107,96 @@ class ContentClient:
 
         # Make the API call with the CreateAsset model
         # (will be serialized with proper aliases)
-        response_data = self._client.post("/asset/v1/content/assets", json=create_asset)
-        return Asset(**response_data)
+        return self._post_asset(create_asset)
+
+    def create_assets(
+        self,
+        specs: Iterable[AssetSpec],
+        *,
+        max_workers: int = 8,
+    ) -> list[BulkResult[AssetSpec, Asset]]:
+        """Create many assets concurrently, reporting failures per asset.
+
+        Specs are read from the iterable as creations finish, so a generator
+        (e.g. over files on disk) is never loaded at once. Up to
+        ``max_workers`` threads share this client, so requests go through its
+        rate limiter and retry policy. An asset that still fails, or whose
+        spec is invalid, is reported in its result while the other creations
+        go on. All creations are done when this returns; use
+        ``iter_create_assets()`` to handle results as they come.
+
+        Args:
+            specs: Assets to create, as ``CreateAsset`` models or dicts of
+                their fields
+            max_workers: Maximum number of creations at the same time
+
+        Returns:
+            One ``BulkResult`` per spec, in completion order, with the created
+            asset or the error
+        """
+        return list(self.iter_create_assets(specs, max_workers=max_workers))
+
+    def iter_create_assets(
+        self,
+        specs: Iterable[AssetSpec],
+        *,
+        max_workers: int = 8,
+    ) -> Iterator[BulkResult[AssetSpec, Asset]]:
+        """Create many assets concurrently, yielding each result as it comes.
+
+        Works like ``create_assets()``, but nothing is sent until the iterator
+        is consumed, and results are not kept.
+
+        Yields:
+            One ``BulkResult`` per spec, in completion order, with the created
+            asset or the error
+        """
+        yield from iter_results_in_threads(self._post_asset, specs, max_workers)
+
+    def _post_asset(self, spec: AssetSpec) -> Asset:
+        """Create an asset from its spec."""
+        create_asset = (
+            spec if isinstance(spec, CreateAsset) else CreateAsset.model_validate(spec)
+        )
+        body = self._client.post_raw("/asset/v1/content/assets", json=create_asset)
+        return self._client.validate_response(_ASSET_ADAPTER, body)
 
     def delete_asset(self, asset_id: int) -> Literal["OK"]:
         response = self._client.delete(f"/asset/v1/content/assets/{asset_id}")
+        self._client.assets.query.evict_cached_asset(asset_id)
         return response  # type: ignore
 
+    def delete_assets(
+        self, asset_ids: Iterable[int], *, max_workers: int = 8
+    ) -> list[BulkResult[int, Literal["OK"]]]:
+        """Delete many assets concurrently, reporting failures per asset.
+
+        Works like ``create_assets()``: IDs are read lazily, up to
+        ``max_workers`` threads share this client, failed deletions do not
+        stop the others, and all deletions are done when this returns.
+
+        Args:
+            asset_ids: IDs of the assets to delete
+            max_workers: Maximum number of deletions at the same time
+
+        Returns:
+            One ``BulkResult`` per ID, in completion order
+        """
+        return list(self.iter_delete_assets(asset_ids, max_workers=max_workers))
+
+    def iter_delete_assets(
+        self, asset_ids: Iterable[int], *, max_workers: int = 8
+    ) -> Iterator[BulkResult[int, Literal["OK"]]]:
+        """Delete many assets concurrently, yielding each result as it comes.
+
+        Works like ``delete_assets()``, but nothing is sent until the iterator
+        is consumed, and results are not kept.
+
+        Yields:
+            One ``BulkResult`` per ID, in completion order
+        """
+        yield from iter_results_in_threads(self.delete_asset, asset_ids, max_workers)
+
 
 class AsyncContentClient:
     """Asynchronous client for Content Builder asset content operations."""
@@ -194,13 +287,110 @@ class AsyncContentClient:
 
         # Make the API call with the CreateAsset model
         # (will be serialized with proper aliases)
-        response_data = await self._client.post(
+        return await self._post_asset(create_asset)
+
+    async def create_assets(
+        self,
+        specs: Iterable[AssetSpec],
+        *,
+        concurrency: int = 8,
+    ) -> list[BulkResult[AssetSpec, Asset]]:
+        """Create many assets concurrently, reporting failures per asset.
+
+        Specs are read from the iterable as creations finish, so a generator
+        (e.g. over files on disk) is never loaded at once. Up to
+        ``concurrency`` creations run at the same time, and requests go
+        through the client's rate limiter and retry policy. An asset that
+        still fails, or whose spec is invalid, is reported in its result while
+        the other creations go on. All creations are done when this returns;
+        use ``iter_create_assets()`` to handle results as they come.
+
+        Args:
+            specs: Assets to create, as ``CreateAsset`` models or dicts of
+                their fields
+            concurrency: Maximum number of creations at the same time
+
+        Returns:
+            One ``BulkResult`` per spec, in completion order, with the created
+            asset or the error
+        """
+        return [
+            result
+            async for result in self.iter_create_assets(specs, concurrency=concurrency)
+        ]
+
+    async def iter_create_assets(
+        self,
+        specs: Iterable[AssetSpec],
+        *,
+        concurrency: int = 8,
+    ) -> AsyncIterator[BulkResult[AssetSpec, Asset]]:
+        """Create many assets concurrently, yielding each result as it comes.
+
+        Works like ``create_assets()``, but nothing is sent until the iterator
+        is consumed, and results are not kept.
+
+        Yields:
+            One ``BulkResult`` per spec, in completion order, with the created
+            asset or the error
+        """
+        async for result in aiter_results_concurrently(
+            self._post_asset, specs, concurrency
+        ):
+            yield result
+
+    async def _post_asset(self, spec: AssetSpec) -> Asset:
+        """Create an asset from its spec."""
+        create_asset = (
+            spec if isinstance(spec, CreateAsset) else CreateAsset.model_validate(spec)
+        )
+        body = await self._client.post_raw(
             "/asset/v1/content/assets", json=create_asset
         )
-        return Asset(**response_data)
+        return self._client.validate_response(_ASSET_ADAPTER, body)
 
     async def delete_asset(self, asset_id: int) -> Literal["OK"]:
         response_data = await self._client.delete(
             f"/asset/v1/content/assets/{asset_id}"
         )
+        self._client.assets.query.evict_cached_asset(asset_id)
         return response_data  # type: ignore
+
+    async def delete_assets(
+        self, asset_ids: Iterable[int], *, concurrency: int = 8
+    ) -> list[BulkResult[int, Literal["OK"]]]:
+        """Delete many assets concurrently, reporting failures per asset.
+
+        Works like ``create_assets()``: IDs are read lazily, up to
+        ``concurrency`` deletions run at the same time, failed deletions do
+        not stop the others, and all deletions are done when this returns.
+
+        Args:
+            asset_ids: IDs of the assets to delete
+            concurrency: Maximum number of deletions at the same time
+
+        Returns:
+            One ``BulkResult`` per ID, in completion order
+        """
+        return [
+            result
+            async for result in self.iter_delete_assets(
+                asset_ids, concurrency=concurrency
+            )
+        ]
+
+    async def iter_delete_assets(
+        self, asset_ids: Iterable[int], *, concurrency: int = 8
+    ) -> AsyncIterator[BulkResult[int, Literal["OK"]]]:
+        """Delete many assets concurrently, yielding each result as it comes.
+
+        Works like ``delete_assets()``, but nothing is sent until the iterator
+        is consumed, and results are not kept.
+
+        Yields:
+            One ``BulkResult`` per ID, in completion order
+        """
+        async for result in aiter_results_concurrently(
+            self.delete_asset, asset_ids, concurrency
+        ):
+            yield result
@@ -0,0 +1,294 @@
+"""Pagination helpers for SFMC Assets (Content Builder) list endpoints."""
+
+import asyncio
+import queue
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, NamedTuple, Protocol, TypeVar
+
+# Largest page size the asset and category endpoints accept
+MAX_PAGE_SIZE = 50
+
+
+class Page(Protocol):
+    """A page of a paginated list response."""
+
+    count: int
+    page: int
+    page_size: int
+    items: list[Any]
+
+
+PageT = TypeVar("PageT", bound=Page)
+T = TypeVar("T")
+
+
+def and_filters(*expressions: str | None) -> str | None:
+    """Combine filter expressions with ``and``, ignoring empty ones."""
+    present = [expression for expression in expressions if expression]
+    if len(present) <= 1:
+        return present[0] if present else None
+    return " and ".join(f"({expression})" for expression in present)
+
+
+def is_last_page(response: Page) -> bool:
+    """Check if a page is the last one of the result set."""
+    return not response.items or response.page * response.page_size >= response.count
+
+
+def page_count(response: Page) -> int:
+    """Get the total number of pages from any page of the result set."""
+    if not response.page_size:
+        return response.page
+    return -(-response.count // response.page_size)
+
+
+def iter_pages(fetch_page: Callable[[int], PageT]) -> Iterator[PageT]:
+    """Fetch pages one at a time, as they are consumed.
+
+    Stops after the last page according to ``count``, or on an empty page.
+
+    Args:
+        fetch_page: Function fetching a page by its (1-based) number
+    """
+    page = 1
+    while True:
+        response = fetch_page(page)
+        if not response.items:
+            return
+        yield response
+        if is_last_page(response):
+            return
+        page += 1
+
+
+def iter_pages_in_threads(
+    fetch_page: Callable[[int], PageT],
+    max_workers: int,
+    ordered: bool = True,
+) -> Iterator[PageT]:
+    """Fetch the first page, then all remaining pages from a thread pool.
+
+    Thread-based version of ``aiter_pages_concurrently()``, for synchronous
+    clients. At most ``max_workers`` pages are in flight or finished but not
+    yet consumed.
+
+    Args:
+        fetch_page: Thread-safe function fetching a page by its number
+        max_workers: Maximum number of pages fetched at the same time
+        ordered: Yield pages in page order, or as soon as they finish
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    first = fetch_page(1)
+    if not first.items:
+        return
+
+    remaining = iter(range(2, page_count(first) + 1))
+    in_flight: deque[Future[PageT]] = deque()
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix="pysfmc-pages")
+
+    def schedule() -> None:
+        while len(in_flight) < max_workers:
+            page = next(remaining, None)
+            if page is None:
+                return
+            in_flight.append(executor.submit(fetch_page, page))
+
+    try:
+        # The next pages are on their way while the first one is consumed
+        schedule()
+        yield first
+        while in_flight:
+            if ordered:
+                in_flight[0].result()
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                done = [future for future in in_flight if future in finished]
+                for future in done:
+                    in_flight.remove(future)
+            schedule()
+            for future in done:
+                response = future.result()
+                if response.items:
+                    yield response
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class IdRange(NamedTuple):
+    """Range of item IDs, from after ``after_id`` up to ``max_id`` included."""
+
+    after_id: int
+    max_id: int | None = None
+
+
+def split_id_range(min_id: int, max_id: int, partitions: int) -> list[IdRange]:
+    """Split the IDs from ``min_id`` to ``max_id`` into equal ranges.
+
+    The last range is left open, so that items created during a scan are
+    picked up.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    span = max_id - min_id + 1
+    step = -(-span // partitions)
+    bounds = range(min_id - 1, max_id, step)
+    return [
+        IdRange(after_id, after_id + step if after_id + step < max_id else None)
+        for after_id in bounds
+    ]
+
+
+def iter_keyset_pages(
+    fetch_after: Callable[[int], PageT], after: int = 0
+) -> Iterator[PageT]:
+    """Fetch pages by key rather than by offset.
+
+    Each page holds the items following the last key of the previous page,
+    so deep pages cost the same as the first one, and items created or
+    deleted during the scan do not shift the pages.
+
+    Args:
+        fetch_after: Function fetching the first page of items whose ``id`` is
+            greater than the given one, in ``id`` order
+        after: Key to start after
+    """
+    while True:
+        response = fetch_after(after)
+        if not response.items:
+            return
+        yield response
+        # count is the number of items left from this key on
+        if response.count <= len(response.items):
+            return
+        after = response.items[-1].id
+
+
+def merge_in_threads(
+    producers: Sequence[Callable[[], Iterator[T]]], buffer_size: int
+) -> Iterator[T]:
+    """Run iterators on threads and yield their items as they arrive.
+
+    At most ``buffer_size`` items wait to be consumed. The producers stop when
+    one of them fails, or when the consumer stops iterating.
+
+    Args:
+        producers: Functions returning the iterators to run, one thread each
+        buffer_size: Maximum number of items waiting to be consumed
+    """
+    items: queue.Queue[tuple[str, Any]] = queue.Queue(buffer_size)
+    stop = threading.Event()
+
+    def put(kind: str, value: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(producer: Callable[[], Iterator[T]]) -> None:
+        try:
+            for item in producer():
+                if not put("item", item):
+                    return
+        except Exception as e:
+            put("error", e)
+        finally:
+            put("done", None)
+
+    executor = ThreadPoolExecutor(len(producers), thread_name_prefix="pysfmc-scan")
+    try:
+        for producer in producers:
+            executor.submit(run, producer)
+        running = len(producers)
+        while running:
+            kind, value = items.get()
+            if kind == "item":
+                yield value
+            elif kind == "error":
+                raise value
+            else:
+                running -= 1
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[PageT]],
+) -> AsyncIterator[PageT]:
+    """Async version of ``iter_pages()``."""
+    page = 1
+    while True:
+        response = await fetch_page(page)
+        if not response.items:
+            return
+        yield response
+        if is_last_page(response):
+            return
+        page += 1
+
+
+async def aiter_pages_concurrently(
+    fetch_page: Callable[[int], Awaitable[PageT]],
+    concurrency: int,
+    ordered: bool = True,
+) -> AsyncIterator[PageT]:
+    """Fetch the first page, then all remaining pages concurrently.
+
+    The number of pages is computed from the ``count`` of the first page. At
+    most ``concurrency`` pages are in flight or finished but not yet consumed,
+    so memory stays bounded when the consumer is slower than the API. Empty
+    pages (the result set shrank meanwhile) are skipped.
+
+    Args:
+        fetch_page: Coroutine function fetching a page by its (1-based) number
+        concurrency: Maximum number of pages fetched at the same time
+        ordered: Yield pages in page order, or as soon as they finish
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    first = await fetch_page(1)
+    if not first.items:
+        return
+
+    remaining = iter(range(2, page_count(first) + 1))
+    in_flight: deque[asyncio.Task[PageT]] = deque()
+
+    def schedule() -> None:
+        while len(in_flight) < concurrency:
+            page = next(remaining, None)
+            if page is None:
+                return
+            in_flight.append(asyncio.ensure_future(fetch_page(page)))
+
+    try:
+        # The next pages are on their way while the first one is consumed
+        schedule()
+        yield first
+        while in_flight:
+            if ordered:
+                await in_flight[0]
+                done = [in_flight.popleft()]
+            else:
+                finished, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                done = [task for task in in_flight if task in finished]
+                for task in done:
+                    in_flight.remove(task)
+            schedule()
+            for task in done:
+                response = task.result()
+                if response.items:
+                    yield response
+    finally:
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
@@ -1,30 +1,153 @@
 """Query client for SFMC Assets (Content Builder) API."""
 
-from typing import TYPE_CHECKING
+import asyncio
+import logging
+import threading
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from ..models.assets import Asset, AssetFilter, AssetResponse
+from pydantic import BaseModel, TypeAdapter
+
+from ..cache import VersionedCache
+from ..config import CacheConfig
+from ..exceptions import SFMCError, SFMCNotFoundError
+from ..models.assets import Asset, AssetFilter, AssetResponse, asset_projection
+from ..streaming import JSONItemSplitter
+from .bulk import amap_concurrently, map_in_threads
+from .pagination import (
+    MAX_PAGE_SIZE,
+    IdRange,
+    aiter_pages,
+    aiter_pages_concurrently,
+    and_filters,
+    iter_keyset_pages,
+    iter_pages,
+    iter_pages_in_threads,
+    merge_in_threads,
+    split_id_range,
+)
 
 if TYPE_CHECKING:
     from ..client import AsyncSFMCClient, SFMCClient
 
+# Validators built once, used to validate raw response bodies
+_ASSET_ADAPTER = TypeAdapter(Asset)
+_ASSET_RESPONSE_ADAPTER = TypeAdapter(AssetResponse)
+
+K = TypeVar("K")
+
+logger = logging.getLogger(__name__)
+
+# Projection telling whether a cached asset is still current
+_VERSION_PROJECTION = asset_projection(["id", "version", "modified_date"])
+
+# Threads refreshing stale cached assets in the background
+_REFRESH_WORKERS = 4
+
+# Statuses of a request the API refuses to process as sent
+_REJECTED_REQUEST_STATUSES = (400, 422)
+
+
+def _customer_key_filter(customer_key: str) -> str:
+    """Build the filter matching a customer key, quotes escaped by doubling."""
+    escaped = customer_key.replace("'", "''")
+    return f"customerKey eq '{escaped}'"
+
+
+def _asset_cache(config: CacheConfig) -> VersionedCache[int, Asset] | None:
+    """Create the asset cache of a client, if enabled."""
+    if not config.assets:
+        return None
+    return VersionedCache(
+        config.assets_max_entries, config.assets_revalidation, config.assets_ttl
+    )
+
+
+def _version_check_params(asset_id: int) -> dict[str, Any]:
+    """Build the query params fetching the version fields of an asset."""
+    filter_model = AssetFilter(
+        page_size=1, filter=f"id eq {asset_id}", fields=_VERSION_PROJECTION.query
+    )
+    return filter_model.model_dump(by_alias=True, exclude_none=True)
+
+
+def _asset_version(asset: Any) -> tuple[int | None, str | None]:
+    return asset.version, asset.modified_date
+
+
+def _chunks(keys: list[K], size: int) -> Iterator[list[K]]:
+    for start in range(0, len(keys), size):
+        yield keys[start : start + size]
+
 
 class QueryClient:
     """Synchronous client for Content Builder asset query operations."""
 
     def __init__(self, client: "SFMCClient"):
         self._client = client
+        # Set once the API rejects an ``or`` filter packing several keys
+        self._packed_filters_rejected = False
+        self._asset_cache = _asset_cache(client.config.cache)
+        # Created on the first background refresh, shut down by close()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        self._refresh_lock = threading.Lock()
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop background refreshes, waiting for the running ones.
+
+        Stale assets are then served without refreshing them.
+        """
+        with self._refresh_lock:
+            self._closed = True
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def get_asset_by_id(self, asset_id: int) -> Asset:
         """Get a specific asset by ID.
 
+        With ``config.cache.assets`` enabled, assets are cached with their
+        version and modified date. A cached asset is used until its TTL is
+        over, then its version is checked with a small query, and it is only
+        fetched again if it changed (see ``CacheConfig.assets_revalidation``).
+
         Args:
             asset_id: The asset ID to retrieve
 
         Returns:
             Asset model instance
         """
-        response_data = self._client.get(f"/asset/v1/content/assets/{asset_id}")
-        return Asset(**response_data)
+        if self._asset_cache is None:
+            return self._fetch_asset(asset_id)
+        asset, state = self._asset_cache.lookup(asset_id)
+        if state == "fresh":
+            return asset  # type: ignore[return-value]
+        if state == "stale":
+            if self._asset_cache.claim_refresh(asset_id):
+                self._start_refresh(asset_id)
+            return asset  # type: ignore[return-value]
+        if state == "expired":
+            if asset := self._revalidate_asset(asset_id):
+                return asset
+            # Changed since cached: skip the disk response cache too
+            return self._fetch_asset(asset_id, use_cache=False)
+        return self._fetch_asset(asset_id)
+
+    def evict_cached_asset(self, asset_id: int) -> None:
+        """Drop an asset from the cache, e.g. after changing it elsewhere."""
+        if self._asset_cache is not None:
+            self._asset_cache.pop(asset_id)
 
     def get_assets(
         self,
@@ -57,8 +180,503 @@ class QueryClient:
         )
         params = filter_model.model_dump(by_alias=True, exclude_none=True)
 
-        response_data = self._client.get("/asset/v1/content/assets", params=params)
-        return AssetResponse(**response_data)
+        body = self._client.get_raw("/asset/v1/content/assets", params=params)
+        return self._client.validate_response(_ASSET_RESPONSE_ADAPTER, body)
+
+    def get_assets_by_ids(
+        self,
+        ids: Iterable[int],
+        *,
+        chunk_size: int = MAX_PAGE_SIZE,
+        max_workers: int = 8,
+    ) -> dict[int, Asset | None]:
+        """Get many assets by ID, in as few requests as possible.
+
+        IDs are packed ``chunk_size`` at a time into ``id eq 1 or id eq 2 ...``
+        filters, fetched by up to ``max_workers`` threads. If the API rejects
+        a packed filter, the IDs of that chunk, and of later calls on this
+        client, are fetched one at a time instead, with the same concurrency.
+
+        Args:
+            ids: Asset IDs, duplicates are fetched once
+            chunk_size: Number of IDs per request (1-50)
+            max_workers: Maximum number of requests at the same time
+
+        Returns:
+            Assets by requested ID, in input order, None for IDs not found
+        """
+        return self._get_assets_by(
+            ids,
+            lambda asset: asset.id,
+            lambda asset_id: f"id eq {int(asset_id)}",
+            self._get_asset_or_none,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def get_assets_by_customer_keys(
+        self,
+        customer_keys: Iterable[str],
+        *,
+        chunk_size: int = MAX_PAGE_SIZE,
+        max_workers: int = 8,
+    ) -> dict[str, Asset | None]:
+        """Get many assets by customer key, in as few requests as possible.
+
+        Works like ``get_assets_by_ids()``, with ``customerKey eq '...'``
+        filters.
+
+        Args:
+            customer_keys: Asset customer keys, duplicates are fetched once
+            chunk_size: Number of keys per request (1-50)
+            max_workers: Maximum number of requests at the same time
+
+        Returns:
+            Assets by requested key, in input order, None for keys not found
+        """
+        return self._get_assets_by(
+            customer_keys,
+            lambda asset: asset.customer_key,
+            _customer_key_filter,
+            self._get_asset_by_customer_key,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def get_assets_projection(
+        self,
+        fields: Sequence[str],
+        page: int | None = None,
+        page_size: int | None = None,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+    ) -> BaseModel:
+        """Get a page of assets with only some of their fields.
+
+        ``$fields`` is built from the ``Asset`` attribute names, and the items
+        are validated into a slim model generated for these fields (see
+        ``asset_projection()``), which skips everything else in the response.
+
+        Args:
+            fields: ``Asset`` attribute names (e.g. 'id', 'name', 'modified_date')
+            page: Page number (1-based)
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+
+        Returns:
+            Page of the projection's response model
+        """
+        projection = asset_projection(fields)
+        filter_model = AssetFilter(
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter_expr,
+            fields=projection.query,
+        )
+        params = filter_model.model_dump(by_alias=True, exclude_none=True)
+
+        body = self._client.get_raw("/asset/v1/content/assets", params=params)
+        return self._client.validate_response(projection.response_adapter, body)
+
+    def iter_assets_projection(
+        self,
+        fields: Sequence[str],
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+    ) -> Iterator[BaseModel]:
+        """Iterate over all assets matching a filter, with only some fields.
+
+        Pages are fetched as the iteration reaches them, like ``iter_assets()``.
+
+        Args:
+            fields: ``Asset`` attribute names (e.g. 'id', 'name', 'modified_date')
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+
+        Yields:
+            Instances of the projection's slim asset model
+        """
+        for response in iter_pages(
+            lambda page: self.get_assets_projection(
+                fields,
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+            )
+        ):
+            yield from response.items
+
+    def iter_assets(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> Iterator[Asset]:
+        """Iterate over all assets matching a filter, across pages.
+
+        By default, pages are fetched as the iteration reaches them, and only
+        the current page is held in memory. With ``prefetch``, the next pages
+        are fetched on a thread pool while the current one is consumed, so
+        that network and processing overlap. At most ``prefetch`` pages are
+        buffered.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+            prefetch: Number of pages to fetch ahead of the current one
+
+        Yields:
+            Asset model instances
+        """
+
+        def fetch_page(page: int) -> AssetResponse:
+            return self.get_assets(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                fields=fields,
+            )
+
+        pages = (
+            iter_pages_in_threads(fetch_page, prefetch)
+            if prefetch
+            else iter_pages(fetch_page)
+        )
+        for response in pages:
+            yield from response.items
+
+    def stream_assets(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+    ) -> Iterator[Asset]:
+        """Iterate over all assets matching a filter, parsed as they arrive.
+
+        Each page is read from the network in chunks, and its assets are
+        validated and yielded one at a time as soon as their JSON is complete,
+        so that memory is bounded by a single asset rather than a whole page of
+        raw body, decoded dicts and models. Use it for heavy assets (emails and
+        templates with their HTML) or large page sizes.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+
+        Yields:
+            Asset model instances
+        """
+        page = 1
+        while True:
+            params = AssetFilter(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter=filter_expr,
+                fields=fields,
+            ).model_dump(by_alias=True, exclude_none=True)
+            splitter = JSONItemSplitter()
+            received = 0
+            for chunk in self._client.stream_raw(
+                "/asset/v1/content/assets", params=params
+            ):
+                for item in splitter.feed(chunk):
+                    received += 1
+                    yield self._client.validate_response(_ASSET_ADAPTER, item)
+            # The rest of the page, without its items, tells if it was the last
+            response = _ASSET_RESPONSE_ADAPTER.validate_python(splitter.close())
+            if not received or response.page * response.page_size >= response.count:
+                return
+            page += 1
+
+    def iter_asset_pages(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+        *,
+        max_workers: int = 8,
+        ordered: bool = True,
+    ) -> Iterator[AssetResponse]:
+        """Fetch all pages of assets matching a filter from a thread pool.
+
+        The first page gives the total page count, then the remaining pages
+        are fetched by up to ``max_workers`` threads sharing this client (its
+        connection pool, token and rate limiter). Use a stable sort order
+        (e.g. 'id asc') so that pages do not overlap.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+            max_workers: Maximum number of pages fetched at the same time
+            ordered: Yield pages in page order, or as soon as they finish
+
+        Yields:
+            AssetResponse pages
+        """
+        yield from iter_pages_in_threads(
+            lambda page: self.get_assets(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                fields=fields,
+            ),
+            max_workers,
+            ordered,
+        )
+
+    def scan_assets(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+        *,
+        after_id: int = 0,
+        max_id: int | None = None,
+    ) -> Iterator[Asset]:
+        """Iterate over all assets matching a filter, in ``id`` order.
+
+        Pages are requested with an ``id gt <last id>`` filter instead of a page
+        number. Deep pages are as fast as the first one, and assets created or
+        deleted during a long scan neither shift pages nor cause skipped or
+        duplicated items.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return ('id' is added)
+            after_id: Only scan assets with a greater ID
+            max_id: Only scan assets up to this ID (included)
+
+        Yields:
+            Asset model instances
+        """
+        for response in self._scan_pages(
+            page_size, filter_expr, fields, IdRange(after_id, max_id)
+        ):
+            yield from response.items
+
+    def get_id_ranges(
+        self, partitions: int, filter_expr: str | None = None
+    ) -> list[IdRange]:
+        """Split the IDs of the assets matching a filter into ranges.
+
+        The ranges can be scanned independently, e.g. by separate workers
+        passing them to ``scan_assets()``. The last range is open-ended.
+
+        Args:
+            partitions: Number of ranges
+            filter_expr: Filter expression using SFMC operators
+
+        Returns:
+            Up to ``partitions`` ranges, none if no asset matches
+        """
+        lowest = self.get_assets(
+            page_size=1, order_by="id asc", filter_expr=filter_expr, fields="id"
+        )
+        if not lowest.items:
+            return []
+        highest = self.get_assets(
+            page_size=1, order_by="id desc", filter_expr=filter_expr, fields="id"
+        )
+        return split_id_range(lowest.items[0].id, highest.items[0].id, partitions)
+
+    def scan_assets_parallel(
+        self,
+        partitions: int = 4,
+        page_size: int = MAX_PAGE_SIZE,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+    ) -> Iterator[Asset]:
+        """Scan all assets matching a filter, one ID range per thread.
+
+        Each range is scanned like ``scan_assets()``, so the scan stays stable
+        while its throughput grows with ``partitions``. Assets are yielded as
+        pages arrive, in ``id`` order within a range only.
+
+        Args:
+            partitions: Number of ID ranges scanned at the same time
+            page_size: Number of items per page (1-50)
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return ('id' is added)
+
+        Yields:
+            Asset model instances
+        """
+        id_ranges = self.get_id_ranges(partitions, filter_expr)
+        if not id_ranges:
+            return
+        for response in merge_in_threads(
+            [
+                partial(self._scan_pages, page_size, filter_expr, fields, id_range)
+                for id_range in id_ranges
+            ],
+            buffer_size=2 * len(id_ranges),
+        ):
+            yield from response.items
+
+    def _scan_pages(
+        self,
+        page_size: int,
+        filter_expr: str | None,
+        fields: str | None,
+        id_range: IdRange,
+    ) -> Iterator[AssetResponse]:
+        """Fetch the pages of assets of an ID range, by ``id`` key."""
+        if fields and "id" not in (name.strip() for name in fields.split(",")):
+            fields = f"id,{fields}"
+        upper = f"id lte {id_range.max_id}" if id_range.max_id is not None else None
+        return iter_keyset_pages(
+            lambda after: self.get_assets(
+                page_size=page_size,
+                order_by="id asc",
+                filter_expr=and_filters(filter_expr, f"id gt {after}", upper),
+                fields=fields,
+            ),
+            id_range.after_id,
+        )
+
+    def _get_assets_by(
+        self,
+        keys: Iterable[K],
+        key_of: Callable[[Asset], K],
+        key_filter: Callable[[K], str],
+        get_one: Callable[[K], Asset | None],
+        *,
+        chunk_size: int,
+        max_workers: int,
+    ) -> dict[K, Asset | None]:
+        """Fetch assets by key with packed filters, or one by one."""
+        if not 1 <= chunk_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_PAGE_SIZE}")
+        unique = list(dict.fromkeys(keys))
+        found: dict[K, Asset | None] = {}
+        one_by_one: list[K] = []
+
+        def get_chunk(chunk: list[K]) -> list[Asset] | None:
+            if self._packed_filters_rejected:
+                return None
+            return self.get_assets(
+                page_size=len(chunk), filter_expr=" or ".join(map(key_filter, chunk))
+            ).items
+
+        for chunk, future in map_in_threads(
+            get_chunk, _chunks(unique, chunk_size), max_workers
+        ):
+            try:
+                items = future.result()
+            except SFMCError as e:
+                if e.status_code not in _REJECTED_REQUEST_STATUSES:
+                    raise
+                self._packed_filters_rejected = True
+                items = None
+            if items is None:
+                one_by_one.extend(chunk)
+            else:
+                found.update((key_of(asset), asset) for asset in items)
+
+        for key, future in map_in_threads(get_one, one_by_one, max_workers):
+            found[key] = future.result()
+        return {key: found.get(key) for key in unique}
+
+    def _get_asset_or_none(self, asset_id: int) -> Asset | None:
+        try:
+            return self.get_asset_by_id(asset_id)
+        except SFMCNotFoundError:
+            return None
+
+    def _get_asset_by_customer_key(self, customer_key: str) -> Asset | None:
+        response = self.get_assets(
+            page_size=1, filter_expr=_customer_key_filter(customer_key)
+        )
+        return response.items[0] if response.items else None
+
+    def _fetch_asset(self, asset_id: int, *, use_cache: bool = True) -> Asset:
+        """Get an asset from the API, caching it if enabled."""
+        try:
+            body = self._client.get_raw(
+                f"/asset/v1/content/assets/{asset_id}", use_cache=use_cache
+            )
+        except SFMCNotFoundError:
+            self.evict_cached_asset(asset_id)
+            raise
+        asset = self._client.validate_response(_ASSET_ADAPTER, body)
+        if self._asset_cache is not None:
+            self._asset_cache.store(asset_id, asset, _asset_version(asset))
+        return asset
+
+    def _revalidate_asset(self, asset_id: int) -> Asset | None:
+        """Get the cached asset if its version is still the current one."""
+        body = self._client.get_raw(
+            "/asset/v1/content/assets",
+            params=_version_check_params(asset_id),
+            use_cache=False,
+        )
+        page = self._client.validate_response(
+            _VERSION_PROJECTION.response_adapter, body
+        )
+        items = page.items  # type: ignore[attr-defined]
+        if not items or self._asset_cache is None:
+            return None
+        return self._asset_cache.confirm(asset_id, _asset_version(items[0]))
+
+    def _start_refresh(self, asset_id: int) -> None:
+        """Queue the background refresh of a stale asset on the refresh pool."""
+        with self._refresh_lock:
+            if self._closed:
+                self._asset_cache.release_refresh(asset_id)  # type: ignore[union-attr]
+                return
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    _REFRESH_WORKERS, thread_name_prefix="pysfmc-asset-refresh"
+                )
+            future = self._refresh_executor.submit(self._refresh_asset, asset_id)
+        future.add_done_callback(partial(self._release_cancelled, asset_id))
+
+    def _release_cancelled(self, asset_id: int, future: Future[None]) -> None:
+        """Release the refresh claim of a refresh dropped by close()."""
+        if future.cancelled() and self._asset_cache is not None:
+            self._asset_cache.release_refresh(asset_id)
+
+    def _refresh_asset(self, asset_id: int) -> None:
+        """Revalidate a stale cached asset, fetching it again if it changed."""
+        try:
+            if self._revalidate_asset(asset_id) is None:
+                self._fetch_asset(asset_id, use_cache=False)
+        except SFMCNotFoundError:
+            pass
+        except Exception:
+            logger.warning(
+                "Background refresh of asset %s failed", asset_id, exc_info=True
+            )
+        finally:
+            if self._asset_cache is not None:
+                self._asset_cache.release_refresh(asset_id)
 
 
 class AsyncQueryClient:
@@ -66,18 +684,61 @@ class AsyncQueryClient:
 
     def __init__(self, client: "AsyncSFMCClient"):
         self._client = client
+        # Set once the API rejects an ``or`` filter packing several keys
+        self._packed_filters_rejected = False
+        self._asset_cache = _asset_cache(client.config.cache)
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes and wait for them to stop.
+
+        Stale assets are then served without refreshing them.
+        """
+        self._closed = True
+        tasks = list(self._refresh_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def get_asset_by_id(self, asset_id: int) -> Asset:
         """Get a specific asset by ID.
 
+        With ``config.cache.assets`` enabled, assets are cached with their
+        version and modified date. A cached asset is used until its TTL is
+        over, then its version is checked with a small query, and it is only
+        fetched again if it changed (see ``CacheConfig.assets_revalidation``).
+
         Args:
             asset_id: The asset ID to retrieve
 
         Returns:
             Asset model instance
         """
-        response_data = await self._client.get(f"/asset/v1/content/assets/{asset_id}")
-        return Asset(**response_data)
+        if self._asset_cache is None:
+            return await self._fetch_asset(asset_id)
+        asset, state = self._asset_cache.lookup(asset_id)
+        if state == "fresh":
+            return asset  # type: ignore[return-value]
+        if state == "stale":
+            if not self._closed and self._asset_cache.claim_refresh(asset_id):
+                task = asyncio.ensure_future(self._refresh_asset(asset_id))
+                # Keep a reference, tasks are only weakly held by the loop
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+                task.add_done_callback(partial(self._release_cancelled, asset_id))
+            return asset  # type: ignore[return-value]
+        if state == "expired":
+            if asset := await self._revalidate_asset(asset_id):
+                return asset
+            # Changed since cached: skip the disk response cache too
+            return await self._fetch_asset(asset_id, use_cache=False)
+        return await self._fetch_asset(asset_id)
+
+    def evict_cached_asset(self, asset_id: int) -> None:
+        """Drop an asset from the cache, e.g. after changing it elsewhere."""
+        if self._asset_cache is not None:
+            self._asset_cache.pop(asset_id)
 
     async def get_assets(
         self,
@@ -110,7 +771,383 @@ class AsyncQueryClient:
         )
         params = filter_model.model_dump(by_alias=True, exclude_none=True)
 
-        response_data = await self._client.get(
-            "/asset/v1/content/assets", params=params
+        body = await self._client.get_raw("/asset/v1/content/assets", params=params)
+        return self._client.validate_response(_ASSET_RESPONSE_ADAPTER, body)
+
+    async def get_assets_by_ids(
+        self,
+        ids: Iterable[int],
+        *,
+        chunk_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 8,
+    ) -> dict[int, Asset | None]:
+        """Get many assets by ID, in as few requests as possible.
+
+        IDs are packed ``chunk_size`` at a time into ``id eq 1 or id eq 2 ...``
+        filters, fetched ``concurrency`` at a time. If the API rejects a
+        packed filter, the IDs of that chunk, and of later calls on this
+        client, are fetched one at a time instead, with the same concurrency.
+
+        Args:
+            ids: Asset IDs, duplicates are fetched once
+            chunk_size: Number of IDs per request (1-50)
+            concurrency: Maximum number of requests at the same time
+
+        Returns:
+            Assets by requested ID, in input order, None for IDs not found
+        """
+        return await self._get_assets_by(
+            ids,
+            lambda asset: asset.id,
+            lambda asset_id: f"id eq {int(asset_id)}",
+            self._get_asset_or_none,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
+    async def get_assets_by_customer_keys(
+        self,
+        customer_keys: Iterable[str],
+        *,
+        chunk_size: int = MAX_PAGE_SIZE,
+        concurrency: int = 8,
+    ) -> dict[str, Asset | None]:
+        """Get many assets by customer key, in as few requests as possible.
+
+        Works like ``get_assets_by_ids()``, with ``customerKey eq '...'``
+        filters.
+
+        Args:
+            customer_keys: Asset customer keys, duplicates are fetched once
+            chunk_size: Number of keys per request (1-50)
+            concurrency: Maximum number of requests at the same time
+
+        Returns:
+            Assets by requested key, in input order, None for keys not found
+        """
+        return await self._get_assets_by(
+            customer_keys,
+            lambda asset: asset.customer_key,
+            _customer_key_filter,
+            self._get_asset_by_customer_key,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
+    async def get_assets_projection(
+        self,
+        fields: Sequence[str],
+        page: int | None = None,
+        page_size: int | None = None,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+    ) -> BaseModel:
+        """Get a page of assets with only some of their fields.
+
+        ``$fields`` is built from the ``Asset`` attribute names, and the items
+        are validated into a slim model generated for these fields (see
+        ``asset_projection()``), which skips everything else in the response.
+
+        Args:
+            fields: ``Asset`` attribute names (e.g. 'id', 'name', 'modified_date')
+            page: Page number (1-based)
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+
+        Returns:
+            Page of the projection's response model
+        """
+        projection = asset_projection(fields)
+        filter_model = AssetFilter(
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter_expr,
+            fields=projection.query,
+        )
+        params = filter_model.model_dump(by_alias=True, exclude_none=True)
+
+        body = await self._client.get_raw("/asset/v1/content/assets", params=params)
+        return self._client.validate_response(projection.response_adapter, body)
+
+    async def iter_assets_projection(
+        self,
+        fields: Sequence[str],
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        """Iterate over all assets matching a filter, with only some fields.
+
+        Pages are fetched as the iteration reaches them, like ``iter_assets()``.
+
+        Args:
+            fields: ``Asset`` attribute names (e.g. 'id', 'name', 'modified_date')
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+
+        Yields:
+            Instances of the projection's slim asset model
+        """
+        async for response in aiter_pages(
+            lambda page: self.get_assets_projection(
+                fields,
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+            )
+        ):
+            for asset in response.items:
+                yield asset
+
+    async def iter_assets(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+        *,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Asset]:
+        """Iterate over all assets matching a filter, across pages.
+
+        By default, pages are fetched as the iteration reaches them, and only
+        the current page is held in memory. With ``prefetch``, the next pages
+        are fetched by tasks on the event loop while the current one is
+        consumed, so that network and processing overlap. At most ``prefetch``
+        pages are buffered.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+            prefetch: Number of pages to fetch ahead of the current one
+
+        Yields:
+            Asset model instances
+        """
+
+        def fetch_page(page: int) -> Awaitable[AssetResponse]:
+            return self.get_assets(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                fields=fields,
+            )
+
+        pages = (
+            aiter_pages_concurrently(fetch_page, prefetch)
+            if prefetch
+            else aiter_pages(fetch_page)
         )
-        return AssetResponse(**response_data)
+        async for response in pages:
+            for asset in response.items:
+                yield asset
+
+    async def stream_assets(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+    ) -> AsyncIterator[Asset]:
+        """Iterate over all assets matching a filter, parsed as they arrive.
+
+        Each page is read from the network in chunks, and its assets are
+        validated and yielded one at a time as soon as their JSON is complete,
+        so that memory is bounded by a single asset rather than a whole page of
+        raw body, decoded dicts and models. Use it for heavy assets (emails and
+        templates with their HTML) or large page sizes. When stopping early,
+        ``aclose()`` the iterator (e.g. with ``contextlib.aclosing``) to release
+        the streamed response and its connection right away.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+
+        Yields:
+            Asset model instances
+        """
+        page = 1
+        while True:
+            params = AssetFilter(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter=filter_expr,
+                fields=fields,
+            ).model_dump(by_alias=True, exclude_none=True)
+            splitter = JSONItemSplitter()
+            received = 0
+            # Closed explicitly when the caller stops early, releasing the
+            # streamed response and its connection
+            async with aclosing(
+                self._client.stream_raw("/asset/v1/content/assets", params=params)
+            ) as chunks:
+                async for chunk in chunks:
+                    for item in splitter.feed(chunk):
+                        received += 1
+                        yield self._client.validate_response(_ASSET_ADAPTER, item)
+            # The rest of the page, without its items, tells if it was the last
+            response = _ASSET_RESPONSE_ADAPTER.validate_python(splitter.close())
+            if not received or response.page * response.page_size >= response.count:
+                return
+            page += 1
+
+    async def iter_asset_pages(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        order_by: str | None = None,
+        filter_expr: str | None = None,
+        fields: str | None = None,
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+    ) -> AsyncIterator[AssetResponse]:
+        """Fetch all pages of assets matching a filter concurrently.
+
+        The first page gives the total page count, then the remaining pages
+        are fetched ``concurrency`` at a time. Requests still go through the
+        client's rate limiter. Use a stable sort order (e.g. 'id asc') so that
+        pages do not overlap.
+
+        Args:
+            page_size: Number of items per page (1-50)
+            order_by: Sort order (e.g., 'Name desc', 'createdDate asc')
+            filter_expr: Filter expression using SFMC operators
+                (eq, neq, lt, lte, gt, gte, like)
+            fields: Comma-separated list of fields to return
+            concurrency: Maximum number of pages fetched at the same time
+            ordered: Yield pages in page order, or as soon as they finish
+
+        Yields:
+            AssetResponse pages
+        """
+        async for response in aiter_pages_concurrently(
+            lambda page: self.get_assets(
+                page=page,
+                page_size=page_size,
+                order_by=order_by,
+                filter_expr=filter_expr,
+                fields=fields,
+            ),
+            concurrency,
+            ordered,
+        ):
+            yield response
+
+    async def _get_assets_by(
+        self,
+        keys: Iterable[K],
+        key_of: Callable[[Asset], K],
+        key_filter: Callable[[K], str],
+        get_one: Callable[[K], Awaitable[Asset | None]],
+        *,
+        chunk_size: int,
+        concurrency: int,
+    ) -> dict[K, Asset | None]:
+        """Fetch assets by key with packed filters, or one by one."""
+        if not 1 <= chunk_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_PAGE_SIZE}")
+        unique = list(dict.fromkeys(keys))
+        found: dict[K, Asset | None] = {}
+        one_by_one: list[K] = []
+
+        async def get_chunk(chunk: list[K]) -> list[Asset] | None:
+            if self._packed_filters_rejected:
+                return None
+            response = await self.get_assets(
+                page_size=len(chunk), filter_expr=" or ".join(map(key_filter, chunk))
+            )
+            return response.items
+
+        async for chunk, task in amap_concurrently(
+            get_chunk, _chunks(unique, chunk_size), concurrency
+        ):
+            try:
+                items = task.result()
+            except SFMCError as e:
+                if e.status_code not in _REJECTED_REQUEST_STATUSES:
+                    raise
+                self._packed_filters_rejected = True
+                items = None
+            if items is None:
+                one_by_one.extend(chunk)
+            else:
+                found.update((key_of(asset), asset) for asset in items)
+
+        async for key, task in amap_concurrently(get_one, one_by_one, concurrency):
+            found[key] = task.result()
+        return {key: found.get(key) for key in unique}
+
+    async def _get_asset_or_none(self, asset_id: int) -> Asset | None:
+        try:
+            return await self.get_asset_by_id(asset_id)
+        except SFMCNotFoundError:
+            return None
+
+    async def _get_asset_by_customer_key(self, customer_key: str) -> Asset | None:
+        response = await self.get_assets(
+            page_size=1, filter_expr=_customer_key_filter(customer_key)
+        )
+        return response.items[0] if response.items else None
+
+    async def _fetch_asset(self, asset_id: int, *, use_cache: bool = True) -> Asset:
+        """Get an asset from the API, caching it if enabled."""
+        try:
+            body = await self._client.get_raw(
+                f"/asset/v1/content/assets/{asset_id}", use_cache=use_cache
+            )
+        except SFMCNotFoundError:
+            self.evict_cached_asset(asset_id)
+            raise
+        asset = self._client.validate_response(_ASSET_ADAPTER, body)
+        if self._asset_cache is not None:
+            self._asset_cache.store(asset_id, asset, _asset_version(asset))
+        return asset
+
+    async def _revalidate_asset(self, asset_id: int) -> Asset | None:
+        """Get the cached asset if its version is still the current one."""
+        body = await self._client.get_raw(
+            "/asset/v1/content/assets",
+            params=_version_check_params(asset_id),
+            use_cache=False,
+        )
+        page = self._client.validate_response(
+            _VERSION_PROJECTION.response_adapter, body
+        )
+        items = page.items  # type: ignore[attr-defined]
+        if not items or self._asset_cache is None:
+            return None
+        return self._asset_cache.confirm(asset_id, _asset_version(items[0]))
+
+    def _release_cancelled(self, asset_id: int, task: asyncio.Task[None]) -> None:
+        """Release the refresh claim of a refresh cancelled by aclose()."""
+        if task.cancelled() and self._asset_cache is not None:
+            self._asset_cache.release_refresh(asset_id)
+
+    async def _refresh_asset(self, asset_id: int) -> None:
+        """Revalidate a stale cached asset, fetching it again if it changed."""
+        try:
+            if await self._revalidate_asset(asset_id) is None:
+                await self._fetch_asset(asset_id, use_cache=False)
+        except SFMCNotFoundError:
+            pass
+        except Exception:
+            logger.warning(
+                "Background refresh of asset %s failed", asset_id, exc_info=True
+            )
+        finally:
+            if self._asset_cache is not None:
+                self._asset_cache.release_refresh(asset_id)
@@ -0,0 +1,222 @@
+"""In-memory index of the Content Builder category (folder) hierarchy."""
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from typing import cast
+
+from ..exceptions import SFMCNotFoundError
+from ..models.assets import Category
+from .bulk import BulkResult
+
+# Separator of the category names in a path
+PATH_SEPARATOR = "/"
+
+
+class CategoryTree:
+    """Index of a category hierarchy, answering lookups without API calls.
+
+    Built from categories in any order, linked by ``parent_id``. Categories
+    whose parent is not in the tree are its roots. Lookups by ID or path,
+    parents, children and depths take constant time.
+
+    Paths are the names from a root down to a category, joined with ``/``
+    (e.g. 'Content Builder/Campaigns/2026'). When siblings share a name, the
+    path leads to the first one.
+    """
+
+    def __init__(self, categories: Iterable[Category] = ()):
+        self._by_id: dict[int, Category] = {}
+        self._children: dict[int, list[int]] = {}
+        self._depths: dict[int, int] = {}
+        self._paths: dict[int, tuple[str, ...]] = {}
+        self._by_path: dict[tuple[str, ...], int] = {}
+        self._order: list[int] = []
+
+        for category in categories:
+            self._by_id[category.id] = category
+        roots = []
+        for category in self._by_id.values():
+            if category.parent_id in self._by_id:
+                self._children.setdefault(category.parent_id, []).append(category.id)
+            else:
+                roots.append(category.id)
+
+        # Breadth-first, so that parents are indexed before their children
+        pending = deque((root_id, ()) for root_id in roots)
+        while pending:
+            category_id, parent_path = pending.popleft()
+            path = (*parent_path, self._by_id[category_id].name)
+            self._order.append(category_id)
+            self._depths[category_id] = len(parent_path)
+            self._paths[category_id] = path
+            self._by_path.setdefault(path, category_id)
+            pending.extend(
+                (child_id, path) for child_id in self._children.get(category_id, ())
+            )
+        self._roots = roots
+
+    def add(self, category: Category) -> None:
+        """Add a category, under its parent if it is in the tree.
+
+        A category already in the tree is left as it is.
+        """
+        if category.id in self:
+            return
+        self._by_id[category.id] = category
+        if category.parent_id in self:
+            self._children.setdefault(category.parent_id, []).append(category.id)
+            parent_path = self._paths[category.parent_id]
+        else:
+            self._roots.append(category.id)
+            parent_path = ()
+        path = (*parent_path, category.name)
+        self._order.append(category.id)
+        self._depths[category.id] = len(parent_path)
+        self._paths[category.id] = path
+        self._by_path.setdefault(path, category.id)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, category_id: object) -> bool:
+        return category_id in self._depths
+
+    def __iter__(self) -> Iterator[Category]:
+        """Iterate over the categories, parents before their children."""
+        return (self._by_id[category_id] for category_id in self._order)
+
+    def __getitem__(self, category_id: int) -> Category:
+        self._check(category_id)
+        return self._by_id[category_id]
+
+    def get(self, category_id: int) -> Category | None:
+        """Get a category by ID, or None if it is not in the tree."""
+        return self._by_id.get(category_id) if category_id in self else None
+
+    @property
+    def roots(self) -> list[Category]:
+        """Top-level categories of the tree."""
+        return [self._by_id[category_id] for category_id in self._roots]
+
+    def parent(self, category_id: int) -> Category | None:
+        """Get the parent of a category, or None for a root."""
+        parent_id = self[category_id].parent_id
+        return None if parent_id is None else self.get(parent_id)
+
+    def children(self, category_id: int) -> list[Category]:
+        """Get the direct subcategories of a category."""
+        self._check(category_id)
+        return [self._by_id[child] for child in self._children.get(category_id, ())]
+
+    def descendants(self, category_id: int) -> Iterator[Category]:
+        """Iterate over all subcategories of a category, breadth-first."""
+        self._check(category_id)
+        pending = deque(self._children.get(category_id, ()))
+        while pending:
+            child_id = pending.popleft()
+            yield self._by_id[child_id]
+            pending.extend(self._children.get(child_id, ()))
+
+    def depth(self, category_id: int) -> int:
+        """Get the depth of a category, 0 for a root."""
+        self._check(category_id)
+        return self._depths[category_id]
+
+    def path(self, category_id: int) -> str:
+        """Get the path of a category, e.g. 'Content Builder/Campaigns'."""
+        self._check(category_id)
+        return PATH_SEPARATOR.join(self._paths[category_id])
+
+    def find(self, path: str | Sequence[str]) -> Category | None:
+        """Get a category by path, or None if no category has this path.
+
+        Args:
+            path: Names joined with ``/``, or a sequence of names when they
+                contain ``/`` themselves
+        """
+        category_id = self._by_path.get(split_path(path))
+        return None if category_id is None else self._by_id[category_id]
+
+    def _check(self, category_id: int) -> None:
+        if category_id not in self._depths:
+            raise KeyError(category_id)
+
+
+class CategoryPathPlan:
+    """Categories to create so that paths exist, shallowest first.
+
+    The prefixes of the paths already in the tree are resolved from it. The
+    missing ones are handed out one depth at a time by ``levels()``, each
+    level only holding categories whose parent exists, so that the
+    categories of a level can be created concurrently. Record the outcome of
+    each creation with ``record()`` before moving on to the next level:
+    created categories are added to the tree, and a failure is passed on to
+    the categories below.
+    """
+
+    def __init__(self, tree: CategoryTree, paths: Iterable[str | Sequence[str]]):
+        self.tree = tree
+        self.paths = list(paths)
+        self._outcomes: dict[tuple[str, ...], Category | BaseException] = {}
+        self._missing: set[tuple[str, ...]] = set()
+        for path in self.paths:
+            names = split_path(path)
+            if not all(names):
+                self._outcomes[names] = ValueError(f"Invalid category path: {path!r}")
+                continue
+            for depth in range(1, len(names) + 1):
+                prefix = names[:depth]
+                category = tree.find(prefix)
+                if category is None:
+                    self._missing.add(prefix)
+                else:
+                    self._outcomes[prefix] = category
+
+    def levels(self) -> Iterator[list[tuple[str, ...]]]:
+        """Iterate over the paths to create, one depth at a time.
+
+        Yields:
+            Paths of the categories of a level, as tuples of names
+        """
+        for depth in sorted({len(prefix) for prefix in self._missing}):
+            level = []
+            for prefix in sorted(p for p in self._missing if len(p) == depth):
+                parent = self._outcomes.get(prefix[:-1])
+                if depth == 1:
+                    self._outcomes[prefix] = SFMCNotFoundError(
+                        f"Root category '{prefix[0]}' does not exist"
+                    )
+                elif isinstance(parent, BaseException):
+                    self._outcomes[prefix] = parent
+                else:
+                    level.append(prefix)
+            if level:
+                yield level
+
+    def parent(self, prefix: tuple[str, ...]) -> Category:
+        """Get the existing parent of a category of a level."""
+        return cast(Category, self._outcomes[prefix[:-1]])
+
+    def record(self, prefix: tuple[str, ...], outcome: Category | BaseException):
+        """Record the created category of a path, or the error creating it."""
+        self._outcomes[prefix] = outcome
+        if isinstance(outcome, Category):
+            self.tree.add(outcome)
+
+    def results(self) -> list[BulkResult[str | Sequence[str], Category]]:
+        """Get the category of each path, or the error, in input order."""
+        results = []
+        for index, path in enumerate(self.paths):
+            outcome = self._outcomes[split_path(path)]
+            if isinstance(outcome, BaseException):
+                results.append(BulkResult(index, path, error=outcome))
+            else:
+                results.append(BulkResult(index, path, outcome))
+        return results
+
+
+def split_path(path: str | Sequence[str]) -> tuple[str, ...]:
+    """Split a category path into names, ignoring leading and trailing ``/``."""
+    if isinstance(path, str):
+        path = path.strip(PATH_SEPARATOR).split(PATH_SEPARATOR)
+    return tuple(path)
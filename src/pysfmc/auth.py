@@ -1,6 +1,12 @@
 """Authentication module for Salesforce Marketing Cloud API."""
 
+import asyncio
+import contextlib
+import logging
+import threading
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from typing import Any
 from urllib.parse import urljoin
 
 import httpx
@@ -8,6 +14,13 @@ from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .exceptions import map_http_error
+from .token_store import MemoryTokenStore, TokenStore, token_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Seconds before retrying a failed background refresh, and between two refreshes
+_BACKGROUND_RETRY_DELAY = 10.0
+_MIN_BACKGROUND_DELAY = 1.0
 
 
 class SFMCSettings(BaseSettings):
@@ -44,15 +57,71 @@ class TokenResponse(BaseModel):
     rest_instance_url: SecretStr
 
 
+def _token_record(token: TokenResponse, expires_at: datetime) -> dict[str, Any]:
+    """Serialize a token for a token store, with an absolute expiry time."""
+    return {
+        "access_token": token.access_token.get_secret_value(),
+        "token_type": token.token_type,
+        "expires_in": token.expires_in,
+        "scope": token.scope,
+        "soap_instance_url": token.soap_instance_url.get_secret_value(),
+        "rest_instance_url": token.rest_instance_url.get_secret_value(),
+        "expires_at": expires_at.timestamp(),
+    }
+
+
+def _token_from_record(record: dict[str, Any]) -> tuple[TokenResponse, datetime]:
+    """Deserialize a token record read from a token store."""
+    return TokenResponse(**record), datetime.fromtimestamp(record["expires_at"])
+
+
+def _background_refresh_at(
+    token: TokenResponse, expires_at: datetime, buffer: timedelta, lead: timedelta
+) -> datetime:
+    """Time at which the background refresher renews a token.
+
+    This is ``lead`` ahead of the inline refresh, but never in the first half
+    of the token lifetime, so that short-lived tokens are not renewed in a loop.
+    """
+    return max(
+        expires_at - buffer - lead,
+        expires_at - timedelta(seconds=token.expires_in / 2),
+    )
+
+
 class SFMCAuthenticator:
     """Handles SFMC OAuth2 authentication and token management."""
 
-    def __init__(self, settings: SFMCSettings, http_client: httpx.Client | None = None):
+    def __init__(
+        self,
+        settings: SFMCSettings,
+        http_client: httpx.Client | None = None,
+        token_store: TokenStore | None = None,
+        *,
+        background_refresh: bool = False,
+        refresh_lead: float = 300.0,
+    ):
         self.settings = settings
         self._http_client = http_client or httpx.Client()
         self._token: TokenResponse | None = None
         self._token_expires_at: datetime | None = None
         self._refresh_buffer = timedelta(minutes=2)  # Refresh 2 minutes before expiry
+        self._refresh_lock = threading.Lock()
+        self._token_store = token_store or MemoryTokenStore()
+        self._token_key = token_cache_key(
+            settings.client_id.get_secret_value(),
+            settings.account_id.get_secret_value(),
+        )
+        self._refresh_lead = timedelta(seconds=refresh_lead)
+        self._stop_refresh = threading.Event()
+        self._refresh_thread: threading.Thread | None = None
+        if background_refresh:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_background,
+                name="pysfmc-token-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
 
     def _is_token_valid(self) -> bool:
         """Check if current token is valid and not expired."""
@@ -60,6 +129,22 @@ class SFMCAuthenticator:
             return False
         return datetime.now() < (self._token_expires_at - self._refresh_buffer)
 
+    def _seconds_until_background_refresh(self) -> float:
+        """Seconds until the background refresher should renew the token."""
+        if not self._token or not self._token_expires_at:
+            return 0.0
+        refresh_at = _background_refresh_at(
+            self._token,
+            self._token_expires_at,
+            self._refresh_buffer,
+            self._refresh_lead,
+        )
+        return (refresh_at - datetime.now()).total_seconds()
+
+    def _is_token_fresh(self) -> bool:
+        """Check if the token is not yet due for a background refresh."""
+        return self._seconds_until_background_refresh() > 0
+
     def _request_new_token(self) -> TokenResponse:
         """Request a new access token from SFMC."""
         token_url = urljoin(self.settings.auth_base_url.get_secret_value(), "/v2/token")
@@ -81,16 +166,66 @@ class SFMCAuthenticator:
         token_data = response.json()
         return TokenResponse(**token_data)
 
+    def _load_stored_token(self) -> bool:
+        """Adopt the token from the token store, if it is still valid."""
+        record = self._token_store.load(self._token_key)
+        if record is None:
+            return False
+        token, expires_at = _token_from_record(record)
+        if datetime.now() >= expires_at - self._refresh_buffer:
+            return False
+        self._token, self._token_expires_at = token, expires_at
+        return True
+
     def get_token(self) -> str:
-        """Get a valid access token, refreshing if necessary."""
+        """Get a valid access token, refreshing if necessary.
+
+        A token refreshed by another client sharing the token store is picked
+        up before a new one is requested.
+        """
         if not self._is_token_valid():
-            self._token = self._request_new_token()
-            self._token_expires_at = datetime.now() + timedelta(
-                seconds=self._token.expires_in
-            )
+            self._refresh_token(self._is_token_valid)
 
         return self._token.access_token.get_secret_value()
 
+    def _refresh_token(self, is_current: Callable[[], bool]) -> None:
+        """Renew the token unless ``is_current()`` holds under the refresh lock."""
+        # Only one thread refreshes, the others wait for its result
+        with self._refresh_lock:
+            if is_current() or (self._load_stored_token() and is_current()):
+                return
+            token = self._request_new_token()
+            expires_at = datetime.now() + timedelta(seconds=token.expires_in)
+            self._token_store.save(self._token_key, _token_record(token, expires_at))
+            self._token, self._token_expires_at = token, expires_at
+
+    def _refresh_in_background(self) -> None:
+        """Keep the token renewed ahead of expiry until the authenticator closes."""
+        delay = 0.0
+        while not self._stop_refresh.wait(delay):
+            try:
+                self._refresh_token(self._is_token_fresh)
+                delay = max(
+                    self._seconds_until_background_refresh(), _MIN_BACKGROUND_DELAY
+                )
+            except Exception:
+                # Requests still refresh inline if the token runs out meanwhile
+                logger.warning("Background token refresh failed", exc_info=True)
+                delay = _BACKGROUND_RETRY_DELAY
+
+    def invalidate_token(self, access_token: str) -> None:
+        """Discard an access token that SFMC rejected.
+
+        Nothing happens if the token was already replaced, so concurrent
+        requests rejected with the same token cause a single refresh.
+        """
+        with self._refresh_lock:
+            self._token_store.delete(self._token_key, access_token=access_token)
+            if self._token and (
+                self._token.access_token.get_secret_value() == access_token
+            ):
+                self._token_expires_at = datetime.now()
+
     def get_auth_header(self) -> dict[str, str]:
         """Get the authorization header for API requests."""
         token = self.get_token()
@@ -109,7 +244,11 @@ class SFMCAuthenticator:
         return self._token.soap_instance_url.get_secret_value()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop the background refresher and close the HTTP client."""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
         self._http_client.close()
 
 
@@ -117,13 +256,29 @@ class AsyncSFMCAuthenticator:
     """Async version of SFMC authenticator."""
 
     def __init__(
-        self, settings: SFMCSettings, http_client: httpx.AsyncClient | None = None
+        self,
+        settings: SFMCSettings,
+        http_client: httpx.AsyncClient | None = None,
+        token_store: TokenStore | None = None,
+        *,
+        background_refresh: bool = False,
+        refresh_lead: float = 300.0,
     ):
         self.settings = settings
         self._http_client = http_client or httpx.AsyncClient()
         self._token: TokenResponse | None = None
         self._token_expires_at: datetime | None = None
         self._refresh_buffer = timedelta(minutes=2)
+        self._refresh_lock = asyncio.Lock()
+        self._token_store = token_store or MemoryTokenStore()
+        self._token_key = token_cache_key(
+            settings.client_id.get_secret_value(),
+            settings.account_id.get_secret_value(),
+        )
+        self._refresh_lead = timedelta(seconds=refresh_lead)
+        self._background_refresh = background_refresh
+        # Started by the first get_token() call, which runs on the event loop
+        self._refresh_task: asyncio.Task[None] | None = None
 
     def _is_token_valid(self) -> bool:
         """Check if current token is valid and not expired."""
@@ -131,6 +286,22 @@ class AsyncSFMCAuthenticator:
             return False
         return datetime.now() < (self._token_expires_at - self._refresh_buffer)
 
+    def _seconds_until_background_refresh(self) -> float:
+        """Seconds until the background refresher should renew the token."""
+        if not self._token or not self._token_expires_at:
+            return 0.0
+        refresh_at = _background_refresh_at(
+            self._token,
+            self._token_expires_at,
+            self._refresh_buffer,
+            self._refresh_lead,
+        )
+        return (refresh_at - datetime.now()).total_seconds()
+
+    def _is_token_fresh(self) -> bool:
+        """Check if the token is not yet due for a background refresh."""
+        return self._seconds_until_background_refresh() > 0
+
     async def _request_new_token(self) -> TokenResponse:
         """Request a new access token from SFMC."""
         token_url = urljoin(self.settings.auth_base_url.get_secret_value(), "/v2/token")
@@ -154,16 +325,76 @@ class AsyncSFMCAuthenticator:
         token_data = response.json()
         return TokenResponse(**token_data)
 
+    async def _load_stored_token(self) -> bool:
+        """Adopt the token from the token store, if it is still valid."""
+        # Stores may block on file locks, so keep them off the event loop
+        record = await asyncio.to_thread(self._token_store.load, self._token_key)
+        if record is None:
+            return False
+        token, expires_at = _token_from_record(record)
+        if datetime.now() >= expires_at - self._refresh_buffer:
+            return False
+        self._token, self._token_expires_at = token, expires_at
+        return True
+
     async def get_token(self) -> str:
-        """Get a valid access token, refreshing if necessary."""
+        """Get a valid access token, refreshing if necessary.
+
+        A token refreshed by another client sharing the token store is picked
+        up before a new one is requested.
+        """
+        if self._background_refresh and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
         if not self._is_token_valid():
-            self._token = await self._request_new_token()
-            self._token_expires_at = datetime.now() + timedelta(
-                seconds=self._token.expires_in
-            )
+            await self._refresh_token(self._is_token_valid)
 
         return self._token.access_token.get_secret_value()
 
+    async def _refresh_token(self, is_current: Callable[[], bool]) -> None:
+        """Renew the token unless ``is_current()`` holds under the refresh lock."""
+        # Only one coroutine refreshes, the others wait for its result
+        async with self._refresh_lock:
+            if is_current() or (await self._load_stored_token() and is_current()):
+                return
+            token = await self._request_new_token()
+            expires_at = datetime.now() + timedelta(seconds=token.expires_in)
+            await asyncio.to_thread(
+                self._token_store.save,
+                self._token_key,
+                _token_record(token, expires_at),
+            )
+            self._token, self._token_expires_at = token, expires_at
+
+    async def _refresh_in_background(self) -> None:
+        """Keep the token renewed ahead of expiry until the authenticator closes."""
+        delay = 0.0
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self._refresh_token(self._is_token_fresh)
+                delay = max(
+                    self._seconds_until_background_refresh(), _MIN_BACKGROUND_DELAY
+                )
+            except Exception:
+                # Requests still refresh inline if the token runs out meanwhile
+                logger.warning("Background token refresh failed", exc_info=True)
+                delay = _BACKGROUND_RETRY_DELAY
+
+    async def invalidate_token(self, access_token: str) -> None:
+        """Discard an access token that SFMC rejected.
+
+        Nothing happens if the token was already replaced, so concurrent
+        requests rejected with the same token cause a single refresh.
+        """
+        async with self._refresh_lock:
+            await asyncio.to_thread(
+                self._token_store.delete, self._token_key, access_token=access_token
+            )
+            if self._token and (
+                self._token.access_token.get_secret_value() == access_token
+            ):
+                self._token_expires_at = datetime.now()
+
     async def get_auth_header(self) -> dict[str, str]:
         """Get the authorization header for API requests."""
         token = await self.get_token()
@@ -182,5 +413,11 @@ class AsyncSFMCAuthenticator:
         return self._token.soap_instance_url.get_secret_value()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop the background refresher and close the HTTP client."""
+        self._background_refresh = False
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
         await self._http_client.aclose()
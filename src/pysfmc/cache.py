@@ -0,0 +1,403 @@
+"""Response caching for SFMC API clients, in memory or on disk."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Generic, Literal, TypeVar
+
+from .config import CacheConfig
+from .storage import SQLiteDatabase
+
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pysfmc"
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_RESPONSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    scope TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (scope, endpoint);
+"""
+
+# How a versioned cache entry is used once its TTL is over
+Revalidation = Literal["always", "ttl", "stale-while-revalidate"]
+
+# State of a versioned cache entry on lookup: use it as it is, use it and
+# refresh it in the background, check its version before use, or fetch it
+EntryState = Literal["fresh", "stale", "expired", "miss"]
+
+
+class TTLCache(Generic[K, V]):
+    """Size-bounded LRU cache whose entries expire after a time to live.
+
+    When full, adding an entry evicts the least recently used one. Expired
+    entries are dropped when they are looked up. The cache never waits on I/O
+    while holding its lock, so the same instance can be shared by threads and
+    coroutines.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of entries held
+            ttl: Default seconds an entry stays valid, or None for no expiry
+            clock: Monotonic time source, in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Values with their expiry time, least recently used first
+        self._entries: OrderedDict[K, tuple[V, float | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get a valid entry, marking it as recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Add or replace an entry.
+
+        Args:
+            key: Key of the entry
+            value: Value to cache
+            ttl: Seconds the entry stays valid, overriding the default
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value, or None if it is absent."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[0]
+
+    def discard_if(self, predicate: Callable[[K], bool]) -> int:
+        """Remove the entries whose key matches a predicate.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def _expired(self, entry: tuple[V, float | None]) -> bool:
+        expires_at = entry[1]
+        return expires_at is not None and self._clock() >= expires_at
+
+
+@dataclass(frozen=True)
+class _Versioned(Generic[V]):
+    value: V
+    version: Hashable
+    checked_at: float
+
+
+class VersionedCache(Generic[K, V]):
+    """LRU cache of values recording the version they were fetched at.
+
+    Entries do not expire: once ``ttl`` seconds have passed since their
+    version was last checked, lookups report them as ``expired`` (to check
+    before use) or, with ``stale-while-revalidate``, as ``stale`` (to use
+    while refreshing them in the background). With ``always``, every hit is
+    ``expired``. Checking the version of an entry is meant to be much cheaper
+    than fetching its value again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        revalidation: Revalidation = "ttl",
+        ttl: float = 60.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.revalidation = revalidation
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: TTLCache[K, _Versioned[V]] = TTLCache(max_entries)
+        self._refreshing: set[K] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K) -> tuple[V | None, EntryState]:
+        """Get a cached value and how it may be used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, "miss"
+        if self.revalidation == "always":
+            return entry.value, "expired"
+        if self._clock() - entry.checked_at < self.ttl:
+            return entry.value, "fresh"
+        if self.revalidation == "stale-while-revalidate":
+            return entry.value, "stale"
+        return entry.value, "expired"
+
+    def store(self, key: K, value: V, version: Hashable) -> None:
+        """Cache a value fetched at a version."""
+        with self._lock:
+            self._entries.set(key, _Versioned(value, version, self._clock()))
+
+    def confirm(self, key: K, version: Hashable) -> V | None:
+        """Mark an entry as checked if it is at a version.
+
+        Returns:
+            The cached value if it is at this version, otherwise None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                return None
+            self._entries.set(key, replace(entry, checked_at=self._clock()))
+            return entry.value
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value, or None if it is absent."""
+        with self._lock:
+            entry = self._entries.pop(key)
+        return None if entry is None else entry.value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def claim_refresh(self, key: K) -> bool:
+        """Claim the background refresh of an entry.
+
+        Returns:
+            False if another refresh of the entry is already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: K) -> None:
+        """Release the claim on the background refresh of an entry."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+
+def _normalize_param(value: Any) -> Any:
+    """Normalize a query parameter value as httpx would encode it."""
+    if isinstance(value, (list, tuple)):
+        return [_normalize_param(item) for item in value]
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _normalize_endpoint(endpoint: str) -> str:
+    return "/" + endpoint.strip("/")
+
+
+def response_cache_key(
+    method: str, scope: str, endpoint: str, params: dict[str, Any] | None
+) -> str:
+    """Build the cache key of a request.
+
+    Parameters are sorted and their values encoded like in the query string,
+    so that equivalent requests share an entry.
+    """
+    normalized = sorted(
+        (str(name), _normalize_param(value))
+        for name, value in (params or {}).items()
+        if value is not None
+    )
+    request = [method.upper(), scope, _normalize_endpoint(endpoint), normalized]
+    return hashlib.sha256(json.dumps(request).encode()).hexdigest()
+
+
+def response_cache_scope(subdomain: str, account_id: str | None) -> str:
+    """Build the scope of the cached responses of a tenant and business unit.
+
+    The scope is hashed so that identifiers are not written to disk in clear.
+    """
+    return hashlib.sha256(f"{subdomain}:{account_id or ''}".encode()).hexdigest()
+
+
+class SQLiteResponseCache:
+    """Cache of GET response bodies kept in a SQLite database file.
+
+    Bodies are stored compressed, with an absolute expiry time, so that they
+    survive restarts and are shared by the processes using the same file.
+    When the compressed bodies exceed ``max_bytes``, the least recently read
+    ones are evicted. Entries are grouped by scope (tenant and business
+    unit) and endpoint, so that writes can invalidate what they change.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open or create a cache file.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds a response stays valid
+            max_bytes: Maximum total size of the compressed bodies
+            timeout: Seconds to wait for a lock held by another process
+            clock: Wall-clock time source, in seconds since the epoch
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._database = SQLiteDatabase(path, _RESPONSE_SCHEMA, timeout)
+
+    @property
+    def path(self) -> str:
+        """Path of the database file."""
+        return self._database.path
+
+    def get(
+        self, scope: str, endpoint: str, params: dict[str, Any] | None = None
+    ) -> bytes | None:
+        """Get the cached body of a GET request, or None if absent or expired."""
+        key = response_cache_key("GET", scope, endpoint, params)
+        now = self._clock()
+        with self._database.transaction() as connection:
+            row = connection.execute(
+                "SELECT body FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return zlib.decompress(row[0])
+
+    def set(
+        self,
+        scope: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        body: bytes,
+    ) -> None:
+        """Cache the body of a GET request, evicting entries beyond the limits."""
+        key = response_cache_key("GET", scope, endpoint, params)
+        compressed = zlib.compress(body)
+        now = self._clock()
+        with self._database.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, scope, endpoint, body, "
+                "size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    scope,
+                    _normalize_endpoint(endpoint),
+                    compressed,
+                    len(compressed),
+                    now + self.ttl,
+                    now,
+                ),
+            )
+            connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            (total,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            if total > self.max_bytes:
+                # Keep the most recently read entries that fit in max_bytes
+                connection.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM ("
+                    "SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) "
+                    "AS kept FROM responses) WHERE kept > ?)",
+                    (self.max_bytes,),
+                )
+
+    def invalidate(self, scope: str, endpoint: str) -> int:
+        """Remove the responses a write to an endpoint may have changed.
+
+        These are the responses of the endpoint, of the resources below it,
+        and of its parent collection (e.g. the asset list for an asset).
+
+        Returns:
+            Number of entries removed
+        """
+        endpoint = _normalize_endpoint(endpoint)
+        parent = endpoint.rsplit("/", 1)[0] or "/"
+        with self._database.transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE scope = ? AND (endpoint IN (?, ?) "
+                "OR substr(endpoint, 1, ?) = ?)",
+                (scope, endpoint, parent, len(endpoint) + 1, endpoint + "/"),
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._database.transaction() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._database.close()
+
+
+def create_response_cache(config: CacheConfig) -> SQLiteResponseCache | None:
+    """Create the disk response cache described by the configuration, if any."""
+    if not config.disk:
+        return None
+    return SQLiteResponseCache(
+        config.disk_path or _DEFAULT_CACHE_DIR / "responses.sqlite",
+        ttl=config.disk_ttl,
+        max_bytes=config.disk_max_bytes,
+    )
@@ -1,21 +1,124 @@
 """HTTP client implementations for SFMC API."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, TypeVar
 from urllib.parse import urljoin
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .auth import AsyncSFMCAuthenticator, SFMCAuthenticator, SFMCSettings
-from .exceptions import SFMCConnectionError, map_http_error
+from .cache import SQLiteResponseCache, create_response_cache, response_cache_scope
+from .codec import get_codec
+from .config import ClientConfig, SFMCConfig
+from .exceptions import (
+    SFMCAuthenticationError,
+    SFMCConnectionError,
+    SFMCError,
+    SFMCRateLimitError,
+    map_http_error,
+)
+from .ratelimit import RateLimiter, create_rate_limiter
+from .retry import RetryPolicy
+from .token_store import TokenStore, create_token_store
+from .transport import (
+    build_async_auth_http_client,
+    build_async_http_client,
+    build_auth_http_client,
+    build_http_client,
+)
+
+T = TypeVar("T")
+
+
+def _rejected_access_token(error: SFMCAuthenticationError) -> str | None:
+    """Get the access token a request was rejected with, if it sent one.
+
+    Errors from the token endpoint itself carry no bearer token, and are not
+    worth a retry.
+    """
+    if error.response is None:
+        return None
+    authorization = error.response.request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    return token if scheme == "Bearer" and token else None
 
 
 class BaseClient(ABC):
     """Abstract base class for SFMC API clients."""
 
-    def __init__(self, settings: SFMCSettings | None = None):
+    def __init__(
+        self,
+        settings: SFMCSettings | None = None,
+        *,
+        config: SFMCConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        token_store: TokenStore | None = None,
+        response_cache: SQLiteResponseCache | None = None,
+    ):
         self.settings = settings or SFMCSettings()
+        self.config = config or SFMCConfig()
+        self._retry_policy = RetryPolicy.from_config(self.config.client)
+        self._codec = get_codec(self.config.client.json_codec)
+        # Resources created here (rather than passed in) are closed with the client
+        self._owned_resources: list[RateLimiter | TokenStore | SQLiteResponseCache] = []
+        # The quota applies per tenant, which the subdomain identifies
+        self._rate_limiter = rate_limiter
+        if rate_limiter is None:
+            self._rate_limiter = create_rate_limiter(
+                self.config.rate_limit, key=self.settings.subdomain.get_secret_value()
+            )
+            if self._rate_limiter is not None:
+                self._owned_resources.append(self._rate_limiter)
+        self._token_store = token_store
+        if token_store is None:
+            self._token_store = create_token_store(self.config.auth)
+            self._owned_resources.append(self._token_store)
+        self._response_cache = response_cache
+        if response_cache is None:
+            self._response_cache = create_response_cache(self.config.cache)
+            if self._response_cache is not None:
+                self._owned_resources.append(self._response_cache)
+        # Responses are cached per tenant and business unit
+        self._response_cache_scope = response_cache_scope(
+            self.settings.subdomain.get_secret_value(),
+            self.settings.account_id.get_secret_value(),
+        )
+
+    def _encode_payload(
+        self, payload: dict[str, Any] | BaseModel | None
+    ) -> bytes | None:
+        """Encode a request payload, serializing models straight to JSON bytes."""
+        if payload is None:
+            return None
+        if isinstance(payload, BaseModel):
+            return payload.model_dump_json(exclude_none=True, by_alias=True).encode()
+        return self._codec.dumps(payload)
+
+    def _decode_response(self, content: bytes) -> Any:
+        """Decode a JSON response body, or an empty one (204) to an empty dict."""
+        return self._codec.loads(content) if content else {}
+
+    def validate_response(self, adapter: TypeAdapter[T], body: bytes) -> T:
+        """Validate a raw JSON response body, as returned by ``get_raw()``.
+
+        The body goes straight to pydantic-core, whatever the configured codec.
+        """
+        return self._codec.validate(adapter, body)
+
+    def _close_owned_resources(self) -> None:
+        """Close the limiter, token store and cache if this client created them."""
+        for resource in self._owned_resources:
+            resource.close()
+
+    def _client_config(self, timeout: float | None) -> ClientConfig:
+        """Get the HTTP client configuration, applying a timeout override."""
+        if timeout is None:
+            return self.config.client
+        return self.config.client.model_copy(update={"timeout": timeout})
 
     @abstractmethod
     def get(self, endpoint: str, **kwargs) -> dict[str, Any]:
@@ -55,11 +158,35 @@ class SFMCClient(BaseClient):
         self,
         settings: SFMCSettings | None = None,
         http_client: httpx.Client | None = None,
-        timeout: float = 30.0,
+        timeout: float | None = None,
+        *,
+        config: SFMCConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        token_store: TokenStore | None = None,
+        response_cache: SQLiteResponseCache | None = None,
     ):
-        super().__init__(settings)
-        self._http_client = http_client or httpx.Client(timeout=timeout)
-        self._authenticator = SFMCAuthenticator(self.settings, self._http_client)
+        super().__init__(
+            settings,
+            config=config,
+            rate_limiter=rate_limiter,
+            token_store=token_store,
+            response_cache=response_cache,
+        )
+        client_config = self._client_config(timeout)
+        if http_client is not None:
+            # A caller-provided client is shared by the auth and REST hosts
+            self._http_client = http_client
+            auth_http_client = http_client
+        else:
+            self._http_client = build_http_client(client_config)
+            auth_http_client = build_auth_http_client(client_config)
+        self._authenticator = SFMCAuthenticator(
+            self.settings,
+            auth_http_client,
+            self._token_store,
+            background_refresh=self.config.auth.background_refresh,
+            refresh_lead=self.config.auth.refresh_lead_seconds,
+        )
         self._assets = None
 
     def _make_request(
@@ -71,47 +198,148 @@ class SFMCClient(BaseClient):
         headers: dict[str, str] | None = None,
         **kwargs,
     ) -> dict[str, Any]:
-        """Make an authenticated HTTP request."""
-        # Get base URL and auth headers
-        base_url = self._authenticator.get_rest_base_url()
-        auth_headers = self._authenticator.get_auth_header()
-
-        # Build full URL
-        url = urljoin(base_url, endpoint.lstrip("/"))
-
-        # Prepare headers
-        request_headers = {"Content-Type": "application/json"}
-        request_headers.update(auth_headers)
-        if headers:
-            request_headers.update(headers)
-
-        # Prepare JSON payload
-        json_data = None
-        if json is not None:
-            if isinstance(json, BaseModel):
-                json_data = json.model_dump(exclude_none=True, by_alias=True)
+        """Make an authenticated HTTP request and decode the JSON response."""
+        return self._decode_response(
+            self._request_raw(method, endpoint, json, params, headers, **kwargs)
+        )
+
+    def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> bytes:
+        """Make an authenticated HTTP request and return the raw response body.
+
+        With a response cache, GET bodies are served from it when cached, and
+        other requests invalidate the cached responses they may change.
+        Without ``use_cache``, a GET skips the cached body but still refreshes
+        it.
+        """
+        cache = self._response_cache
+        if cache is not None and method == "GET" and use_cache:
+            cached = cache.get(self._response_cache_scope, endpoint, params)
+            if cached is not None:
+                return cached
+        response = self._request(method, endpoint, json, params, headers, **kwargs)
+        body = b"" if response.status_code == 204 else response.content  # No Content
+        if cache is None:
+            return body
+        if method != "GET":
+            cache.invalidate(self._response_cache_scope, endpoint)
+        elif response.status_code == 200:
+            cache.set(self._response_cache_scope, endpoint, params, body)
+        return body
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Make an authenticated HTTP request, retrying transient failures.
+
+        With ``stream``, only the response headers have been received when
+        it is returned: the caller reads the body and closes the response.
+        """
+        content = self._encode_payload(json)
+
+        attempt = 0
+        reauthenticated = False
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                response = self._send(
+                    method, endpoint, content, params, headers, stream=stream, **kwargs
+                )
+            except SFMCAuthenticationError as e:
+                # A token revoked or rotated early is refreshed once, then the
+                # request is replayed
+                stale_token = _rejected_access_token(e)
+                if reauthenticated or stale_token is None:
+                    raise
+                self._authenticator.invalidate_token(stale_token)
+                reauthenticated = True
+            except SFMCError as e:
+                if isinstance(e, SFMCRateLimitError) and self._rate_limiter is not None:
+                    self._rate_limiter.on_throttled()
+                if not self._retry_policy.should_retry(method, e, attempt):
+                    raise
+                time.sleep(self._retry_policy.get_delay(e, attempt))
+                attempt += 1
             else:
-                json_data = json
+                if self._rate_limiter is not None:
+                    self._rate_limiter.on_success()
+                return response
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        content: bytes | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        *,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Make a single authenticated HTTP request attempt."""
         try:
-            response = self._http_client.request(
-                method=method,
-                url=url,
-                json=json_data,
-                params=params,
-                headers=request_headers,
-                **kwargs,
-            )
+            # Get base URL and auth headers
+            base_url = self._authenticator.get_rest_base_url()
+            auth_headers = self._authenticator.get_auth_header()
+
+            # Build full URL
+            url = urljoin(base_url, endpoint.lstrip("/"))
+
+            # Prepare headers
+            request_headers = {"Content-Type": "application/json"}
+            request_headers.update(auth_headers)
+            if headers:
+                request_headers.update(headers)
+
+            if stream:
+                request = self._http_client.build_request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    params=params,
+                    headers=request_headers,
+                    **kwargs,
+                )
+                response = self._http_client.send(request, stream=True)
+            else:
+                response = self._http_client.request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    params=params,
+                    headers=request_headers,
+                    **kwargs,
+                )
 
             # Handle HTTP errors
             if not response.is_success:
+                if stream:
+                    # The error details are in the body
+                    try:
+                        response.read()
+                    finally:
+                        response.close()
                 raise map_http_error(response)
 
-            # Return JSON response or empty dict for no content
-            if response.status_code == 204:  # No Content
-                return {}
-
-            return response.json()
+            return response
 
         except httpx.RequestError as e:
             raise SFMCConnectionError(f"Connection error: {e}") from e
@@ -122,6 +350,50 @@ class SFMCClient(BaseClient):
         """Make a GET request."""
         return self._make_request("GET", endpoint, params=params, **kwargs)
 
+    def get_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> bytes:
+        """Make a GET request and return the undecoded JSON response body.
+
+        Lets callers validate the body into models with
+        ``validate_response()``, without building intermediate dicts.
+        Pass ``use_cache=False`` to skip the disk response cache for this
+        request, e.g. to check whether a resource changed.
+        """
+        return self._request_raw(
+            "GET", endpoint, params=params, use_cache=use_cache, **kwargs
+        )
+
+    def post_raw(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        **kwargs,
+    ) -> bytes:
+        """Make a POST request and return the undecoded JSON response body."""
+        return self._request_raw("POST", endpoint, json=json, **kwargs)
+
+    def stream_raw(
+        self, endpoint: str, params: dict[str, Any] | None = None, **kwargs
+    ) -> Iterator[bytes]:
+        """Make a GET request and yield the response body as it arrives.
+
+        Failures are retried like other requests until the response headers
+        are received. Errors while reading the body are not retried.
+        """
+        response = self._request("GET", endpoint, params=params, stream=True, **kwargs)
+        try:
+            yield from response.iter_bytes()
+        except httpx.RequestError as e:
+            raise SFMCConnectionError(f"Connection error: {e}") from e
+        finally:
+            response.close()
+
     def post(
         self,
         endpoint: str,
@@ -164,8 +436,11 @@ class SFMCClient(BaseClient):
 
     def close(self) -> None:
         """Close the client and cleanup resources."""
+        if self._assets is not None:
+            self._assets.close()
         self._authenticator.close()
         self._http_client.close()
+        self._close_owned_resources()
 
     def __enter__(self):
         return self
@@ -181,11 +456,35 @@ class AsyncSFMCClient(BaseClient):
         self,
         settings: SFMCSettings | None = None,
         http_client: httpx.AsyncClient | None = None,
-        timeout: float = 30.0,
+        timeout: float | None = None,
+        *,
+        config: SFMCConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        token_store: TokenStore | None = None,
+        response_cache: SQLiteResponseCache | None = None,
     ):
-        super().__init__(settings)
-        self._http_client = http_client or httpx.AsyncClient(timeout=timeout)
-        self._authenticator = AsyncSFMCAuthenticator(self.settings, self._http_client)
+        super().__init__(
+            settings,
+            config=config,
+            rate_limiter=rate_limiter,
+            token_store=token_store,
+            response_cache=response_cache,
+        )
+        client_config = self._client_config(timeout)
+        if http_client is not None:
+            # A caller-provided client is shared by the auth and REST hosts
+            self._http_client = http_client
+            auth_http_client = http_client
+        else:
+            self._http_client = build_async_http_client(client_config)
+            auth_http_client = build_async_auth_http_client(client_config)
+        self._authenticator = AsyncSFMCAuthenticator(
+            self.settings,
+            auth_http_client,
+            self._token_store,
+            background_refresh=self.config.auth.background_refresh,
+            refresh_lead=self.config.auth.refresh_lead_seconds,
+        )
         self._assets = None
 
     async def _make_request(
@@ -197,47 +496,151 @@ class AsyncSFMCClient(BaseClient):
         headers: dict[str, str] | None = None,
         **kwargs,
     ) -> dict[str, Any]:
-        """Make an authenticated HTTP request."""
-        # Get base URL and auth headers
-        base_url = await self._authenticator.get_rest_base_url()
-        auth_headers = await self._authenticator.get_auth_header()
-
-        # Build full URL
-        url = urljoin(base_url, endpoint.lstrip("/"))
-
-        # Prepare headers
-        request_headers = {"Content-Type": "application/json"}
-        request_headers.update(auth_headers)
-        if headers:
-            request_headers.update(headers)
-
-        # Prepare JSON payload
-        json_data = None
-        if json is not None:
-            if isinstance(json, BaseModel):
-                json_data = json.model_dump(exclude_none=True, by_alias=True)
+        """Make an authenticated HTTP request and decode the JSON response."""
+        return self._decode_response(
+            await self._request_raw(method, endpoint, json, params, headers, **kwargs)
+        )
+
+    async def _request_raw(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> bytes:
+        """Make an authenticated HTTP request and return the raw response body.
+
+        With a response cache, GET bodies are served from it when cached, and
+        other requests invalidate the cached responses they may change.
+        Without ``use_cache``, a GET skips the cached body but still refreshes
+        it. The cache file is accessed from a worker thread.
+        """
+        cache = self._response_cache
+        scope = self._response_cache_scope
+        if cache is not None and method == "GET" and use_cache:
+            cached = await asyncio.to_thread(cache.get, scope, endpoint, params)
+            if cached is not None:
+                return cached
+        response = await self._request(
+            method, endpoint, json, params, headers, **kwargs
+        )
+        body = b"" if response.status_code == 204 else response.content  # No Content
+        if cache is None:
+            return body
+        if method != "GET":
+            await asyncio.to_thread(cache.invalidate, scope, endpoint)
+        elif response.status_code == 200:
+            await asyncio.to_thread(cache.set, scope, endpoint, params, body)
+        return body
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Make an authenticated HTTP request, retrying transient failures.
+
+        With ``stream``, only the response headers have been received when
+        it is returned: the caller reads the body and closes the response.
+        """
+        content = self._encode_payload(json)
+
+        attempt = 0
+        reauthenticated = False
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            try:
+                response = await self._send(
+                    method, endpoint, content, params, headers, stream=stream, **kwargs
+                )
+            except SFMCAuthenticationError as e:
+                # A token revoked or rotated early is refreshed once, then the
+                # request is replayed
+                stale_token = _rejected_access_token(e)
+                if reauthenticated or stale_token is None:
+                    raise
+                await self._authenticator.invalidate_token(stale_token)
+                reauthenticated = True
+            except SFMCError as e:
+                if isinstance(e, SFMCRateLimitError) and self._rate_limiter is not None:
+                    await self._rate_limiter.on_throttled_async()
+                if not self._retry_policy.should_retry(method, e, attempt):
+                    raise
+                await asyncio.sleep(self._retry_policy.get_delay(e, attempt))
+                attempt += 1
             else:
-                json_data = json
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.on_success_async()
+                return response
 
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        content: bytes | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        *,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Make a single authenticated HTTP request attempt."""
         try:
-            response = await self._http_client.request(
-                method=method,
-                url=url,
-                json=json_data,
-                params=params,
-                headers=request_headers,
-                **kwargs,
-            )
+            # Get base URL and auth headers
+            base_url = await self._authenticator.get_rest_base_url()
+            auth_headers = await self._authenticator.get_auth_header()
+
+            # Build full URL
+            url = urljoin(base_url, endpoint.lstrip("/"))
+
+            # Prepare headers
+            request_headers = {"Content-Type": "application/json"}
+            request_headers.update(auth_headers)
+            if headers:
+                request_headers.update(headers)
+
+            if stream:
+                request = self._http_client.build_request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    params=params,
+                    headers=request_headers,
+                    **kwargs,
+                )
+                response = await self._http_client.send(request, stream=True)
+            else:
+                response = await self._http_client.request(
+                    method=method,
+                    url=url,
+                    content=content,
+                    params=params,
+                    headers=request_headers,
+                    **kwargs,
+                )
 
             # Handle HTTP errors
             if not response.is_success:
+                if stream:
+                    # The error details are in the body
+                    try:
+                        await response.aread()
+                    finally:
+                        await response.aclose()
                 raise map_http_error(response)
 
-            # Return JSON response or empty dict for no content
-            if response.status_code == 204:  # No Content
-                return {}
-
-            return response.json()
+            return response
 
         except httpx.RequestError as e:
             raise SFMCConnectionError(f"Connection error: {e}") from e
@@ -248,6 +651,53 @@ class AsyncSFMCClient(BaseClient):
         """Make a GET request."""
         return await self._make_request("GET", endpoint, params=params, **kwargs)
 
+    async def get_raw(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
+        **kwargs,
+    ) -> bytes:
+        """Make a GET request and return the undecoded JSON response body.
+
+        Lets callers validate the body into models with
+        ``validate_response()``, without building intermediate dicts.
+        Pass ``use_cache=False`` to skip the disk response cache for this
+        request, e.g. to check whether a resource changed.
+        """
+        return await self._request_raw(
+            "GET", endpoint, params=params, use_cache=use_cache, **kwargs
+        )
+
+    async def post_raw(
+        self,
+        endpoint: str,
+        json: dict[str, Any] | BaseModel | None = None,
+        **kwargs,
+    ) -> bytes:
+        """Make a POST request and return the undecoded JSON response body."""
+        return await self._request_raw("POST", endpoint, json=json, **kwargs)
+
+    async def stream_raw(
+        self, endpoint: str, params: dict[str, Any] | None = None, **kwargs
+    ) -> AsyncIterator[bytes]:
+        """Make a GET request and yield the response body as it arrives.
+
+        Failures are retried like other requests until the response headers
+        are received. Errors while reading the body are not retried.
+        """
+        response = await self._request(
+            "GET", endpoint, params=params, stream=True, **kwargs
+        )
+        try:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+        except httpx.RequestError as e:
+            raise SFMCConnectionError(f"Connection error: {e}") from e
+        finally:
+            await response.aclose()
+
     async def post(
         self,
         endpoint: str,
@@ -290,8 +740,11 @@ class AsyncSFMCClient(BaseClient):
 
     async def close(self) -> None:
         """Close the client and cleanup resources."""
+        if self._assets is not None:
+            await self._assets.aclose()
         await self._authenticator.close()
         await self._http_client.aclose()
+        self._close_owned_resources()
 
     async def __aenter__(self):
         return self
@@ -0,0 +1,122 @@
+"""JSON codecs for encoding request bodies and decoding responses.
+
+orjson and msgspec are optional and encode and decode untyped payloads faster
+than the standard library. Install them with ``pip install pysfmc[orjson]`` or
+``pip install pysfmc[msgspec]``. Responses validated into models skip the codec
+and are parsed by pydantic-core, which uses less memory than building the
+intermediate objects.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Literal, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+CodecName = Literal["auto", "json", "orjson", "msgspec"]
+
+
+class JSONCodec(ABC):
+    """Abstract base class for JSON codecs."""
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as compact UTF-8 JSON."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode UTF-8 JSON."""
+        pass
+
+    def validate(self, adapter: TypeAdapter[T], data: bytes) -> T:
+        """Decode UTF-8 JSON and validate it with a type adapter.
+
+        pydantic-core parses the bytes straight into the validated type, with
+        whatever codec, rather than building the decoded objects first.
+        """
+        return adapter.validate_json(data)
+
+
+class StdlibCodec(JSONCodec):
+    """Codec using the standard library ``json`` module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # noqa: PLC0415
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec using msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec  # noqa: PLC0415
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "json": StdlibCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(name: CodecName = "auto") -> JSONCodec:
+    """Get a JSON codec by name.
+
+    ``"auto"`` picks the fastest installed codec for untyped payloads:
+    msgspec, then orjson, then the standard library.
+
+    Raises:
+        ImportError: If the requested codec's package is not installed
+    """
+    if name != "auto":
+        try:
+            return _CODECS[name]()
+        except ImportError as e:
+            raise ImportError(
+                f"The {name} JSON codec requires the {name} package, "
+                f"install it with 'pip install pysfmc[{name}]'"
+            ) from e
+    for codec_class in (MsgspecCodec, OrjsonCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibCodec()
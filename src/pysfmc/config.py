@@ -1,5 +1,7 @@
 """Configuration management for SFMC client."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,12 +12,31 @@ class ClientConfig(BaseModel):
     timeout: float = Field(30.0, description="Request timeout in seconds")
     max_retries: int = Field(3, description="Maximum number of retry attempts")
     retry_backoff_factor: float = Field(0.5, description="Backoff factor for retries")
+    retry_max_backoff: float = Field(
+        30.0, description="Maximum backoff delay between retries in seconds"
+    )
+    # The default tenant quota is saturated well below 20 in-flight requests, and
+    # keeping every pooled connection alive avoids repeated TLS handshakes.
     max_connections: int = Field(
-        100, description="Maximum number of connections in pool"
+        20, description="Maximum number of connections in pool"
     )
     max_keepalive_connections: int = Field(
         20, description="Maximum number of keep-alive connections"
     )
+    keepalive_expiry: float = Field(
+        30.0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    http2: bool = Field(
+        False, description="Enable HTTP/2 multiplexing (requires the 'h2' package)"
+    )
+    auth_max_connections: int = Field(
+        2, description="Maximum number of connections in the auth host pool"
+    )
+    json_codec: Literal["auto", "json", "orjson", "msgspec"] = Field(
+        "auto",
+        description="JSON codec for request and response bodies ('auto' picks "
+        "the fastest installed one)",
+    )
 
 
 class RateLimitConfig(BaseModel):
@@ -24,6 +45,83 @@ class RateLimitConfig(BaseModel):
     enabled: bool = Field(True, description="Enable rate limiting")
     requests_per_minute: int = Field(2500, description="Max requests per minute")
     burst_limit: int = Field(100, description="Burst request limit")
+    adaptive: bool = Field(
+        True, description="Slow down after 429 responses and recover on success"
+    )
+    min_requests_per_minute: int = Field(
+        250, description="Lowest rate the adaptive limiter slows down to"
+    )
+    recovery_threshold: int = Field(
+        50, description="Successful requests before the adaptive rate is raised"
+    )
+    shared_state_path: str | None = Field(
+        None,
+        description="SQLite file holding a rate limit budget shared by all "
+        "processes on this host",
+    )
+
+
+class AuthConfig(BaseModel):
+    """Authentication and token caching configuration."""
+
+    token_store: Literal["memory", "file", "sqlite"] = Field(
+        "memory", description="Where access tokens are cached"
+    )
+    token_store_path: str | None = Field(
+        None,
+        description="Path of the file or SQLite token store "
+        "(defaults to ~/.cache/pysfmc/)",
+    )
+    background_refresh: bool = Field(
+        False, description="Renew access tokens ahead of expiry in the background"
+    )
+    refresh_lead_seconds: float = Field(
+        300.0,
+        description="How long before the inline refresh the background "
+        "refresher renews the token",
+    )
+
+
+class CacheConfig(BaseModel):
+    """Response caching configuration."""
+
+    categories: bool = Field(
+        False, description="Cache categories in memory, per categories client"
+    )
+    categories_ttl: float = Field(
+        300.0, description="Seconds a cached category or category page is used"
+    )
+    categories_max_entries: int = Field(
+        1024, description="Maximum number of cached categories and category pages"
+    )
+    assets: bool = Field(
+        False, description="Cache assets read by ID in memory, per query client"
+    )
+    assets_max_entries: int = Field(1024, description="Maximum number of cached assets")
+    assets_ttl: float = Field(
+        60.0,
+        description="Seconds a cached asset is used before its version is "
+        "checked again",
+    )
+    assets_revalidation: Literal["always", "ttl", "stale-while-revalidate"] = Field(
+        "ttl",
+        description="Check the version of a cached asset on every read ('always'), "
+        "after the TTL ('ttl'), or after the TTL in the background while serving "
+        "the cached asset ('stale-while-revalidate')",
+    )
+    disk: bool = Field(False, description="Cache GET response bodies in a SQLite file")
+    disk_path: str | None = Field(
+        None,
+        description="Path of the SQLite response cache "
+        "(defaults to ~/.cache/pysfmc/responses.sqlite)",
+    )
+    disk_ttl: float = Field(
+        3600.0, description="Seconds a response cached on disk is used"
+    )
+    disk_max_bytes: int = Field(
+        256 * 1024 * 1024,
+        description="Maximum total size of the compressed responses on disk",
+    )
 
 
 class SFMCConfig(BaseSettings):
@@ -35,6 +133,12 @@ class SFMCConfig(BaseSettings):
     # Rate limiting settings
     rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
 
+    # Authentication settings
+    auth: AuthConfig = Field(default_factory=AuthConfig)
+
+    # Response caching settings
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+
     # Logging settings
     log_requests: bool = Field(False, description="Log HTTP requests")
     log_responses: bool = Field(False, description="Log HTTP responses")
@@ -19,6 +19,7 @@ from .blocks import (
     Slot,
 )
 from .categories import Category, CategoryCreate, CategoryFilter, CategoryResponse
+from .projection import AssetProjection, asset_projection
 from .views import (
     Channels,
     EmailViews,
@@ -44,6 +45,8 @@ __all__ = [
     "CreateAsset",
     "Owner",
     "Status",
+    "AssetProjection",
+    "asset_projection",
     # Block and slot models
     "Block",
     "Slot",
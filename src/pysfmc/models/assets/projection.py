@@ -0,0 +1,66 @@
+"""Slim asset models for queries returning a subset of the asset fields."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+
+from ..base import SFMC_MODEL_CONFIG
+from .assets import Asset, AssetResponse
+
+
+class AssetProjection:
+    """Subset of the ``Asset`` fields requested from the API.
+
+    Holds the ``$fields`` query value and the generated slim models, which
+    only validate the requested fields. Get instances with
+    ``asset_projection()``, which caches them.
+    """
+
+    def __init__(self, fields: tuple[str, ...]):
+        unknown = [name for name in fields if name not in Asset.model_fields]
+        if unknown:
+            raise ValueError(f"Unknown Asset fields: {', '.join(unknown)}")
+        self.fields = fields
+        # The API selects fields by their JSON names
+        self.query = ",".join(Asset.model_fields[name].alias or name for name in fields)
+        self.model: type[BaseModel] = create_model(
+            f"AssetProjection[{','.join(fields)}]",
+            __config__=SFMC_MODEL_CONFIG,
+            **{
+                name: (Asset.model_fields[name].annotation, Asset.model_fields[name])
+                for name in fields
+            },
+        )
+        self.response_model: type[BaseModel] = create_model(
+            f"AssetProjectionResponse[{','.join(fields)}]",
+            __config__=SFMC_MODEL_CONFIG,
+            **{
+                name: (field.annotation, field)
+                for name, field in AssetResponse.model_fields.items()
+                if name != "items"
+            },
+            items=(list[self.model], Field(default_factory=list)),
+        )
+        self.adapter = TypeAdapter(self.model)
+        self.response_adapter = TypeAdapter(self.response_model)
+
+
+@lru_cache(maxsize=128)
+def _cached_projection(fields: tuple[str, ...]) -> AssetProjection:
+    return AssetProjection(fields)
+
+
+def asset_projection(fields: Sequence[str]) -> AssetProjection:
+    """Get the projection of ``Asset`` onto some of its attributes.
+
+    Args:
+        fields: ``Asset`` attribute names (e.g. 'id', 'name', 'modified_date')
+
+    Returns:
+        The cached projection for these fields
+
+    Raises:
+        ValueError: If a name is not an ``Asset`` attribute
+    """
+    return _cached_projection(tuple(dict.fromkeys(fields)))
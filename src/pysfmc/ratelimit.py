@@ -0,0 +1,309 @@
+"""Client-side rate limiting for SFMC API requests."""
+
+import asyncio
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from .config import RateLimitConfig
+from .storage import SQLiteDatabase
+
+_BUCKET_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    rate REAL NOT NULL,
+    successes INTEGER NOT NULL,
+    throttled_at REAL
+);
+"""
+
+
+class RateLimiter(ABC):
+    """Abstract base class for client-side rate limiters.
+
+    Subclasses implement ``reserve``, which takes a token and returns how long
+    the caller has to wait before using it. Waiting happens outside of any
+    lock, so the same limiter can be shared by threads and coroutines.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Reserve a token and return the seconds to wait before using it."""
+        pass
+
+    def on_throttled(self) -> None:  # noqa: B027
+        """Notify the limiter that the server answered with a 429."""
+        pass
+
+    def on_success(self) -> None:  # noqa: B027
+        """Notify the limiter that a request was accepted by the server."""
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the limiter."""
+        pass
+
+    def acquire(self) -> None:
+        """Block the current thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def on_throttled_async(self) -> None:
+        """Async version of ``on_throttled()``, for use on an event loop."""
+        self.on_throttled()
+
+    async def on_success_async(self) -> None:
+        """Async version of ``on_success()``, for use on an event loop."""
+        self.on_success()
+
+
+class BucketState:
+    """Mutable state of a token bucket."""
+
+    __slots__ = ("rate", "successes", "throttled_at", "tokens", "updated_at")
+
+    def __init__(
+        self,
+        tokens: float,
+        updated_at: float,
+        rate: float,
+        successes: int = 0,
+        throttled_at: float | None = None,
+    ):
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.rate = rate
+        self.successes = successes
+        self.throttled_at = throttled_at
+
+
+class TokenBucket(RateLimiter):
+    """In-process token bucket with adaptive rate (AIMD).
+
+    The bucket refills at ``rate`` tokens per second up to ``capacity``.
+    Tokens can be reserved ahead, which makes the balance negative and queues
+    later callers in arrival order.
+
+    When adaptive, a 429 halves the rate (at most once per ``cooldown``
+    seconds, so a burst of 429s counts once) and empties the bucket. Each run
+    of ``recovery_threshold`` successes then raises the rate by a tenth of
+    the configured rate until it is back to the configured value.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        *,
+        adaptive: bool = True,
+        min_rate: float | None = None,
+        recovery_threshold: int = 50,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.capacity = capacity
+        self.adaptive = adaptive
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.recovery_threshold = recovery_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self._initial_state()
+        # Last rate seen, to skip locking on success while at full speed
+        self._observed_rate = rate
+
+    @classmethod
+    def from_config(cls, config: RateLimitConfig, **kwargs) -> "TokenBucket":
+        """Create a token bucket from the rate limiting configuration."""
+        return cls(
+            rate=config.requests_per_minute / 60,
+            capacity=config.burst_limit,
+            adaptive=config.adaptive,
+            min_rate=config.min_requests_per_minute / 60,
+            recovery_threshold=config.recovery_threshold,
+            **kwargs,
+        )
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in tokens per second."""
+        with self._locked_state() as state:
+            return state.rate
+
+    def _initial_state(self) -> BucketState:
+        return BucketState(
+            tokens=float(self.capacity), updated_at=self._clock(), rate=self.max_rate
+        )
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[BucketState]:
+        """Hold the bucket lock and give access to its state."""
+        with self._lock:
+            yield self._state
+            self._observed_rate = self._state.rate
+
+    def _refill(self, state: BucketState, now: float) -> None:
+        elapsed = max(0.0, now - state.updated_at)
+        state.tokens = min(self.capacity, state.tokens + elapsed * state.rate)
+        state.updated_at = now
+
+    def reserve(self) -> float:
+        """Reserve a token and return the seconds to wait before using it."""
+        with self._locked_state() as state:
+            self._refill(state, self._clock())
+            state.tokens -= 1
+            if state.tokens >= 0:
+                return 0.0
+            return -state.tokens / state.rate
+
+    def on_throttled(self) -> None:
+        """Halve the rate and empty the bucket after a 429."""
+        if not self.adaptive:
+            return
+        with self._locked_state() as state:
+            now = self._clock()
+            state.successes = 0
+            if state.throttled_at is not None and (
+                now - state.throttled_at < self.cooldown
+            ):
+                return
+            self._refill(state, now)
+            state.throttled_at = now
+            state.rate = max(self.min_rate, state.rate / 2)
+            state.tokens = min(state.tokens, 0.0)
+
+    def on_success(self) -> None:
+        """Raise the rate again after a run of successful requests."""
+        if not self.adaptive or self._observed_rate >= self.max_rate:
+            return
+        with self._locked_state() as state:
+            if state.rate >= self.max_rate:
+                return
+            state.successes += 1
+            if state.successes >= self.recovery_threshold:
+                state.successes = 0
+                self._refill(state, self._clock())
+                state.rate = min(self.max_rate, state.rate + self.max_rate / 10)
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """Token bucket whose state is shared through a SQLite file.
+
+    Every process (and thread) pointing at the same file and key draws from
+    one budget, so a fleet of workers on a host stays under the tenant quota
+    as a whole. Each operation runs in an immediate transaction, which SQLite
+    serializes across processes. Wall-clock time is used since monotonic
+    clocks are not comparable between processes.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        rate: float,
+        capacity: int,
+        *,
+        key: str = "default",
+        timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+        **kwargs,
+    ):
+        self.key = key
+        self._database = SQLiteDatabase(path, _BUCKET_SCHEMA, timeout)
+        super().__init__(rate, capacity, clock=clock, **kwargs)
+
+    @property
+    def path(self) -> str:
+        """Path of the shared state file."""
+        return self._database.path
+
+    def _initial_state(self) -> BucketState:
+        # The shared row is created on first use
+        return BucketState(tokens=0.0, updated_at=0.0, rate=self.max_rate)
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[BucketState]:
+        """Hold an immediate transaction on the shared bucket row."""
+        with self._database.transaction() as connection:
+            row = connection.execute(
+                "SELECT tokens, updated_at, rate, successes, throttled_at "
+                "FROM rate_limit_buckets WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            if row is None:
+                state = BucketState(
+                    tokens=float(self.capacity),
+                    updated_at=self._clock(),
+                    rate=self.max_rate,
+                )
+            else:
+                state = BucketState(*row)
+            yield state
+            connection.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets "
+                "(key, tokens, updated_at, rate, successes, throttled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.key,
+                    state.tokens,
+                    state.updated_at,
+                    state.rate,
+                    state.successes,
+                    state.throttled_at,
+                ),
+            )
+        self._observed_rate = state.rate
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop.
+
+        The transaction may wait on other processes holding the file lock, so
+        it runs in a worker thread.
+        """
+        delay = await asyncio.to_thread(self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def on_throttled_async(self) -> None:
+        """Record a 429 from a worker thread, off the event loop."""
+        if self.adaptive:
+            await asyncio.to_thread(self.on_throttled)
+
+    async def on_success_async(self) -> None:
+        """Record a success from a worker thread, off the event loop."""
+        if self.adaptive and self._observed_rate < self.max_rate:
+            await asyncio.to_thread(self.on_success)
+
+    def close(self) -> None:
+        """Close the SQLite connection of this process."""
+        self._database.close()
+
+
+def create_rate_limiter(
+    config: RateLimitConfig, key: str = "default"
+) -> RateLimiter | None:
+    """Create the rate limiter described by the configuration, if enabled.
+
+    Args:
+        config: Rate limiting configuration
+        key: Name of the shared budget when ``shared_state_path`` is set
+    """
+    if not config.enabled:
+        return None
+    if config.shared_state_path:
+        return SQLiteTokenBucket.from_config(
+            config, path=config.shared_state_path, key=key
+        )
+    return TokenBucket.from_config(config)
@@ -0,0 +1,69 @@
+"""Retry policy for SFMC API requests."""
+
+import random
+
+from .config import ClientConfig
+from .exceptions import (
+    SFMCConnectionError,
+    SFMCError,
+    SFMCRateLimitError,
+    SFMCServerError,
+)
+
+# Methods that can be repeated without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait.
+
+    Rate limit (429) responses are retried for every method, since the
+    request was rejected before being processed. Server errors and connection
+    errors are only retried for idempotent methods.
+
+    Delays use exponential backoff with full jitter, so that many clients
+    throttled at the same moment do not retry in lockstep. A ``Retry-After``
+    value sent by the server is honoured exactly.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    @classmethod
+    def from_config(cls, config: ClientConfig) -> "RetryPolicy":
+        """Create a retry policy from the HTTP client configuration."""
+        return cls(
+            max_retries=config.max_retries,
+            backoff_factor=config.retry_backoff_factor,
+            max_backoff=config.retry_max_backoff,
+        )
+
+    def should_retry(self, method: str, error: SFMCError, attempt: int) -> bool:
+        """Check if a request that failed on the given attempt is retried.
+
+        Args:
+            method: HTTP method of the request
+            error: Error raised by the attempt
+            attempt: Number of retries already made (0 for the first call)
+        """
+        if attempt >= self.max_retries:
+            return False
+        if isinstance(error, SFMCRateLimitError):
+            return True
+        if isinstance(error, SFMCServerError | SFMCConnectionError):
+            return method.upper() in IDEMPOTENT_METHODS
+        return False
+
+    def get_delay(self, error: SFMCError, attempt: int) -> float:
+        """Get the number of seconds to wait before the next attempt."""
+        if isinstance(error, SFMCRateLimitError) and error.retry_after is not None:
+            return float(error.retry_after)
+        ceiling = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, ceiling)
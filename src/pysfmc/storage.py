@@ -0,0 +1,103 @@
+"""Local storage helpers shared by the on-disk caches and limiters."""
+
+import contextlib
+import os
+import sqlite3
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+
+class SQLiteDatabase:
+    """SQLite database file shared between threads and processes.
+
+    Each process opens its own connection (connections must not cross a
+    fork), and threads of a process take turns on it. Transactions are
+    immediate, so SQLite serializes writers across processes.
+
+    The database and its WAL and shared-memory files are only readable by
+    their owner, since they may hold access tokens or API responses.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], schema: str, timeout: float):
+        self.path = os.fspath(path)
+        self.schema = schema
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            Path(self.path).parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            _create_private_files(self.path, "-wal", "-shm")
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(self.schema)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in an immediate transaction."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the connection of this process."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+def _create_private_files(path: str, *suffixes: str) -> None:
+    """Create a file and its companions readable by their owner only.
+
+    Files that already exist are restricted to their owner, when allowed.
+    """
+    for file_path in (path, *(path + suffix for suffix in suffixes)):
+        fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if sys.platform != "win32":
+                with contextlib.suppress(PermissionError):
+                    os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def locked_file(path: str | os.PathLike[str]) -> Iterator[None]:
+    """Hold an exclusive inter-process lock on a lock file."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if sys.platform == "win32":  # pragma: no cover
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
@@ -0,0 +1,129 @@
+"""Incremental parsing of JSON list responses."""
+
+import json
+import re
+from typing import Any
+
+# Bytes that change the parser state outside JSON strings
+_STRUCTURE = re.compile(rb'["{}\[\]]')
+# Rest of a JSON string, up to its closing quote, or a backslash ending the chunk
+_STRING_BODY = re.compile(rb"[^\"\\]*(?:\\.[^\"\\]*)*", re.DOTALL)
+
+_QUOTE, _OPEN_OBJECT, _OPEN_ARRAY = b'"{['
+
+
+class JSONItemSplitter:
+    """Split the objects of a top-level array member out of a JSON stream.
+
+    Feed the chunks of a response such as ``{"count": 2, "items": [{...},
+    {...}]}`` and get the raw bytes of each item as soon as it is complete,
+    ready for ``model_validate_json``. Only the item being parsed is buffered,
+    plus the other members of the outer object, returned by ``close()``.
+    """
+
+    def __init__(self, key: str = "items"):
+        self._key = key.encode()
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._in_items = False
+        # Where the bytes being scanned go: the outer object, the current
+        # item, or nowhere (separators between items)
+        self._outer = bytearray()
+        self._item = bytearray()
+        self._target: bytearray | None = self._outer
+        self._string_start = 0
+        self._last_string = b""
+        # State of the chunk being parsed
+        self._chunk = b""
+        self._start = 0
+        self._completed: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Parse the next chunk and return the items it completes."""
+        self._chunk = chunk
+        self._start = 0
+        pos = 0
+        while pos < len(chunk):
+            if self._escape:
+                self._escape = False
+                pos += 1
+                continue
+            if self._in_string:
+                pos = _STRING_BODY.match(chunk, pos).end()
+                if pos == len(chunk):
+                    break
+                if chunk[pos] == _QUOTE:
+                    pos += 1
+                    self._on_string_end(pos)
+                else:
+                    # The chunk ends on the backslash of an escape sequence
+                    self._escape = True
+                    pos += 1
+                continue
+            match = _STRUCTURE.search(chunk, pos)
+            if match is None:
+                break
+            pos = match.end()
+            self._on_structure(chunk[match.start()], match.start())
+        self._flush(len(chunk))
+        completed, self._completed = self._completed, []
+        self._chunk = b""
+        return completed
+
+    def _flush(self, upto: int) -> None:
+        """Copy the chunk bytes scanned so far to their target."""
+        if self._target is not None:
+            self._target += self._chunk[self._start : upto]
+        self._start = upto
+
+    def _on_string_end(self, end: int) -> None:
+        self._in_string = False
+        if self._depth == 1 and not self._in_items:
+            # Remember the last key of the outer object
+            self._flush(end)
+            self._last_string = bytes(self._outer[self._string_start : -1])
+
+    def _on_structure(self, char: int, pos: int) -> None:
+        if char == _QUOTE:
+            self._in_string = True
+            if self._depth == 1 and not self._in_items:
+                self._flush(pos + 1)
+                self._string_start = len(self._outer)
+        elif char in (_OPEN_OBJECT, _OPEN_ARRAY):
+            if self._in_items and self._depth == 2:
+                # An item starts
+                self._flush(pos)
+                self._target = self._item
+            elif (
+                self._depth == 1
+                and char == _OPEN_ARRAY
+                and self._last_string == self._key
+            ):
+                self._flush(pos + 1)
+                self._in_items = True
+                self._target = None
+            self._depth += 1
+        else:
+            self._depth -= 1
+            if self._in_items and self._depth == 2:
+                # The item is complete
+                self._flush(pos + 1)
+                self._completed.append(bytes(self._item))
+                self._item.clear()
+                self._target = None
+            elif self._in_items and self._depth == 1:
+                # The array ends, keep an empty one in the outer object
+                self._flush(pos)
+                self._in_items = False
+                self._target = self._outer
+
+    def close(self) -> dict[str, Any]:
+        """Finish parsing and return the outer object, with an empty item list.
+
+        Raises:
+            ValueError: If the stream ended in the middle of the document
+        """
+        if self._depth or self._in_string:
+            raise ValueError("Incomplete JSON document")
+        return json.loads(self._outer) if self._outer.strip() else {}
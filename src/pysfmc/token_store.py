@@ -0,0 +1,194 @@
+"""Token stores for sharing SFMC access tokens across clients and processes."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from .config import AuthConfig
+from .storage import SQLiteDatabase, locked_file
+
+_DEFAULT_STORE_DIR = Path.home() / ".cache" / "pysfmc"
+
+_TOKEN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    key TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def token_cache_key(client_id: str, account_id: str) -> str:
+    """Build the store key for a client_id/account_id pair.
+
+    The key is hashed so that identifiers are not written to disk in clear.
+    """
+    return hashlib.sha256(f"{client_id}:{account_id}".encode()).hexdigest()
+
+
+class TokenStore(ABC):
+    """Abstract base class for access token stores.
+
+    Records are JSON-compatible dicts holding the token response fields and
+    an absolute ``expires_at`` timestamp (seconds since the epoch).
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Get the stored token record for a key, if any."""
+        pass
+
+    @abstractmethod
+    def save(self, key: str, record: dict[str, Any]) -> None:
+        """Store a token record, replacing any previous one."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str, access_token: str | None = None) -> None:
+        """Remove a token record.
+
+        Args:
+            key: Store key of the record
+            access_token: Only remove the record if it still holds this token,
+                so that a token refreshed by another sharer is kept
+        """
+        pass
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the store."""
+        pass
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store kept in process memory.
+
+    Share one instance between clients to reuse tokens within a process.
+    """
+
+    def __init__(self):
+        self._records: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._records.get(key)
+
+    def save(self, key: str, record: dict[str, Any]) -> None:
+        with self._lock:
+            self._records[key] = record
+
+    def delete(self, key: str, access_token: str | None = None) -> None:
+        with self._lock:
+            record = self._records.get(key)
+            if record and access_token in (None, record.get("access_token")):
+                del self._records[key]
+
+
+class FileTokenStore(TokenStore):
+    """Token store kept in a JSON file guarded by an inter-process file lock.
+
+    The file is only readable by its owner and is replaced atomically on
+    every write.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, records: dict[str, dict[str, Any]]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(records, file)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        with locked_file(self._lock_path):
+            return self._read().get(key)
+
+    def save(self, key: str, record: dict[str, Any]) -> None:
+        with locked_file(self._lock_path):
+            records = self._read()
+            now = time.time()
+            # Drop expired records of other keys while rewriting the file
+            records = {k: r for k, r in records.items() if r["expires_at"] > now}
+            records[key] = record
+            self._write(records)
+
+    def delete(self, key: str, access_token: str | None = None) -> None:
+        with locked_file(self._lock_path):
+            records = self._read()
+            record = records.get(key)
+            if record and access_token in (None, record.get("access_token")):
+                del records[key]
+                self._write(records)
+
+
+class SQLiteTokenStore(TokenStore):
+    """Token store kept in a SQLite database file."""
+
+    def __init__(self, path: str | os.PathLike[str], timeout: float = 30.0):
+        self._database = SQLiteDatabase(path, _TOKEN_SCHEMA, timeout)
+
+    @property
+    def path(self) -> str:
+        """Path of the database file."""
+        return self._database.path
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        with self._database.transaction() as connection:
+            row = connection.execute(
+                "SELECT record FROM tokens WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, record: dict[str, Any]) -> None:
+        with self._database.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO tokens (key, record, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(record), record["expires_at"]),
+            )
+            connection.execute(
+                "DELETE FROM tokens WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def delete(self, key: str, access_token: str | None = None) -> None:
+        with self._database.transaction() as connection:
+            row = connection.execute(
+                "SELECT record FROM tokens WHERE key = ?", (key,)
+            ).fetchone()
+            if row and access_token in (None, json.loads(row[0])["access_token"]):
+                connection.execute("DELETE FROM tokens WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        self._database.close()
+
+
+def create_token_store(config: AuthConfig) -> TokenStore:
+    """Create the token store described by the configuration."""
+    if config.token_store == "file":
+        return FileTokenStore(
+            config.token_store_path or _DEFAULT_STORE_DIR / "tokens.json"
+        )
+    if config.token_store == "sqlite":
+        return SQLiteTokenStore(
+            config.token_store_path or _DEFAULT_STORE_DIR / "tokens.sqlite"
+        )
+    return MemoryTokenStore()
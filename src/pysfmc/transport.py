@@ -0,0 +1,66 @@
+"""Connection pool construction for SFMC HTTP clients."""
+
+from typing import Any
+
+import httpx
+
+from .config import ClientConfig
+
+
+def pool_limits(config: ClientConfig) -> httpx.Limits:
+    """Build the connection pool limits for the REST host."""
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def auth_pool_limits(config: ClientConfig) -> httpx.Limits:
+    """Build the connection pool limits for the auth host.
+
+    Token requests are rare, so the auth pool only keeps a couple of
+    connections around instead of competing with the REST pool.
+    """
+    return httpx.Limits(
+        max_connections=config.auth_max_connections,
+        max_keepalive_connections=config.auth_max_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def http_client_options(config: ClientConfig) -> dict[str, Any]:
+    """Get httpx client keyword arguments for the REST host pool."""
+    return {
+        "timeout": config.timeout,
+        "limits": pool_limits(config),
+        "http2": config.http2,
+    }
+
+
+def auth_client_options(config: ClientConfig) -> dict[str, Any]:
+    """Get httpx client keyword arguments for the auth host pool."""
+    return {
+        "timeout": config.timeout,
+        "limits": auth_pool_limits(config),
+    }
+
+
+def build_http_client(config: ClientConfig) -> httpx.Client:
+    """Create a pooled synchronous client for the REST host."""
+    return httpx.Client(**http_client_options(config))
+
+
+def build_auth_http_client(config: ClientConfig) -> httpx.Client:
+    """Create a pooled synchronous client for the auth host."""
+    return httpx.Client(**auth_client_options(config))
+
+
+def build_async_http_client(config: ClientConfig) -> httpx.AsyncClient:
+    """Create a pooled asynchronous client for the REST host."""
+    return httpx.AsyncClient(**http_client_options(config))
+
+
+def build_async_auth_http_client(config: ClientConfig) -> httpx.AsyncClient:
+    """Create a pooled asynchronous client for the auth host."""
+    return httpx.AsyncClient(**auth_client_options(config))
@@ -0,0 +1,281 @@
+"""Tests for SFMC authentication and token refresh."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.auth import AsyncSFMCAuthenticator, SFMCAuthenticator
+from pysfmc.config import AuthConfig, RateLimitConfig
+from pysfmc.exceptions import SFMCAuthenticationError
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+class TestSingleFlightRefresh:
+    """Stress tests for concurrent token refreshes."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_concurrent_coroutines_share_one_token_request(self):
+        """Test that 200 coroutines on a new client cause one token request."""
+
+        async def slow_auth(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=AUTH_RESPONSE)
+
+        auth_route = respx.post(self.auth_url).mock(side_effect=slow_auth)
+        api_route = respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(200, json={"count": 0, "items": []})
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                await asyncio.gather(
+                    *(client.get("/asset/v1/content/categories") for _ in range(200))
+                )
+
+        asyncio.run(run())
+
+        assert auth_route.call_count == 1
+        assert api_route.call_count == 200
+
+    @respx.mock
+    def test_concurrent_threads_share_one_token_request(self):
+        """Test that threads sharing a sync client cause one token request."""
+
+        def slow_auth(request):
+            time.sleep(0.05)
+            return httpx.Response(200, json=AUTH_RESPONSE)
+
+        auth_route = respx.post(self.auth_url).mock(side_effect=slow_auth)
+        respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(200, json={"count": 0, "items": []})
+        )
+
+        with (
+            SFMCClient(settings=self.settings, config=self.config) as client,
+            ThreadPoolExecutor(max_workers=32) as executor,
+        ):
+            list(
+                executor.map(
+                    lambda _: client.get("/asset/v1/content/categories"), range(64)
+                )
+            )
+
+        assert auth_route.call_count == 1
+
+
+class TestBackgroundRefresh:
+    """Test cases for the background token refresher."""
+
+    def setup_method(self):
+        """Setup mock settings and a token that is due for renewal quickly."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        # Renewed half way through its lifetime, i.e. after one second
+        self.short_lived = {**AUTH_RESPONSE, "expires_in": 2}
+
+    @respx.mock
+    def test_sync_refresher_renews_ahead_of_expiry(self):
+        """Test that the thread renews the token without any API call."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=self.short_lived)
+        )
+        authenticator = SFMCAuthenticator(
+            self.settings, background_refresh=True, refresh_lead=1.0
+        )
+        authenticator._refresh_buffer = timedelta(0)
+
+        deadline = time.monotonic() + 5
+        while auth_route.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        thread = authenticator._refresh_thread
+        authenticator.close()
+
+        assert auth_route.call_count >= 3
+        assert not thread.is_alive()
+
+    @respx.mock
+    def test_async_refresher_renews_ahead_of_expiry(self):
+        """Test that the task renews the token and is cancelled on close."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=self.short_lived)
+        )
+
+        async def run():
+            authenticator = AsyncSFMCAuthenticator(
+                self.settings, background_refresh=True, refresh_lead=1.0
+            )
+            authenticator._refresh_buffer = timedelta(0)
+            await authenticator.get_token()
+            await asyncio.sleep(1.5)
+            task = authenticator._refresh_task
+            await authenticator.close()
+            return task
+
+        task = asyncio.run(run())
+
+        assert auth_route.call_count == 2
+        assert task.cancelled()
+
+    @respx.mock
+    def test_client_token_is_fetched_before_first_request(self):
+        """Test that the client configuration starts the refresher."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(200, json={"count": 0, "items": []})
+        )
+        config = SFMCConfig(
+            rate_limit=RateLimitConfig(enabled=False),
+            auth=AuthConfig(background_refresh=True),
+        )
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            authenticator = client._authenticator
+            deadline = time.monotonic() + 5
+            while authenticator._token is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert auth_route.call_count == 1
+
+            client.get("/asset/v1/content/categories")
+            thread = authenticator._refresh_thread
+
+        assert auth_route.call_count == 1
+        assert not thread.is_alive()
+
+
+class TestReauthentication:
+    """Test cases for the refresh and replay on 401 responses."""
+
+    def setup_method(self):
+        """Setup mock settings and a token endpoint handing out new tokens."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        self.issued = 0
+
+    def issue_token(self, request):
+        """Return a new access token on every call."""
+        self.issued += 1
+        return httpx.Response(
+            200, json={**AUTH_RESPONSE, "access_token": f"token_{self.issued}"}
+        )
+
+    @staticmethod
+    def reject_token(rejected):
+        """Build a handler answering 401 to requests made with a given token."""
+
+        def handler(request):
+            if request.headers["Authorization"] == f"Bearer {rejected}":
+                return httpx.Response(401, json={"message": "Not Authorized"})
+            return httpx.Response(200, json={"count": 0, "items": []})
+
+        return handler
+
+    @respx.mock
+    def test_revoked_token_is_refreshed_and_request_replayed(self):
+        """Test that a 401 on a cached token is invisible to the caller."""
+        auth_route = respx.post(self.auth_url).mock(side_effect=self.issue_token)
+        api_route = respx.get(CATEGORIES_URL).mock(
+            side_effect=self.reject_token("token_1")
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assert client.get("/asset/v1/content/categories") == {
+                "count": 0,
+                "items": [],
+            }
+
+        assert auth_route.call_count == 2
+        assert api_route.call_count == 2
+
+    @respx.mock
+    def test_second_401_is_raised(self):
+        """Test that a request rejected again after the refresh fails."""
+        auth_route = respx.post(self.auth_url).mock(side_effect=self.issue_token)
+        api_route = respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(401, json={"message": "Not Authorized"})
+        )
+
+        with (
+            SFMCClient(settings=self.settings, config=self.config) as client,
+            pytest.raises(SFMCAuthenticationError),
+        ):
+            client.get("/asset/v1/content/categories")
+
+        assert auth_route.call_count == 2
+        assert api_route.call_count == 2
+
+    @respx.mock
+    def test_token_endpoint_401_is_not_retried(self):
+        """Test that rejected credentials are raised without a replay."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(401, json={"message": "Invalid client"})
+        )
+
+        with (
+            SFMCClient(settings=self.settings, config=self.config) as client,
+            pytest.raises(SFMCAuthenticationError),
+        ):
+            client.get("/asset/v1/content/categories")
+
+        assert auth_route.call_count == 1
+
+    @respx.mock
+    def test_concurrent_401s_cause_one_refresh(self):
+        """Test that requests rejected with the same token share the refresh."""
+        auth_route = respx.post(self.auth_url).mock(side_effect=self.issue_token)
+        api_route = respx.get(CATEGORIES_URL).mock(
+            side_effect=self.reject_token("token_1")
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                await asyncio.gather(
+                    *(client.get("/asset/v1/content/categories") for _ in range(50))
+                )
+
+        asyncio.run(run())
+
+        assert auth_route.call_count == 2
+        assert api_route.call_count == 100
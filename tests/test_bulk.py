@@ -0,0 +1,505 @@
+"""Tests for bulk asset operations."""
+
+import asyncio
+import json
+import re
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+from pydantic import ValidationError
+
+from pysfmc import (
+    AssetTypeCreate,
+    AsyncSFMCClient,
+    CreateAsset,
+    SFMCClient,
+    SFMCConfig,
+    SFMCSettings,
+)
+from pysfmc.assets.bulk import amap_concurrently, map_in_threads
+from pysfmc.config import RateLimitConfig
+from pysfmc.exceptions import SFMCError
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+def make_asset(asset_id):
+    """Build a minimal asset."""
+    return {"id": asset_id, "name": f"Asset {asset_id}", "customerKey": f"k-{asset_id}"}
+
+
+def filtered(existing, packed=True):
+    """Build a handler answering ``eq`` filters, optionally packed with ``or``.
+
+    Without ``packed``, filters with several clauses are rejected with a 400.
+    """
+
+    def handler(request):
+        expression = request.url.params["$filter"]
+        clauses = expression.split(" or ")
+        if len(clauses) > 1 and not packed:
+            return httpx.Response(400, json={"message": "Invalid filter"})
+        items = []
+        for clause in clauses:
+            field, value = re.fullmatch(r"(\w+) eq (.+)", clause).groups()
+            for asset in existing:
+                expected = asset[field]
+                if isinstance(expected, str):
+                    expected = "'" + expected.replace("'", "''") + "'"
+                if str(expected) == value:
+                    items.append(asset)
+        return httpx.Response(
+            200, json={"count": len(items), "page": 1, "pageSize": 50, "items": items}
+        )
+
+    return handler
+
+
+class TestBoundedMap:
+    """Test cases for the bounded concurrency helpers."""
+
+    def test_map_in_threads_bounds_pending_calls(self):
+        """Test that inputs are pulled lazily and calls never exceed the cap."""
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        pulled = []
+
+        def items():
+            for i in range(20):
+                pulled.append(i)
+                yield i
+
+        def call(i):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            if i == 7:
+                raise ValueError("boom")
+            return i * 2
+
+        results = map_in_threads(call, items(), max_workers=4)
+        first = next(results)
+        assert len(pulled) < 10
+        outcomes = dict([first, *results])
+
+        assert peak <= 4
+        assert sorted(outcomes) == list(range(20))
+        with pytest.raises(ValueError, match="boom"):
+            outcomes[7].result()
+        assert outcomes[3].result() == 6
+
+    def test_amap_concurrently_bounds_pending_calls(self):
+        """Test the async version."""
+        running = 0
+        peak = 0
+
+        async def call(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return i * 2
+
+        async def run():
+            return {
+                item: task.result()
+                async for item, task in amap_concurrently(call, range(20), 4)
+            }
+
+        assert asyncio.run(run()) == {i: i * 2 for i in range(20)}
+        assert peak <= 4
+
+
+class TestBatchGet:
+    """Test cases for getting many assets by ID or customer key."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_get_assets_by_ids_packs_filters(self):
+        """Test that IDs are fetched in chunks, missing ones mapped to None."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        existing = [make_asset(i) for i in range(1, 101)]
+        route = respx.get(ASSETS_URL).mock(side_effect=filtered(existing))
+
+        ids = [120, *range(1, 111), 5]
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assets = client.assets.query.get_assets_by_ids(ids, chunk_size=50)
+
+        assert list(assets) == [120, *range(1, 111)]
+        assert assets[42].name == "Asset 42"
+        assert assets[120] is None
+        assert assets[105] is None
+        assert route.call_count == 3
+        chunks = [[120, *range(1, 50)], range(50, 100), range(100, 111)]
+        assert {call.request.url.params["$filter"] for call in route.calls} == {
+            " or ".join(f"id eq {i}" for i in chunk) for chunk in chunks
+        }
+
+    @respx.mock
+    def test_rejected_packed_filter_falls_back_to_single_gets(self):
+        """Test that a 400 on a packed filter switches to one request per ID."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        list_route = respx.get(ASSETS_URL).mock(
+            side_effect=filtered([make_asset(1)], packed=False)
+        )
+        respx.get(f"{ASSETS_URL}/1").mock(
+            return_value=httpx.Response(200, json=make_asset(1))
+        )
+        single_route = respx.get(url__regex=rf"{ASSETS_URL}/\d+$").mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            query = client.assets.query
+            assets = query.get_assets_by_ids([1, 2, 3], chunk_size=2, max_workers=1)
+            again = query.get_assets_by_ids([2, 3])
+
+        assert assets == {1: assets[1], 2: None, 3: None}
+        assert assets[1].name == "Asset 1"
+        assert again == {2: None, 3: None}
+        # After the first rejection, packed filters are not tried again
+        assert list_route.call_count == 1
+        assert single_route.call_count == 4
+
+    @respx.mock
+    def test_async_get_assets_by_customer_keys(self):
+        """Test the async version with keys that need quoting."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        existing = [make_asset(1), {**make_asset(2), "customerKey": "o'brien"}]
+        route = respx.get(ASSETS_URL).mock(side_effect=filtered(existing))
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return await client.assets.query.get_assets_by_customer_keys(
+                    ["o'brien", "k-1", "missing"]
+                )
+
+        assets = asyncio.run(run())
+
+        assert [asset and asset.id for asset in assets.values()] == [2, 1, None]
+        assert route.calls.last.request.url.params["$filter"] == (
+            "customerKey eq 'o''brien' or customerKey eq 'k-1'"
+            " or customerKey eq 'missing'"
+        )
+
+
+def creating():
+    """Build a handler creating assets, rejecting those named 'bad'.
+
+    The first request is throttled, to check that bulk creations are retried.
+    """
+    created = []
+
+    def handler(request):
+        spec = json.loads(request.content)
+        if not created:
+            created.append(None)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if spec["name"] == "bad":
+            return httpx.Response(400, json={"message": "Invalid asset"})
+        created.append(spec["name"])
+        return httpx.Response(201, json={"id": len(created), **spec})
+
+    return handler
+
+
+class TestBulkCreate:
+    """Test cases for creating many assets concurrently."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        html_email = {"name": "htmlemail", "id": 208}
+        self.specs = [
+            CreateAsset(name="Email 0", asset_type=AssetTypeCreate(**html_email)),
+            {"name": "Email 1", "asset_type": html_email},
+            {"name": "bad", "asset_type": html_email},
+            {"asset_type": html_email},
+            {"name": "Email 4", "assetType": html_email, "customerKey": "e4"},
+        ]
+
+    @respx.mock
+    def test_create_assets_reports_each_item(self):
+        """Test that failures are reported without stopping the other items."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.post(ASSETS_URL).mock(side_effect=creating())
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            results = sorted(
+                client.assets.content.create_assets(iter(self.specs), max_workers=3),
+                key=lambda result: result.index,
+            )
+
+        assert [result.ok for result in results] == [True, True, False, False, True]
+        assert results[1].item is self.specs[1]
+        assert results[4].result.name == "Email 4"
+        assert results[4].result.customer_key == "e4"
+        assert isinstance(results[2].error, SFMCError)
+        assert results[2].error.status_code == 400
+        assert isinstance(results[3].error, ValidationError)
+        # 4 valid specs, one of them retried after a 429
+        assert route.call_count == 5
+
+    @respx.mock
+    def test_async_create_assets(self):
+        """Test the async version."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.post(ASSETS_URL).mock(side_effect=creating())
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return await client.assets.content.create_assets(
+                    self.specs, concurrency=2
+                )
+
+        results = sorted(asyncio.run(run()), key=lambda result: result.index)
+
+        assert [result.ok for result in results] == [True, True, False, False, True]
+        assert {result.result.name for result in results if result.ok} == {
+            "Email 0",
+            "Email 1",
+            "Email 4",
+        }
+
+    @respx.mock
+    def test_iter_variants_are_lazy(self):
+        """Test that nothing is sent until results of the iter variants are read."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.post(ASSETS_URL).mock(side_effect=creating())
+        respx.delete(url__startswith=ASSETS_URL).mock(
+            return_value=httpx.Response(200, json="OK")
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            content = client.assets.content
+            pending = content.iter_create_assets(self.specs[:2])
+            assert route.call_count == 0
+            created = list(pending)
+            deleted = content.delete_assets([1, 2, 3])
+
+        assert [result.ok for result in created] == [True, True]
+        assert isinstance(deleted, list)
+        assert sorted(result.item for result in deleted if result.ok) == [1, 2, 3]
+
+    @respx.mock
+    def test_async_delete_assets(self):
+        """Test that the async deletions are done when the list is returned."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.delete(url__startswith=ASSETS_URL).mock(
+            return_value=httpx.Response(200, json="OK")
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                content = client.assets.content
+                pending = content.iter_delete_assets([4])
+                sent_before = route.call_count
+                results = await content.delete_assets([1, 2, 3], concurrency=2)
+                await pending.aclose()
+                return sent_before, results
+
+        sent_before, results = asyncio.run(run())
+
+        assert sent_before == 0
+        assert sorted(result.item for result in results) == [1, 2, 3]
+        assert all(result.ok for result in results)
+        assert route.call_count == 3
+
+
+class FolderTree:
+    """Stand-in for the category and asset endpoints of a folder tree.
+
+    Root 1 holds folders 2 and 3, folder 2 holds folder 4. Deleting an asset
+    listed in ``failing`` is forbidden.
+    """
+
+    parents = {1: 0, 2: 1, 3: 1, 4: 2}
+    assets = {1: [101], 2: [102, 103], 3: [], 4: [104]}
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.deleted = []
+
+    def category(self, category_id):
+        return {
+            "id": category_id,
+            "name": f"Folder {category_id}",
+            "parentId": self.parents[category_id],
+        }
+
+    def mock(self):
+        """Register the routes on the active respx router."""
+        respx.get(url__regex=rf"{CATEGORIES_URL}/\d+$").mock(
+            side_effect=lambda request: httpx.Response(
+                200, json=self.category(int(request.url.path.rsplit("/", 1)[1]))
+            )
+        )
+        respx.get(CATEGORIES_URL).mock(side_effect=self.children)
+        respx.get(ASSETS_URL).mock(side_effect=self.assets_of)
+        respx.delete(url__regex=rf"{ASSETS_URL}/\d+$").mock(side_effect=self.delete)
+        respx.delete(url__regex=rf"{CATEGORIES_URL}/\d+$").mock(side_effect=self.delete)
+
+    def children(self, request):
+        parent_id = int(request.url.params["$filter"].removeprefix("parentId eq "))
+        items = [
+            self.category(category_id)
+            for category_id, parent in self.parents.items()
+            if parent == parent_id
+        ]
+        return httpx.Response(
+            200, json={"count": len(items), "page": 1, "pageSize": 50, "items": items}
+        )
+
+    def assets_of(self, request):
+        category_id = int(request.url.params["$filter"].removeprefix("category.id eq "))
+        items = [{"id": asset_id} for asset_id in self.assets[category_id]]
+        return httpx.Response(
+            200, json={"count": len(items), "page": 1, "pageSize": 50, "items": items}
+        )
+
+    def delete(self, request):
+        kind, object_id = request.url.path.rsplit("/", 2)[1:]
+        if int(object_id) in self.failing:
+            return httpx.Response(403, json={"message": "Forbidden"})
+        self.deleted.append((kind, int(object_id)))
+        return httpx.Response(200, json="OK")
+
+
+class TestCategoryTreeDeletion:
+    """Test cases for deleting a category subtree."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_dry_run_only_discovers_the_subtree(self):
+        """Test that a dry run lists categories and assets without deleting."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        tree = FolderTree()
+        tree.mock()
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            deletion = client.assets.categories.delete_category_tree(1, dry_run=True)
+
+        assert [[category.id for category in level] for level in deletion.levels] == [
+            [1],
+            [2, 3],
+            [4],
+        ]
+        assert sorted(deletion.all_asset_ids) == [101, 102, 103, 104]
+        assert deletion.asset_ids[3] == []
+        assert not deletion.ok
+        assert tree.deleted == []
+
+    @respx.mock
+    def test_failed_asset_keeps_its_ancestors(self):
+        """Test that folders left non-empty by a failure are not attempted."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        tree = FolderTree(failing={103})
+        tree.mock()
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            deletion = client.assets.categories.delete_category_tree(1, max_workers=2)
+
+        deleted_assets = sorted(i for kind, i in tree.deleted if kind == "assets")
+        deleted_folders = [i for kind, i in tree.deleted if kind == "categories"]
+        assert deleted_assets == [101, 102, 104]
+        # Leaves first, folder 2 still holds asset 103 and the root holds 2
+        assert deleted_folders[0] == 4
+        assert sorted(deleted_folders) == [3, 4]
+        failed = {r.item.id: r.error for r in deletion.category_results if not r.ok}
+        assert set(failed) == {1, 2}
+        assert "not empty" in str(failed[2])
+        assert not deletion.ok
+
+    @respx.mock
+    def test_async_delete_category_tree(self):
+        """Test the async version."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        tree = FolderTree()
+        tree.mock()
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return await client.assets.categories.delete_category_tree(
+                    1, concurrency=3
+                )
+
+        deletion = asyncio.run(run())
+
+        assert deletion.ok
+        folders = [i for kind, i in tree.deleted if kind == "categories"]
+        assert folders[0] == 4
+        assert folders[-1] == 1
+        assert len(tree.deleted) == 8
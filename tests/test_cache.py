@@ -0,0 +1,700 @@
+"""Tests for response caching."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.cache import (
+    SQLiteResponseCache,
+    TTLCache,
+    VersionedCache,
+    response_cache_key,
+)
+from pysfmc.config import CacheConfig, RateLimitConfig
+from pysfmc.exceptions import SFMCNotFoundError
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for the LRU cache with expiry."""
+
+    def setup_method(self):
+        """Create a cache on a fake clock."""
+        self.clock = FakeClock()
+        self.cache = TTLCache(3, ttl=10, clock=self.clock)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the entry used the longest ago is evicted when full."""
+        for key in "abc":
+            self.cache.set(key, key.upper())
+        assert self.cache.get("a") == "A"
+
+        self.cache.set("d", "D")
+
+        assert len(self.cache) == 3
+        assert self.cache.get("b") is None
+        assert [self.cache.get(key) for key in "acd"] == ["A", "C", "D"]
+        assert (self.cache.hits, self.cache.misses) == (4, 1)
+
+    def test_entries_expire(self):
+        """Test the default and per-entry time to live."""
+        self.cache.set("short", 1)
+        self.cache.set("long", 2, ttl=60)
+
+        self.clock.now = 9.9
+        assert self.cache.get("short") == 1
+        self.clock.now = 10
+        assert self.cache.get("short") is None
+        assert self.cache.get("long") == 2
+        assert len(self.cache) == 1
+
+        self.clock.now = 60
+        assert self.cache.get("long") is None
+
+    def test_removal(self):
+        """Test removing entries by key and by predicate."""
+        self.cache.set(("id", 1), "one")
+        self.cache.set(("page", 1), "first")
+        self.cache.set(("page", 2), "second")
+
+        assert self.cache.discard_if(lambda key: key[0] == "page") == 2
+        assert self.cache.pop(("id", 1)) == "one"
+        assert self.cache.pop(("id", 1)) is None
+        assert len(self.cache) == 0
+
+        with pytest.raises(ValueError):
+            TTLCache(0)
+
+
+class TestVersionedCache:
+    """Test cases for the cache of versioned values."""
+
+    def setup_method(self):
+        """Create a fake clock."""
+        self.clock = FakeClock()
+
+    def test_revalidation_modes(self):
+        """Test how entries are reported before and after their TTL."""
+        states = {}
+        for mode in ("always", "ttl", "stale-while-revalidate"):
+            self.clock.now = 0
+            cache = VersionedCache(10, mode, ttl=5, clock=self.clock)
+            cache.store(1, "template", version=3)
+            before = cache.lookup(1)[1]
+            self.clock.now = 5
+            states[mode] = (before, cache.lookup(1)[1], cache.lookup(2)[1])
+
+        assert states == {
+            "always": ("expired", "expired", "miss"),
+            "ttl": ("fresh", "expired", "miss"),
+            "stale-while-revalidate": ("fresh", "stale", "miss"),
+        }
+
+    def test_confirm_version(self):
+        """Test that only an unchanged version restarts the TTL."""
+        cache = VersionedCache(10, "ttl", ttl=5, clock=self.clock)
+        cache.store(1, "template", version=(3, "2026-01-01"))
+        self.clock.now = 6
+
+        assert cache.confirm(1, (4, "2026-02-01")) is None
+        assert cache.lookup(1) == ("template", "expired")
+        assert cache.confirm(1, (3, "2026-01-01")) == "template"
+        assert cache.lookup(1) == ("template", "fresh")
+        assert cache.confirm(2, 1) is None
+
+    def test_single_refresh_claim(self):
+        """Test that an entry is refreshed by one caller at a time."""
+        cache = VersionedCache(10)
+
+        assert cache.claim_refresh(1)
+        assert not cache.claim_refresh(1)
+        cache.release_refresh(1)
+        assert cache.claim_refresh(1)
+
+
+class TestCategoryCache:
+    """Test cases for the categories clients' cache."""
+
+    def setup_method(self):
+        """Setup mock settings with the category cache enabled."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(
+            rate_limit=RateLimitConfig(enabled=False),
+            cache=CacheConfig(categories=True),
+        )
+
+    def mock_api(self):
+        """Mock the token and category endpoints."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        page = respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "count": 2,
+                    "page": 1,
+                    "pageSize": 50,
+                    "items": [
+                        {"id": 2, "name": "Campaigns", "parentId": 1},
+                        {"id": 3, "name": "Templates", "parentId": 1},
+                    ],
+                },
+            )
+        )
+        by_id = respx.get(f"{CATEGORIES_URL}/5").mock(
+            return_value=httpx.Response(
+                200, json={"id": 5, "name": "Drafts", "parentId": 1}
+            )
+        )
+        respx.post(CATEGORIES_URL).mock(
+            return_value=httpx.Response(
+                201, json={"id": 6, "name": "New", "parentId": 1}
+            )
+        )
+        respx.delete(f"{CATEGORIES_URL}/2").mock(
+            return_value=httpx.Response(200, json="OK")
+        )
+        return page, by_id
+
+    @respx.mock
+    def test_reads_are_cached(self):
+        """Test that pages and categories are fetched once, pages warming IDs."""
+        page, by_id = self.mock_api()
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            categories = client.assets.categories
+            first = categories.get_categories(parent_id=1)
+            second = categories.get_categories(parent_id=1)
+            campaigns = categories.get_category_by_id(2)
+            drafts = [categories.get_category_by_id(5) for _ in range(3)]
+            categories.get_categories(parent_id=1, page_size=10)
+
+        assert second is first
+        assert campaigns is first.items[0]
+        assert drafts[0] is drafts[2]
+        assert page.call_count == 2
+        assert by_id.call_count == 1
+
+    @respx.mock
+    def test_writes_update_cache(self):
+        """Test that creations and deletions write through to the cache."""
+        page, _ = self.mock_api()
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            categories = client.assets.categories
+            categories.get_categories(parent_id=1)
+            created = categories.create_category("New", parent_id=1)
+            assert categories.get_category_by_id(6) is created
+            categories.get_categories(parent_id=1)
+            deleted = respx.get(f"{CATEGORIES_URL}/2").mock(
+                return_value=httpx.Response(404, json={"message": "Not found"})
+            )
+            categories.delete_category_by_id(2)
+            with pytest.raises(SFMCNotFoundError):
+                categories.get_category_by_id(2)
+            categories.get_categories(parent_id=1)
+
+        assert page.call_count == 3
+        assert deleted.call_count == 1
+
+    @respx.mock
+    def test_cache_is_opt_in(self):
+        """Test that nothing is cached with the default configuration."""
+        _, by_id = self.mock_api()
+        config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            client.assets.categories.get_category_by_id(5)
+            client.assets.categories.get_category_by_id(5)
+
+        assert by_id.call_count == 2
+
+    @respx.mock
+    def test_async_cache(self):
+        """Test the async client's cache and write-through."""
+        page, by_id = self.mock_api()
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                categories = client.assets.categories
+                await categories.get_category_by_id(5)
+                await categories.get_category_by_id(5)
+                await categories.get_categories(parent_id=1)
+                created = await categories.create_category("New", parent_id=1)
+                await categories.get_categories(parent_id=1)
+                return created, await categories.get_category_by_id(6)
+
+        created, cached = asyncio.run(run())
+
+        assert cached is created
+        assert by_id.call_count == 1
+        assert page.call_count == 2
+
+
+class TestAssetCache:
+    """Test cases for the query clients' asset cache."""
+
+    def setup_method(self):
+        """Setup mock settings and a stand-in for the asset endpoints."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.version = 1
+
+    def make_config(self, revalidation, ttl=0.0):
+        """Build a configuration with the asset cache enabled."""
+        return SFMCConfig(
+            rate_limit=RateLimitConfig(enabled=False),
+            cache=CacheConfig(
+                assets=True, assets_revalidation=revalidation, assets_ttl=ttl
+            ),
+        )
+
+    def current(self):
+        """Fields of the current version of the asset."""
+        return {
+            "id": 7,
+            "version": self.version,
+            "modifiedDate": f"2026-10-0{self.version}T00:00:00",
+        }
+
+    def mock_api(self):
+        """Mock the token, asset and version check endpoints."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        full = respx.get(f"{ASSETS_URL}/7").mock(
+            side_effect=lambda request: httpx.Response(
+                200,
+                json={**self.current(), "name": "Template", "content": "<p>Hi</p>"},
+            )
+        )
+        checks = respx.get(ASSETS_URL).mock(
+            side_effect=lambda request: httpx.Response(
+                200,
+                json={"count": 1, "page": 1, "pageSize": 1, "items": [self.current()]},
+            )
+        )
+        respx.delete(f"{ASSETS_URL}/7").mock(
+            return_value=httpx.Response(200, json="OK")
+        )
+        return full, checks
+
+    @respx.mock
+    def test_ttl_serves_cached_asset(self):
+        """Test that a cached asset is served without requests within its TTL."""
+        full, checks = self.mock_api()
+
+        with SFMCClient(
+            settings=self.settings, config=self.make_config("ttl", ttl=60)
+        ) as client:
+            assets = [client.assets.query.get_asset_by_id(7) for _ in range(3)]
+            client.assets.content.delete_asset(7)
+            after_delete = client.assets.query.get_asset_by_id(7)
+
+        assert assets[0] is assets[2]
+        assert after_delete is not assets[0]
+        assert full.call_count == 2
+        assert not checks.called
+
+    @respx.mock
+    def test_always_checks_version(self):
+        """Test that every read checks the version, refetching changed assets."""
+        full, checks = self.mock_api()
+
+        with SFMCClient(
+            settings=self.settings, config=self.make_config("always", ttl=60)
+        ) as client:
+            query = client.assets.query
+            first = query.get_asset_by_id(7)
+            second = query.get_asset_by_id(7)
+            self.version = 2
+            third = query.get_asset_by_id(7)
+
+        assert second is first
+        assert third.version == 2
+        assert full.call_count == 2
+        assert checks.call_count == 2
+        assert checks.calls[0].request.url.params["$filter"] == "id eq 7"
+        assert checks.calls[0].request.url.params["$fields"] == (
+            "id,version,modifiedDate"
+        )
+
+    @respx.mock
+    def test_version_checks_skip_disk_cache(self, tmp_path):
+        """Test that version checks and refetches bypass the disk cache."""
+        full, checks = self.mock_api()
+        config = self.make_config("always", ttl=60)
+        config.cache.disk = True
+        config.cache.disk_path = str(tmp_path / "cache.sqlite")
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            query = client.assets.query
+            first = query.get_asset_by_id(7)
+            self.version = 2
+            second = query.get_asset_by_id(7)
+
+        assert first.version == 1
+        assert second.version == 2
+        assert full.call_count == 2
+        assert checks.call_count == 1
+
+    @respx.mock
+    def test_stale_while_revalidate(self):
+        """Test that a stale asset is served while it refreshes in background."""
+        full, checks = self.mock_api()
+
+        with SFMCClient(
+            settings=self.settings,
+            config=self.make_config("stale-while-revalidate", ttl=0.2),
+        ) as client:
+            query = client.assets.query
+            query.get_asset_by_id(7)
+            self.version = 2
+            time.sleep(0.25)
+            stale = query.get_asset_by_id(7)
+            query.close()
+            fresh = query.get_asset_by_id(7)
+
+        assert stale.version == 1
+        assert fresh.version == 2
+        assert full.call_count == 2
+        assert checks.call_count == 1
+
+    @respx.mock
+    def test_background_refreshes_are_bounded(self):
+        """Test that refreshes share a few threads, stopped by close()."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(url__regex=rf"{ASSETS_URL}/\d+").mock(
+            side_effect=lambda request: httpx.Response(
+                200, json={"id": int(request.url.path.rsplit("/", 1)[1])}
+            )
+        )
+
+        def slow_check(request):
+            time.sleep(0.05)
+            return httpx.Response(
+                200, json={"count": 0, "page": 1, "pageSize": 1, "items": []}
+            )
+
+        checks = respx.get(ASSETS_URL).mock(side_effect=slow_check)
+
+        def refresh_threads():
+            return [
+                thread
+                for thread in threading.enumerate()
+                if thread.name.startswith("pysfmc-asset-refresh")
+            ]
+
+        with SFMCClient(
+            settings=self.settings,
+            config=self.make_config("stale-while-revalidate", ttl=0.2),
+        ) as client:
+            query = client.assets.query
+            for asset_id in range(20):
+                query.get_asset_by_id(asset_id)
+            time.sleep(0.25)
+            for asset_id in range(20):
+                query.get_asset_by_id(asset_id)
+            running = len(refresh_threads())
+
+        assert 0 < running <= 4
+        assert refresh_threads() == []
+        # Refreshes still queued at close are dropped
+        assert checks.call_count < 20
+
+    @respx.mock
+    def test_async_stale_while_revalidate(self):
+        """Test the async client's background refresh and eviction."""
+        full, checks = self.mock_api()
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings,
+                config=self.make_config("stale-while-revalidate", ttl=0.2),
+            ) as client:
+                query = client.assets.query
+                await query.get_asset_by_id(7)
+                self.version = 2
+                await asyncio.sleep(0.25)
+                stale = await query.get_asset_by_id(7)
+                await asyncio.gather(*query._refresh_tasks)
+                fresh = await query.get_asset_by_id(7)
+                await client.assets.content.delete_asset(7)
+                await query.get_asset_by_id(7)
+                return stale, fresh
+
+        stale, fresh = asyncio.run(run())
+
+        assert stale.version == 1
+        assert fresh.version == 2
+        assert full.call_count == 3
+        assert checks.call_count == 1
+
+    @respx.mock
+    def test_no_refresh_after_close(self):
+        """Test that a closed client serves stale assets without refreshing."""
+        full, checks = self.mock_api()
+
+        with SFMCClient(
+            settings=self.settings,
+            config=self.make_config("stale-while-revalidate", ttl=0.2),
+        ) as client:
+            query = client.assets.query
+            query.get_asset_by_id(7)
+        time.sleep(0.25)
+        stale = query.get_asset_by_id(7)
+
+        assert stale.version == 1
+        assert query._refresh_executor is None
+        assert full.call_count == 1
+        assert checks.call_count == 0
+
+    @respx.mock
+    def test_async_close_cancels_refresh(self, caplog):
+        """Test that closing the async client cancels pending refreshes."""
+        full, _ = self.mock_api()
+        started = asyncio.Event()
+
+        async def slow_check(request):
+            started.set()
+            await asyncio.sleep(10)
+
+        respx.get(ASSETS_URL).mock(side_effect=slow_check)
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings,
+                config=self.make_config("stale-while-revalidate", ttl=0.2),
+            ) as client:
+                query = client.assets.query
+                await query.get_asset_by_id(7)
+                await asyncio.sleep(0.25)
+                await query.get_asset_by_id(7)
+                tasks = set(query._refresh_tasks)
+                await started.wait()
+            cancelled = [task.cancelled() for task in tasks]
+            stale = await query.get_asset_by_id(7)
+            return query, cancelled, stale
+
+        query, cancelled, stale = asyncio.run(run())
+
+        assert cancelled == [True]
+        assert query._refresh_tasks == set()
+        assert query._asset_cache.claim_refresh(7)
+        assert stale.version == 1
+        assert full.call_count == 1
+        assert started.is_set()
+        assert "Background refresh" not in caplog.text
+
+
+class TestSQLiteResponseCache:
+    """Test cases for the on-disk response cache."""
+
+    def setup_method(self):
+        """Create a fake wall clock."""
+        self.clock = FakeClock()
+        self.clock.now = 1_700_000_000.0
+
+    def open(self, path, **kwargs):
+        """Open a cache file on the fake clock."""
+        return SQLiteResponseCache(path, clock=self.clock, **kwargs)
+
+    def test_bodies_persist_compressed(self, tmp_path):
+        """Test that bodies survive reopening the file, compressed."""
+        path = tmp_path / "responses.sqlite"
+        body = b'{"items": [' + b'{"name": "Template"},' * 1000 + b"{}]}"
+        cache = self.open(path)
+        cache.set("tenant", "/asset/v1/content/assets", {"$page": 1}, body)
+        cache.close()
+
+        reopened = self.open(path)
+        assert (
+            reopened.get("tenant", "asset/v1/content/assets/", {"$page": "1"}) == body
+        )
+        assert reopened.get("tenant", "/asset/v1/content/assets", {"$page": 2}) is None
+        assert reopened.get("other", "/asset/v1/content/assets", {"$page": 1}) is None
+        with reopened._database.transaction() as connection:
+            (size,) = connection.execute("SELECT size FROM responses").fetchone()
+        assert size < len(body) / 10
+        reopened.close()
+
+    def test_params_are_normalized(self):
+        """Test that equivalent parameters share a key."""
+        key = response_cache_key(
+            "GET", "tenant", "/assets", {"$page": 1, "$fields": None, "flag": True}
+        )
+
+        assert key == response_cache_key(
+            "get", "tenant", "assets", {"flag": "true", "$page": "1"}
+        )
+        assert key != response_cache_key("GET", "tenant", "/assets", {"$page": 2})
+        assert key != response_cache_key("POST", "tenant", "/assets", {"$page": 1})
+
+    def test_entries_expire(self, tmp_path):
+        """Test the time to live of the entries."""
+        cache = self.open(tmp_path / "responses.sqlite", ttl=60)
+        cache.set("tenant", "/a", None, b"body")
+
+        self.clock.now += 59
+        assert cache.get("tenant", "/a") == b"body"
+        self.clock.now += 1
+        assert cache.get("tenant", "/a") is None
+        cache.close()
+
+    def test_evicts_least_recently_read(self, tmp_path):
+        """Test that entries beyond the size limit are evicted, oldest first."""
+        cache = self.open(tmp_path / "responses.sqlite", max_bytes=100)
+        # Incompressible bodies of about 40 bytes once compressed
+        bodies = {name: bytes(range(i, i + 30)) for i, name in enumerate("abc")}
+        for name in "ab":
+            self.clock.now += 1
+            cache.set("tenant", f"/{name}", None, bodies[name])
+        self.clock.now += 1
+        assert cache.get("tenant", "/a") == bodies["a"]
+
+        self.clock.now += 1
+        cache.set("tenant", "/c", None, bodies["c"])
+
+        assert cache.get("tenant", "/b") is None
+        assert cache.get("tenant", "/a") == bodies["a"]
+        assert cache.get("tenant", "/c") == bodies["c"]
+        cache.close()
+
+    def test_invalidate(self, tmp_path):
+        """Test that a write drops its resource, subresources and collection."""
+        cache = self.open(tmp_path / "responses.sqlite")
+        endpoints = [
+            "/asset/v1/content/assets",
+            "/asset/v1/content/assets/7",
+            "/asset/v1/content/assets/7/file",
+            "/asset/v1/content/assets/70",
+            "/asset/v1/content/categories",
+        ]
+        for endpoint in endpoints:
+            cache.set("tenant", endpoint, None, b"body")
+            cache.set("other", endpoint, None, b"body")
+
+        assert cache.invalidate("tenant", "/asset/v1/content/assets/7") == 3
+
+        assert [cache.get("tenant", endpoint) for endpoint in endpoints] == [
+            None,
+            None,
+            None,
+            b"body",
+            b"body",
+        ]
+        assert cache.get("other", "/asset/v1/content/assets/7") == b"body"
+        cache.close()
+
+
+class TestClientResponseCache:
+    """Test cases for the clients' disk response cache."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+
+    def make_config(self, tmp_path):
+        """Build a configuration with the disk cache enabled."""
+        return SFMCConfig(
+            rate_limit=RateLimitConfig(enabled=False),
+            cache=CacheConfig(disk=True, disk_path=str(tmp_path / "cache.sqlite")),
+        )
+
+    def mock_api(self):
+        """Mock the token and asset endpoints."""
+        token = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        asset = respx.get(f"{ASSETS_URL}/7").mock(
+            return_value=httpx.Response(200, json={"id": 7, "name": "Template"})
+        )
+        respx.delete(f"{ASSETS_URL}/7").mock(
+            return_value=httpx.Response(200, json="OK")
+        )
+        return token, asset
+
+    @respx.mock
+    def test_restarted_client_reads_from_disk(self, tmp_path):
+        """Test that a new client answers cached GETs without any request."""
+        token, asset = self.mock_api()
+        config = self.make_config(tmp_path)
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            first = client.assets.query.get_asset_by_id(7)
+            assert client.get("/asset/v1/content/assets/7") == {
+                "id": 7,
+                "name": "Template",
+            }
+        with SFMCClient(settings=self.settings, config=config) as client:
+            second = client.assets.query.get_asset_by_id(7)
+            client.assets.content.delete_asset(7)
+            client.assets.query.get_asset_by_id(7)
+
+        assert second == first
+        assert asset.call_count == 2
+        assert token.call_count == 2
+
+    @respx.mock
+    def test_async_client_shares_cache_file(self, tmp_path):
+        """Test that the async client reads what the sync client cached."""
+        token, asset = self.mock_api()
+        config = self.make_config(tmp_path)
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            client.assets.query.get_asset_by_id(7)
+
+        async def run():
+            async with AsyncSFMCClient(settings=self.settings, config=config) as client:
+                return await client.assets.query.get_asset_by_id(7)
+
+        assert asyncio.run(run()).name == "Template"
+        assert asset.call_count == 1
+        assert token.call_count == 1
@@ -0,0 +1,362 @@
+"""Tests for the category hierarchy index."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.assets import CategoryTree
+from pysfmc.config import CacheConfig, RateLimitConfig
+from pysfmc.exceptions import SFMCAuthorizationError, SFMCNotFoundError
+from pysfmc.models.assets import Category
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+# Two roots: 1 'Content Builder' > 2 'Campaigns' > 4 '2026' > 6 'Q4',
+# 2 > 5 '2025', 1 > 3 'Templates', and 7 'Shared Content'
+FOLDERS = [
+    (1, "Content Builder", 0),
+    (2, "Campaigns", 1),
+    (3, "Templates", 1),
+    (4, "2026", 2),
+    (5, "2025", 2),
+    (6, "Q4", 4),
+    (7, "Shared Content", 0),
+]
+
+
+def make_categories():
+    """Build the categories of ``FOLDERS``, children listed before parents."""
+    return [
+        Category(id=category_id, name=name, parent_id=parent_id)
+        for category_id, name, parent_id in reversed(FOLDERS)
+    ]
+
+
+class TestCategoryTree:
+    """Test cases for lookups in the index."""
+
+    def setup_method(self):
+        """Build the index."""
+        self.tree = CategoryTree(make_categories())
+
+    def test_lookups(self):
+        """Test lookups by ID and path, parents, children and depths."""
+        tree = self.tree
+
+        assert len(tree) == 7
+        assert 6 in tree
+        assert 99 not in tree
+        assert tree[6].name == "Q4"
+        assert tree.get(99) is None
+        assert [root.id for root in tree.roots] == [7, 1]
+        assert tree.path(6) == "Content Builder/Campaigns/2026/Q4"
+        assert tree.find("Content Builder/Campaigns/2026/Q4").id == 6
+        assert tree.find("/Content Builder/Templates/").id == 3
+        assert tree.find(["Shared Content"]).id == 7
+        assert tree.find("Content Builder/Q4") is None
+        assert tree.parent(4).id == 2
+        assert tree.parent(1) is None
+        assert sorted(child.id for child in tree.children(2)) == [4, 5]
+        assert tree.children(6) == []
+        assert tree.depth(1) == 0
+        assert tree.depth(6) == 3
+        with pytest.raises(KeyError):
+            tree.depth(99)
+
+    def test_iteration_order(self):
+        """Test that parents come before their children."""
+        seen = set()
+        for category in self.tree:
+            assert category.parent_id == 0 or category.parent_id in seen
+            seen.add(category.id)
+
+        assert sorted(category.id for category in self.tree.descendants(2)) == [
+            4,
+            5,
+            6,
+        ]
+        assert [category.id for category in self.tree.descendants(7)] == []
+
+    def test_subtree_roots(self):
+        """Test that categories whose parent is missing become roots."""
+        tree = CategoryTree(
+            category for category in make_categories() if category.id in (2, 4, 6)
+        )
+
+        assert [root.id for root in tree.roots] == [2]
+        assert tree.path(6) == "Campaigns/2026/Q4"
+        assert tree.depth(6) == 2
+
+
+class TestCategoryTreeLoading:
+    """Test cases for loading the hierarchy from the API."""
+
+    def setup_method(self):
+        """Setup mock settings and the folder endpoints."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def children(self, request):
+        """Answer a parentId query, slowly enough to overlap."""
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        parent_id = int(request.url.params["$filter"].removeprefix("parentId eq "))
+        items = [
+            {"id": category_id, "name": name, "parentId": parent}
+            for category_id, name, parent in FOLDERS
+            if parent == parent_id
+        ]
+        return httpx.Response(
+            200, json={"count": len(items), "page": 1, "pageSize": 50, "items": items}
+        )
+
+    @respx.mock
+    def test_get_category_tree_loads_levels_concurrently(self):
+        """Test that each level's children are queried in parallel."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(CATEGORIES_URL).mock(side_effect=self.children)
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            tree = client.assets.categories.get_category_tree(max_workers=4)
+
+        assert len(tree) == 7
+        assert tree.find("Content Builder/Campaigns/2026/Q4").id == 6
+        # One query for the roots, then one per category
+        assert route.call_count == 8
+        assert self.peak > 1
+
+    @respx.mock
+    def test_async_get_category_subtree(self):
+        """Test loading the subtree of a category with the async client."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(f"{CATEGORIES_URL}/2").mock(
+            return_value=httpx.Response(
+                200, json={"id": 2, "name": "Campaigns", "parentId": 1}
+            )
+        )
+        respx.get(CATEGORIES_URL).mock(side_effect=self.children)
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return await client.assets.categories.get_category_tree(root_id=2)
+
+        tree = asyncio.run(run())
+
+        assert [root.id for root in tree.roots] == [2]
+        assert sorted(category.id for category in tree) == [2, 4, 5, 6]
+        assert tree.path(6) == "Campaigns/2026/Q4"
+
+
+class TestEnsureCategoryPath:
+    """Test cases for resolving and creating category paths."""
+
+    def setup_method(self):
+        """Setup mock settings and a stand-in for the folder endpoints."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        self.folders = list(FOLDERS)
+        self.created = []
+        # Names created by another writer: the API rejects them as duplicates
+        self.taken = {}
+        self.forbidden = set()
+        self.lock = threading.Lock()
+
+    def create(self, request):
+        """Create a folder, rejecting duplicates and forbidden names."""
+        data = json.loads(request.content)
+        name, parent_id = data["Name"], data["ParentId"]
+        if name in self.forbidden:
+            return httpx.Response(403, json={"message": "Forbidden"})
+        with self.lock:
+            if (name, parent_id) in self.taken:
+                self.folders.append((self.taken[name, parent_id], name, parent_id))
+                return httpx.Response(400, json={"message": "Duplicate name"})
+            category_id = 100 + len(self.created)
+            self.created.append((name, parent_id))
+            self.folders.append((category_id, name, parent_id))
+        return httpx.Response(
+            201, json={"id": category_id, "name": name, "parentId": parent_id}
+        )
+
+    def children(self, request):
+        """Answer a parentId query."""
+        parent_id = int(request.url.params["$filter"].removeprefix("parentId eq "))
+        items = [
+            {"id": category_id, "name": name, "parentId": parent}
+            for category_id, name, parent in self.folders
+            if parent == parent_id
+        ]
+        return httpx.Response(
+            200, json={"count": len(items), "page": 1, "pageSize": 50, "items": items}
+        )
+
+    def mock_api(self):
+        """Mock the token and folder endpoints."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.post(CATEGORIES_URL).mock(side_effect=self.create)
+        return respx.get(CATEGORIES_URL).mock(side_effect=self.children)
+
+    @respx.mock
+    def test_ensure_category_paths_creates_missing_segments_once(self):
+        """Test that shared missing prefixes are created once, parents first."""
+        lookups = self.mock_api()
+        tree = CategoryTree(make_categories())
+        paths = [
+            "Content Builder/Campaigns/2026/Q4/Spain",
+            "Content Builder/Campaigns/2027/Q1",
+            "Content Builder/Campaigns/2027/Q2",
+            "Content Builder/Campaigns/2026",
+            "Missing Root/Folder",
+            "Content Builder//Empty",
+        ]
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            results = client.assets.categories.ensure_category_paths(paths, tree=tree)
+
+        assert [result.item for result in results] == paths
+        assert [result.ok for result in results] == [
+            True,
+            True,
+            True,
+            True,
+            False,
+            False,
+        ]
+        assert isinstance(results[4].error, SFMCNotFoundError)
+        assert isinstance(results[5].error, ValueError)
+        assert results[3].result.id == 4
+        assert len(self.created) == 4
+        assert self.created[0] == ("2027", 2)
+        assert results[1].result.parent_id == results[2].result.parent_id == 100
+        assert tree.path(results[1].result.id) == "Content Builder/Campaigns/2027/Q1"
+        assert tree.find("Content Builder/Campaigns/2026/Q4/Spain").parent_id == 6
+        assert not lookups.called
+
+    @respx.mock
+    def test_failed_creation_fails_paths_below(self):
+        """Test that a failed category fails its subpaths, not the others."""
+        self.mock_api()
+        self.forbidden.add("Private")
+        tree = CategoryTree(make_categories())
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            results = client.assets.categories.ensure_category_paths(
+                [
+                    "Content Builder/Private/Drafts",
+                    "Content Builder/Private",
+                    "Content Builder/Public",
+                ],
+                tree=tree,
+            )
+
+        assert isinstance(results[0].error, SFMCAuthorizationError)
+        assert results[0].error is results[1].error
+        assert results[2].result.name == "Public"
+        assert self.created == [("Public", 1)]
+
+    @respx.mock
+    def test_ensure_category_path_uses_category_of_other_writer(self):
+        """Test that a category created since the tree was loaded is reused."""
+        self.mock_api()
+        self.taken["Q1", 4] = 42
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            category = client.assets.categories.ensure_category_path(
+                ["Content Builder", "Campaigns", "2026", "Q1"],
+                tree=CategoryTree(make_categories()),
+            )
+
+        assert category.id == 42
+        assert self.created == []
+
+    @respx.mock
+    def test_other_writer_seen_through_category_cache(self):
+        """Test that cached pages do not hide a category created by another writer."""
+        lookups = self.mock_api()
+        self.taken["Spain", 1] = 42
+        config = SFMCConfig(
+            rate_limit=RateLimitConfig(enabled=False),
+            cache=CacheConfig(categories=True),
+        )
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            category = client.assets.categories.ensure_category_path(
+                "Content Builder/Spain"
+            )
+            children_of_root = [
+                call
+                for call in lookups.calls
+                if call.request.url.params["$filter"] == "parentId eq 1"
+            ]
+
+        assert category.id == 42
+        assert self.created == []
+        # Loaded with the tree, then queried again after the failed creation
+        assert len(children_of_root) == 2
+
+    @respx.mock
+    def test_async_ensure_category_path_caches_tree(self):
+        """Test that the tree is loaded once, then updated with new categories."""
+        lookups = self.mock_api()
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                categories = client.assets.categories
+                first = await categories.ensure_category_path(
+                    "Content Builder/Campaigns/2026/Q1"
+                )
+                loads = lookups.call_count
+                second = await categories.ensure_category_path(
+                    "Content Builder/Campaigns/2026/Q1/"
+                )
+                return first, second, loads, lookups.call_count
+
+        first, second, loads, calls = asyncio.run(run())
+
+        assert first == second
+        assert first.parent_id == 4
+        assert loads == calls == 8
+        assert self.created == [("Q1", 4)]
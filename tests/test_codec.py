@@ -0,0 +1,181 @@
+"""Tests for the pluggable JSON codecs."""
+
+import asyncio
+import json
+import sys
+
+import httpx
+import pytest
+import respx
+from pydantic import TypeAdapter
+
+from pysfmc import (
+    AsyncSFMCClient,
+    CreateAsset,
+    SFMCClient,
+    SFMCConfig,
+    SFMCSettings,
+)
+from pysfmc.codec import StdlibCodec, get_codec
+from pysfmc.config import ClientConfig
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+
+
+class TestCodecs:
+    """Test cases for the codec implementations."""
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_round_trip(self, name):
+        """Test that every installed codec encodes and decodes alike."""
+        if name != "json":
+            pytest.importorskip(name)
+        codec = get_codec(name)
+        document = {"name": "Spring sale ☀", "views": {"html": {"content": "<p>"}}}
+
+        encoded = codec.dumps(document)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == document
+        assert codec.loads(encoded) == document
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+    def test_validate_parses_in_pydantic(self, name, monkeypatch):
+        """Test that every codec validates bytes without decoding them first."""
+        if name != "json":
+            pytest.importorskip(name)
+        codec = get_codec(name)
+        monkeypatch.setattr(codec, "loads", None)
+
+        result = codec.validate(TypeAdapter(dict[str, int]), b'{"id": 42}')
+
+        assert result == {"id": 42}
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        """Test that 'auto' works without any optional package."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert isinstance(get_codec("auto"), StdlibCodec)
+
+    def test_missing_codec_names_extra(self, monkeypatch):
+        """Test that an explicitly chosen missing codec raises ImportError."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        with pytest.raises(ImportError, match=r"pysfmc\[orjson\]"):
+            get_codec("orjson")
+
+
+class TestClientEncoding:
+    """Test cases for request and response bodies sent by the client."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+
+    @pytest.mark.parametrize("codec", ["json", "auto"])
+    @respx.mock
+    def test_model_payload_is_sent_by_alias(self, codec):
+        """Test that models are serialized by alias and without None fields."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.post(ASSETS_URL).mock(
+            return_value=httpx.Response(201, json={"id": 42, "name": "Sale"})
+        )
+        asset = CreateAsset(
+            name="Sale", asset_type={"name": "htmlemail", "id": 208}, content="é"
+        )
+        config = SFMCConfig(client=ClientConfig(json_codec=codec))
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            result = client.post("/asset/v1/content/assets", json=asset)
+
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "assetType": {"name": "htmlemail", "id": 208},
+            "name": "Sale",
+            "content": "é",
+        }
+        assert result == {"id": 42, "name": "Sale"}
+
+
+class TestResponseValidation:
+    """Test cases for models validated from raw response bodies."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.page = {
+            "count": 1,
+            "page": 1,
+            "pageSize": 50,
+            "items": [
+                {
+                    "id": 42,
+                    "customerKey": "spring-sale",
+                    "name": "Spring sale",
+                    "assetType": {"id": 208, "name": "htmlemail"},
+                    "views": {"html": {"content": "<p>Bonjour</p>"}},
+                }
+            ],
+        }
+
+    @pytest.mark.parametrize("codec", ["json", "auto"])
+    @respx.mock
+    def test_asset_page_is_validated(self, codec):
+        """Test that asset pages validate alike with every codec."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(ASSETS_URL).mock(return_value=httpx.Response(200, json=self.page))
+        config = SFMCConfig(client=ClientConfig(json_codec=codec))
+
+        with SFMCClient(settings=self.settings, config=config) as client:
+            response = client.assets.query.get_assets(page_size=50)
+
+        assert response.page_size == 50
+        asset = response.items[0]
+        assert asset.customer_key == "spring-sale"
+        assert asset.asset_type.name == "htmlemail"
+        assert asset.views == {"html": {"content": "<p>Bonjour</p>"}}
+
+    @respx.mock
+    def test_async_asset_is_validated(self):
+        """Test that the async client validates single assets."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(f"{ASSETS_URL}/42").mock(
+            return_value=httpx.Response(200, json=self.page["items"][0])
+        )
+
+        async def run():
+            async with AsyncSFMCClient(settings=self.settings) as client:
+                return await client.assets.query.get_asset_by_id(42)
+
+        asset = asyncio.run(run())
+
+        assert asset.id == 42
+        assert asset.name == "Spring sale"
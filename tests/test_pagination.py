@@ -0,0 +1,463 @@
+"""Tests for paginated asset and category listing."""
+
+import asyncio
+import re
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import RateLimitConfig
+from pysfmc.exceptions import SFMCNotFoundError
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+def paged(total, make_item, count=None):
+    """Build a handler serving ``total`` items in pages, like the list endpoints.
+
+    ``count`` overrides the total reported by the API.
+    """
+
+    def handler(request):
+        page = int(request.url.params.get("$page", 1))
+        page_size = int(request.url.params.get("$pageSize", 50))
+        first = (page - 1) * page_size + 1
+        last = min(page * page_size, total)
+        return httpx.Response(
+            200,
+            json={
+                "count": total if count is None else count,
+                "page": page,
+                "pageSize": page_size,
+                "items": [make_item(i) for i in range(first, last + 1)],
+            },
+        )
+
+    return handler
+
+
+def make_asset(i):
+    """Build an asset item."""
+    return {"id": i, "name": f"Asset {i}"}
+
+
+def make_category(i):
+    """Build a category item."""
+    return {"id": i, "name": f"Folder {i}", "parentId": 0}
+
+
+class TestIterators:
+    """Test cases for the lazy page iterators."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_iter_assets_stops_on_count(self):
+        """Test that all pages are fetched on demand and no further."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=paged(120, make_asset))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assets = client.assets.query.iter_assets(order_by="id asc")
+            assert next(assets).id == 1
+            assert route.call_count == 1
+
+            ids = [asset.id for asset in assets]
+
+        assert ids == list(range(2, 121))
+        assert route.call_count == 3
+        assert route.calls.last.request.url.params["$orderBy"] == "id asc"
+
+    @respx.mock
+    def test_iter_assets_stops_on_empty_page(self):
+        """Test that an empty page ends the iteration despite a stale count."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=paged(60, make_asset, count=500))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assets = list(client.assets.query.iter_assets(page_size=25))
+
+        assert len(assets) == 60
+        assert route.call_count == 4
+
+    @respx.mock
+    def test_async_iter_categories(self):
+        """Test the async iterator with its filter arguments."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(CATEGORIES_URL).mock(side_effect=paged(75, make_category))
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return [
+                    category.id
+                    async for category in client.assets.categories.iter_categories(
+                        parent_id=0
+                    )
+                ]
+
+        assert asyncio.run(run()) == list(range(1, 76))
+        assert route.call_count == 2
+        assert route.calls.last.request.url.params["$filter"] == "parentId eq 0"
+
+
+class TestConcurrentPagination:
+    """Test cases for the concurrent fan-out of asset pages."""
+
+    def setup_method(self):
+        """Setup mock settings and a handler tracking concurrent requests."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        self.active = 0
+        self.max_active = 0
+        self.completed = []
+
+    def slow_pages(self, total):
+        """Serve pages that take longer the lower their page number."""
+        serve = paged(total, make_asset)
+
+        async def handler(request):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            page = int(request.url.params["$page"])
+            await asyncio.sleep(0.03 * (10 - page))
+            self.active -= 1
+            self.completed.append(page)
+            return serve(request)
+
+        return handler
+
+    def fetch_pages(self, **kwargs):
+        """Collect the page numbers yielded by iter_asset_pages()."""
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return [
+                    response.page
+                    async for response in client.assets.query.iter_asset_pages(
+                        order_by="id asc", **kwargs
+                    )
+                ]
+
+        return asyncio.run(run())
+
+    @respx.mock
+    def test_pages_in_order(self):
+        """Test that ordered mode yields every page once, in order."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=self.slow_pages(420))
+
+        pages = self.fetch_pages(concurrency=3)
+
+        assert pages == list(range(1, 10))
+        assert route.call_count == 9
+        assert self.max_active == 3
+
+    @respx.mock
+    def test_pages_as_completed(self):
+        """Test that unordered mode yields pages as soon as they finish."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(ASSETS_URL).mock(side_effect=self.slow_pages(420))
+
+        pages = self.fetch_pages(concurrency=8, ordered=False)
+
+        assert sorted(pages) == list(range(1, 10))
+        assert pages[1] == 9
+        assert self.max_active == 8
+
+    @respx.mock
+    def test_failed_page_cancels_the_rest(self):
+        """Test that an error is raised and the pages in flight are cancelled."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        serve = self.slow_pages(420)
+
+        async def handler(request):
+            if request.url.params["$page"] == "2":
+                return httpx.Response(404, json={"message": "Gone"})
+            return await serve(request)
+
+        respx.get(ASSETS_URL).mock(side_effect=handler)
+
+        with pytest.raises(SFMCNotFoundError):
+            self.fetch_pages(concurrency=4)
+
+        # Pages 3 to 5 were in flight with page 2, and never completed
+        assert self.completed == [1]
+
+
+class TestThreadedPagination:
+    """Test cases for the thread pool fan-out of the sync clients."""
+
+    def setup_method(self):
+        """Setup mock settings and a handler tracking concurrent requests."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def slow_pages(self, total, make_item):
+        """Serve pages that take longer the lower their page number."""
+        serve = paged(total, make_item)
+
+        def handler(request):
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            page = int(request.url.params["$page"])
+            time.sleep(0.03 * (10 - page))
+            with self.lock:
+                self.active -= 1
+            return serve(request)
+
+        return handler
+
+    @respx.mock
+    def test_asset_pages_in_order(self):
+        """Test that ordered mode yields every page once, in order."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=self.slow_pages(420, make_asset))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            pages = list(client.assets.query.iter_asset_pages(max_workers=4))
+
+        assert [page.page for page in pages] == list(range(1, 10))
+        assert sum(len(page.items) for page in pages) == 420
+        assert route.call_count == 9
+        assert auth_route.call_count == 1
+        assert self.max_active == 4
+
+    @respx.mock
+    def test_category_pages_as_completed(self):
+        """Test that unordered mode yields pages as soon as they finish."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(CATEGORIES_URL).mock(side_effect=self.slow_pages(420, make_category))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            pages = [
+                page.page
+                for page in client.assets.categories.iter_category_pages(
+                    max_workers=8, ordered=False
+                )
+            ]
+
+        assert sorted(pages) == list(range(1, 10))
+        assert pages[1] == 9
+
+
+class TestPrefetch:
+    """Test cases for the read-ahead of the asset iterators."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_sync_pages_are_fetched_ahead(self):
+        """Test that pages are fetched while the first one is consumed."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=paged(250, make_asset))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assets = client.assets.query.iter_assets(prefetch=2)
+            assert next(assets).id == 1
+            time.sleep(0.1)
+            # Page 1 plus two pages ahead, and no more
+            assert route.call_count == 3
+
+            ids = [asset.id for asset in assets]
+
+        assert ids == list(range(2, 251))
+        assert route.call_count == 5
+
+    @respx.mock
+    def test_async_pages_are_fetched_ahead(self):
+        """Test that the async iterator overlaps fetching and consuming."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=paged(250, make_asset))
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                ids = []
+                async for asset in client.assets.query.iter_assets(prefetch=3):
+                    if asset.id == 1:
+                        await asyncio.sleep(0.05)
+                        assert route.call_count == 4
+                    ids.append(asset.id)
+                return ids
+
+        assert asyncio.run(run()) == list(range(1, 251))
+        assert route.call_count == 5
+
+
+def keyset(ids):
+    """Build a handler filtering and sorting assets by ID like the API.
+
+    Supports the 'id gt', 'id lte' filters and 'id asc/desc' sort order used
+    by the keyset scans. ``ids`` may change between requests.
+    """
+
+    def handler(request):
+        params = request.url.params
+        expression = params.get("$filter", "")
+        matching = sorted(ids, reverse=params.get("$orderBy") == "id desc")
+        if match := re.search(r"id gt (\d+)", expression):
+            matching = [i for i in matching if i > int(match[1])]
+        if match := re.search(r"id lte (\d+)", expression):
+            matching = [i for i in matching if i <= int(match[1])]
+        page_size = int(params.get("$pageSize", 50))
+        return httpx.Response(
+            200,
+            json={
+                "count": len(matching),
+                "page": 1,
+                "pageSize": page_size,
+                "items": [make_asset(i) for i in matching[:page_size]],
+            },
+        )
+
+    return handler
+
+
+class TestKeysetScan:
+    """Test cases for the ID keyset scans."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_scan_is_stable_under_changes(self):
+        """Test that assets changing during a scan neither skip nor repeat."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        ids = set(range(10, 1310, 10))
+        route = respx.get(ASSETS_URL).mock(side_effect=keyset(ids))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            scanned = []
+            for asset in client.assets.query.scan_assets(
+                filter_expr="assetType.name eq 'htmlemail'", fields="name"
+            ):
+                scanned.append(asset.id)
+                if asset.id == 10:
+                    # Deleted from a later page, created behind and ahead
+                    ids.difference_update({600, 610})
+                    ids.update({5, 2000})
+
+        assert scanned == [*sorted(set(range(10, 1310, 10)) - {600, 610}), 2000]
+        assert route.call_count == 3
+        request = route.calls.last.request
+        assert request.url.params["$orderBy"] == "id asc"
+        assert request.url.params["$fields"] == "id,name"
+        assert request.url.params["$filter"] == (
+            "(assetType.name eq 'htmlemail') and (id gt 1020)"
+        )
+
+    @respx.mock
+    def test_parallel_scan_covers_every_id_once(self):
+        """Test that the ID ranges split the scan without overlap."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        ids = set(range(101, 601))
+        respx.get(ASSETS_URL).mock(side_effect=keyset(ids))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            query = client.assets.query
+            assert query.get_id_ranges(4) == [
+                (100, 225),
+                (225, 350),
+                (350, 475),
+                (475, None),
+            ]
+            scanned = [asset.id for asset in query.scan_assets_parallel(4)]
+
+        assert sorted(scanned) == sorted(ids)
+
+    @respx.mock
+    def test_parallel_scan_of_nothing(self):
+        """Test that a filter matching no asset yields nothing."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(side_effect=keyset(set()))
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assert list(client.assets.query.scan_assets_parallel(4)) == []
+
+        assert route.call_count == 1
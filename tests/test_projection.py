@@ -0,0 +1,133 @@
+"""Tests for asset field projections."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import RateLimitConfig
+from pysfmc.models.assets import asset_projection
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+
+
+def page_of(items, page=1, count=None):
+    """Build an asset list response."""
+    return {
+        "count": len(items) if count is None else count,
+        "page": page,
+        "pageSize": 50,
+        "items": items,
+    }
+
+
+class TestAssetProjection:
+    """Test cases for the generated projection models."""
+
+    def test_slim_model_has_only_requested_fields(self):
+        """Test the generated model and the $fields value."""
+        projection = asset_projection(["id", "name", "modified_date", "asset_type"])
+
+        assert projection.query == "id,name,modifiedDate,assetType"
+        assert list(projection.model.model_fields) == [
+            "id",
+            "name",
+            "modified_date",
+            "asset_type",
+        ]
+        asset = projection.adapter.validate_json(
+            b'{"id": 1, "name": "Sale", "modifiedDate": "2024-03-02",'
+            b' "assetType": {"id": 208, "name": "htmlemail"},'
+            b' "views": {"html": {"content": "<p>ignored</p>"}}}'
+        )
+        assert asset.modified_date == "2024-03-02"
+        assert asset.asset_type.name == "htmlemail"
+        assert not hasattr(asset, "views")
+
+    def test_projections_are_cached(self):
+        """Test that the same fields give the same projection and models."""
+        projection = asset_projection(["id", "name"])
+
+        assert asset_projection(("id", "name", "id")) is projection
+        assert asset_projection(["name", "id"]) is not projection
+
+    def test_unknown_field_is_rejected(self):
+        """Test that names must be Asset attributes."""
+        with pytest.raises(ValueError, match="modifiedDate"):
+            asset_projection(["id", "modifiedDate"])
+
+
+class TestProjectionQueries:
+    """Test cases for the projection methods of the query clients."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_get_assets_projection(self):
+        """Test that $fields is sent and items validate into the slim model."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(ASSETS_URL).mock(
+            return_value=httpx.Response(
+                200, json=page_of([{"id": 1, "name": "Sale", "customerKey": "k"}])
+            )
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            response = client.assets.query.get_assets_projection(
+                ["id", "name"], page_size=50, order_by="id asc"
+            )
+
+        params = route.calls.last.request.url.params
+        assert params["$fields"] == "id,name"
+        assert params["$orderBy"] == "id asc"
+        assert response.count == 1
+        assert response.items[0].model_dump() == {"id": 1, "name": "Sale"}
+
+    @respx.mock
+    def test_async_iter_assets_projection(self):
+        """Test that the async iterator walks every page of the projection."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        pages = [
+            page_of([{"id": i, "name": f"Asset {i}"} for i in range(1, 51)], 1, 60),
+            page_of([{"id": i, "name": f"Asset {i}"} for i in range(51, 61)], 2, 60),
+        ]
+        route = respx.get(ASSETS_URL).mock(
+            side_effect=[httpx.Response(200, json=page) for page in pages]
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return [
+                    asset.id
+                    async for asset in client.assets.query.iter_assets_projection(
+                        ["id", "name"]
+                    )
+                ]
+
+        assert asyncio.run(run()) == list(range(1, 61))
+        assert route.call_count == 2
@@ -0,0 +1,167 @@
+"""Tests for client-side rate limiting."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import httpx
+import respx
+
+from pysfmc import SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import ClientConfig, RateLimitConfig
+from pysfmc.ratelimit import SQLiteTokenBucket, TokenBucket, create_rate_limiter
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Test cases for the in-process token bucket."""
+
+    def setup_method(self):
+        """Setup a bucket of 10 requests per second with a burst of 5."""
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(
+            rate=10.0, capacity=5, recovery_threshold=2, clock=self.clock
+        )
+
+    def test_burst_then_wait(self):
+        """Test that the burst is free and later callers queue up in order."""
+        assert [self.bucket.reserve() for _ in range(5)] == [0.0] * 5
+        assert self.bucket.reserve() == 0.1
+        assert self.bucket.reserve() == 0.2
+
+        self.clock.now = 10.0
+        assert self.bucket.reserve() == 0.0
+
+    def test_throttle_and_recover(self):
+        """Test that a 429 halves the rate once and successes restore it."""
+        self.bucket.on_throttled()
+        self.bucket.on_throttled()  # Same burst of 429s, within the cooldown
+        assert self.bucket.rate == 5.0
+        assert self.bucket.reserve() == 0.2
+
+        for _ in range(2 * 5):
+            self.bucket.on_success()
+        assert self.bucket.rate == 10.0
+
+    def test_disabled_config(self):
+        """Test that no limiter is created when rate limiting is disabled."""
+        assert create_rate_limiter(RateLimitConfig(enabled=False)) is None
+        bucket = create_rate_limiter(RateLimitConfig(requests_per_minute=600))
+        assert bucket.rate == 10.0
+
+
+class TestSQLiteTokenBucket:
+    """Test cases for the token bucket shared through SQLite."""
+
+    def test_budget_shared_between_instances(self, tmp_path):
+        """Test that buckets on the same file and key draw from one budget."""
+        clock = FakeClock()
+        path = tmp_path / "ratelimit.sqlite"
+        first = SQLiteTokenBucket(path, rate=10.0, capacity=2, clock=clock)
+        second = SQLiteTokenBucket(path, rate=10.0, capacity=2, clock=clock)
+        other = SQLiteTokenBucket(path, rate=10.0, capacity=2, key="x", clock=clock)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == 0.1
+        assert other.reserve() == 0.0
+
+        second.on_throttled()
+        assert first.rate == 5.0
+
+        for bucket in (first, second, other):
+            bucket.close()
+
+    def test_async_waits_for_lock_off_the_event_loop(self, tmp_path):
+        """Test that a lock held by another process does not stall the loop."""
+        path = tmp_path / "ratelimit.sqlite"
+        bucket = SQLiteTokenBucket(path, rate=10.0, capacity=5, adaptive=True)
+        bucket.reserve()
+        # Another process holding the write lock for a while
+        other = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        other.execute("BEGIN IMMEDIATE")
+        threading.Timer(0.5, other.execute, args=("COMMIT",)).start()
+
+        async def run():
+            ticks = []
+
+            async def tick():
+                while True:
+                    ticks.append(time.perf_counter())
+                    await asyncio.sleep(0.01)
+
+            ticker = asyncio.create_task(tick())
+            await asyncio.sleep(0)
+            await bucket.acquire_async()
+            await bucket.on_throttled_async()
+            await bucket.on_success_async()
+            ticker.cancel()
+            return ticks
+
+        started = time.perf_counter()
+        ticks = asyncio.run(run())
+
+        assert time.perf_counter() - started >= 0.45
+        assert max(b - a for a, b in zip(ticks, ticks[1:], strict=False)) < 0.2
+        assert bucket.rate == 5.0
+        other.close()
+        bucket.close()
+
+    def test_created_from_config(self, tmp_path):
+        """Test that a shared state path selects the SQLite backend."""
+        config = RateLimitConfig(shared_state_path=str(tmp_path / "rl.sqlite"))
+        limiter = create_rate_limiter(config, key="tenant")
+        assert isinstance(limiter, SQLiteTokenBucket)
+        assert limiter.key == "tenant"
+        limiter.close()
+
+
+class TestClientRateLimiting:
+    """Test cases for rate limiting in the clients."""
+
+    @respx.mock
+    def test_rate_limit_response_tightens_limiter(self, monkeypatch):
+        """Test that a 429 from the server slows down the client's limiter."""
+        monkeypatch.setattr("pysfmc.client.time.sleep", lambda _: None)
+        settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        auth_url = f"{settings.auth_base_url.get_secret_value()}/v2/token"
+        respx.post(auth_url).mock(return_value=httpx.Response(200, json=AUTH_RESPONSE))
+        respx.get(CATEGORIES_URL).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"count": 0, "items": []}),
+            ]
+        )
+        config = SFMCConfig(
+            client=ClientConfig(max_retries=1),
+            rate_limit=RateLimitConfig(requests_per_minute=600),
+        )
+
+        with SFMCClient(settings=settings, config=config) as client:
+            client.get("/asset/v1/content/categories")
+            assert client._rate_limiter.rate == 5.0
@@ -0,0 +1,134 @@
+"""Tests for automatic request retries."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.exceptions import (
+    SFMCConnectionError,
+    SFMCNotFoundError,
+    SFMCRateLimitError,
+    SFMCServerError,
+)
+from pysfmc.retry import RetryPolicy
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+class TestRetryPolicy:
+    """Test cases for retry decisions and delays."""
+
+    def test_retryable_errors_by_method(self):
+        """Test that only safe combinations of method and error are retried."""
+        policy = RetryPolicy(max_retries=2)
+        server_error = SFMCServerError("boom")
+
+        assert policy.should_retry("GET", server_error, 0)
+        assert policy.should_retry("DELETE", SFMCConnectionError("reset"), 1)
+        assert not policy.should_retry("POST", server_error, 0)
+        assert policy.should_retry("POST", SFMCRateLimitError("slow down"), 0)
+        assert not policy.should_retry("GET", SFMCNotFoundError("missing"), 0)
+        assert not policy.should_retry("GET", server_error, 2)
+
+    def test_delay_honours_retry_after(self):
+        """Test that Retry-After is used as is and backoff is jittered."""
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0)
+
+        assert policy.get_delay(SFMCRateLimitError("x", retry_after=7), 0) == 7.0
+        delays = [policy.get_delay(SFMCServerError("x"), 4) for _ in range(50)]
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+class TestClientRetries:
+    """Test cases for retries performed by the clients."""
+
+    def setup_method(self):
+        """Setup mock settings and a client configuration."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig()
+
+    @respx.mock
+    def test_get_retried_after_server_error(self, monkeypatch):
+        """Test that a GET is replayed after a 503 and waits for Retry-After."""
+        sleeps = []
+        monkeypatch.setattr("pysfmc.client.time.sleep", sleeps.append)
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(CATEGORIES_URL).mock(
+            side_effect=[
+                httpx.Response(503, json={"message": "Unavailable"}),
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"count": 0, "items": []}),
+            ]
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            response = client.get("/asset/v1/content/categories")
+
+        assert response["count"] == 0
+        assert route.call_count == 3
+        assert sleeps[1] == 2.0
+
+    @respx.mock
+    def test_post_not_retried_after_server_error(self, monkeypatch):
+        """Test that a non-idempotent POST is not replayed after a 500."""
+        monkeypatch.setattr("pysfmc.client.time.sleep", lambda _: None)
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.post(CATEGORIES_URL).mock(
+            return_value=httpx.Response(500, json={"message": "Internal error"})
+        )
+
+        with (
+            pytest.raises(SFMCServerError),
+            SFMCClient(settings=self.settings, config=self.config) as client,
+        ):
+            client.post("/asset/v1/content/categories", json={"Name": "x"})
+
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_async_retries_connection_errors(self, monkeypatch):
+        """Test that the async client retries connection errors up to the limit."""
+
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr("pysfmc.client.asyncio.sleep", no_sleep)
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        route = respx.get(CATEGORIES_URL).mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                await client.get("/asset/v1/content/categories")
+
+        with pytest.raises(SFMCConnectionError):
+            asyncio.run(run())
+
+        assert route.call_count == self.config.client.max_retries + 1
@@ -0,0 +1,210 @@
+"""Tests for streaming parsing of list responses."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import AsyncSFMCClient, SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import RateLimitConfig
+from pysfmc.exceptions import SFMCNotFoundError
+from pysfmc.streaming import JSONItemSplitter
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+ASSETS_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/assets"
+
+
+def make_asset(asset_id):
+    """Build an asset whose content has the JSON characters the parser tracks."""
+    return {
+        "id": asset_id,
+        "name": f'Asset "{asset_id}" [draft] {{v2}}',
+        "content": '<td style="a:b">\\{{items}}</td>\né',
+        "assetType": {"id": 208, "name": "htmlemail"},
+        "tags": ["items", "[]"],
+        "meta": {"nested": [1, {"items": [2]}]},
+    }
+
+
+def page_of(items, page=1, count=None):
+    """Build an asset list response."""
+    return {
+        "count": len(items) if count is None else count,
+        "page": page,
+        "pageSize": 50,
+        "items": items,
+        "links": {"next": {"items": []}},
+    }
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    """Response body recording whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestJSONItemSplitter:
+    """Test cases for the incremental item parser."""
+
+    def test_items_split_at_every_chunk_boundary(self):
+        """Test that items come out whole wherever the chunks are cut."""
+        document = page_of([make_asset(i) for i in range(1, 4)], count=3)
+        body = json.dumps(document, ensure_ascii=False).encode()
+
+        for size in (1, 2, 3, 7, 64, len(body)):
+            splitter = JSONItemSplitter()
+            items = []
+            for start in range(0, len(body), size):
+                items.extend(splitter.feed(body[start : start + size]))
+
+            assert [json.loads(item) for item in items] == document["items"]
+            assert splitter.close() == {**document, "items": []}
+
+    def test_items_are_returned_as_soon_as_complete(self):
+        """Test that an item is returned before the rest of the document."""
+        splitter = JSONItemSplitter()
+
+        assert splitter.feed(b'{"count": 2, "items": [{"id": 1}, {"id"') == [
+            b'{"id": 1}'
+        ]
+        assert splitter.feed(b": 2}]}") == [b'{"id": 2}']
+        assert splitter.close() == {"count": 2, "items": []}
+
+    def test_only_the_array_member_of_the_key_is_split(self):
+        """Test that other arrays and strings equal to the key are kept."""
+        splitter = JSONItemSplitter()
+        body = b'{"name": "items", "other": [{"id": 9}], "items": [{"id": 1}]}'
+
+        assert splitter.feed(body) == [b'{"id": 1}']
+        assert splitter.close() == {
+            "name": "items",
+            "other": [{"id": 9}],
+            "items": [],
+        }
+
+    def test_truncated_document_is_rejected(self):
+        """Test that a body cut in the middle of an item raises."""
+        splitter = JSONItemSplitter()
+        splitter.feed(b'{"items": [{"id": 1}, {"name": "unfinished')
+
+        with pytest.raises(ValueError, match="Incomplete"):
+            splitter.close()
+
+
+class TestStreamAssets:
+    """Test cases for the streaming asset iterators."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+        self.config = SFMCConfig(rate_limit=RateLimitConfig(enabled=False))
+
+    @respx.mock
+    def test_stream_assets_across_pages(self):
+        """Test that assets of every page are validated and yielded in order."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        pages = [
+            page_of([make_asset(i) for i in range(1, 51)], 1, 60),
+            page_of([make_asset(i) for i in range(51, 61)], 2, 60),
+        ]
+        route = respx.get(ASSETS_URL).mock(
+            side_effect=[httpx.Response(200, json=page) for page in pages]
+        )
+
+        with SFMCClient(settings=self.settings, config=self.config) as client:
+            assets = list(
+                client.assets.query.stream_assets(filter_expr="assetType.id eq 208")
+            )
+
+        assert [asset.id for asset in assets] == list(range(1, 61))
+        assert assets[0].asset_type.name == "htmlemail"
+        assert route.call_count == 2
+        params = route.calls[1].request.url.params
+        assert params["$page"] == "2"
+        assert params["$filter"] == "assetType.id eq 208"
+
+    @respx.mock
+    def test_stream_assets_raises_api_errors(self):
+        """Test that error responses are mapped before anything is yielded."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(ASSETS_URL).mock(
+            return_value=httpx.Response(404, json={"message": "Not found"})
+        )
+
+        with (
+            SFMCClient(settings=self.settings, config=self.config) as client,
+            pytest.raises(SFMCNotFoundError),
+        ):
+            next(client.assets.query.stream_assets())
+
+    @respx.mock
+    def test_async_stream_assets(self):
+        """Test the async streaming iterator."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(ASSETS_URL).mock(
+            return_value=httpx.Response(
+                200, json=page_of([make_asset(i) for i in range(1, 4)])
+            )
+        )
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                return [
+                    asset.name async for asset in client.assets.query.stream_assets()
+                ]
+
+        assert asyncio.run(run()) == [make_asset(i)["name"] for i in range(1, 4)]
+
+    @respx.mock
+    def test_async_stream_closed_on_early_exit(self):
+        """Test that closing the iterator early closes the streamed response."""
+        respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        body = json.dumps(page_of([make_asset(i) for i in range(1, 4)])).encode()
+        stream = TrackedStream([body[:200], body[200:]])
+        respx.get(ASSETS_URL).mock(return_value=httpx.Response(200, stream=stream))
+
+        async def run():
+            async with AsyncSFMCClient(
+                settings=self.settings, config=self.config
+            ) as client:
+                assets = client.assets.query.stream_assets()
+                async for _ in assets:
+                    break
+                await assets.aclose()
+                return stream.closed
+
+        assert asyncio.run(run())
@@ -0,0 +1,153 @@
+"""Tests for shared access token stores."""
+
+import os
+import stat
+import sys
+import time
+
+import httpx
+import pytest
+import respx
+
+from pysfmc import SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import AuthConfig
+from pysfmc.token_store import (
+    FileTokenStore,
+    MemoryTokenStore,
+    SQLiteTokenStore,
+    create_token_store,
+)
+
+AUTH_RESPONSE = {
+    "access_token": "mock_access_token_12345",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "scope": "asset_read",
+    "soap_instance_url": "https://mock.soap.marketingcloudapis.com/",
+    "rest_instance_url": "https://mock.rest.marketingcloudapis.com/",
+}
+CATEGORIES_URL = "https://mock.rest.marketingcloudapis.com/asset/v1/content/categories"
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    """Provide each token store implementation."""
+    path = tmp_path / "tokens"
+    token_store = {
+        "memory": MemoryTokenStore,
+        "file": lambda: FileTokenStore(path),
+        "sqlite": lambda: SQLiteTokenStore(path),
+    }[request.param]()
+    yield token_store
+    token_store.close()
+
+
+class TestTokenStores:
+    """Test cases shared by all token store implementations."""
+
+    def test_save_load_delete(self, store):
+        """Test the record round trip and the compare-and-delete behaviour."""
+        record = {**AUTH_RESPONSE, "expires_at": time.time() + 3600}
+        assert store.load("key") is None
+
+        store.save("key", record)
+        assert store.load("key") == record
+
+        store.delete("key", access_token="some_other_token")
+        assert store.load("key") == record
+
+        store.delete("key", access_token=record["access_token"])
+        assert store.load("key") is None
+
+    def test_create_from_config(self, tmp_path):
+        """Test that the configuration selects the store implementation."""
+        path = str(tmp_path / "tokens.sqlite")
+        store = create_token_store(
+            AuthConfig(token_store="sqlite", token_store_path=path)
+        )
+        assert isinstance(store, SQLiteTokenStore)
+        assert store.path == path
+        assert isinstance(create_token_store(AuthConfig()), MemoryTokenStore)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_sqlite_files_are_private(self, tmp_path):
+        """Test that the SQLite store is only readable by its owner."""
+        directory = tmp_path / "cache" / "pysfmc"
+        path = directory / "tokens.sqlite"
+        # A previous version created the database world-readable
+        directory.mkdir(parents=True)
+        path.touch(mode=0o644)
+        os.chmod(path, 0o644)
+        old_umask = os.umask(0o022)
+        try:
+            store = SQLiteTokenStore(path)
+            store.save("key", {**AUTH_RESPONSE, "expires_at": time.time() + 60})
+            new_path = tmp_path / "new" / "tokens.sqlite"
+            new_store = SQLiteTokenStore(new_path)
+            new_store.save("key", {**AUTH_RESPONSE, "expires_at": time.time() + 60})
+        finally:
+            os.umask(old_umask)
+
+        for database in (path, new_path):
+            for suffix in ("", "-wal", "-shm"):
+                mode = stat.S_IMODE(os.stat(f"{database}{suffix}").st_mode)
+                assert mode == 0o600, f"{database}{suffix}"
+        assert stat.S_IMODE(os.stat(new_path.parent).st_mode) == 0o700
+        store.close()
+        new_store.close()
+
+
+class TestSharedTokens:
+    """Test cases for token sharing between clients."""
+
+    def setup_method(self):
+        """Setup mock settings."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.auth_url = f"{self.settings.auth_base_url.get_secret_value()}/v2/token"
+
+    @respx.mock
+    def test_token_reused_across_clients(self, tmp_path):
+        """Test that a second client (e.g. the next CLI run) reuses the token."""
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(200, json={"count": 0, "items": []})
+        )
+        config = SFMCConfig(
+            auth=AuthConfig(
+                token_store="file", token_store_path=str(tmp_path / "tokens.json")
+            )
+        )
+
+        for _ in range(3):
+            with SFMCClient(settings=self.settings, config=config) as client:
+                client.get("/asset/v1/content/categories")
+
+        assert auth_route.call_count == 1
+
+    @respx.mock
+    def test_expired_stored_token_is_refreshed(self, tmp_path):
+        """Test that a stored token past its expiry is not used."""
+        store = FileTokenStore(tmp_path / "tokens.json")
+        auth_route = respx.post(self.auth_url).mock(
+            return_value=httpx.Response(200, json=AUTH_RESPONSE)
+        )
+        respx.get(CATEGORIES_URL).mock(
+            return_value=httpx.Response(200, json={"count": 0, "items": []})
+        )
+
+        with SFMCClient(settings=self.settings, token_store=store) as client:
+            client.get("/asset/v1/content/categories")
+            key = client._authenticator._token_key
+            store.save(key, {**store.load(key), "expires_at": time.time() + 60})
+
+        with SFMCClient(settings=self.settings, token_store=store) as client:
+            client.get("/asset/v1/content/categories")
+
+        assert auth_route.call_count == 2
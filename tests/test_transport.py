@@ -0,0 +1,56 @@
+"""Tests for connection pool configuration."""
+
+import httpx
+
+from pysfmc import SFMCClient, SFMCConfig, SFMCSettings
+from pysfmc.config import ClientConfig
+from pysfmc.transport import auth_pool_limits, http_client_options, pool_limits
+
+
+class TestTransport:
+    """Test cases for building connection pools from ClientConfig."""
+
+    def setup_method(self):
+        """Setup mock settings and a tuned pool configuration."""
+        self.settings = SFMCSettings(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            account_id="123456789",
+            subdomain="test-subdomain",
+        )
+        self.client_config = ClientConfig(
+            timeout=12.0,
+            max_connections=200,
+            max_keepalive_connections=150,
+            keepalive_expiry=60.0,
+            auth_max_connections=1,
+        )
+
+    def test_pool_limits_from_config(self):
+        """Test that REST and auth limits are read from the configuration."""
+        assert pool_limits(self.client_config) == httpx.Limits(
+            max_connections=200, max_keepalive_connections=150, keepalive_expiry=60.0
+        )
+        assert auth_pool_limits(self.client_config) == httpx.Limits(
+            max_connections=1, max_keepalive_connections=1, keepalive_expiry=60.0
+        )
+        options = http_client_options(self.client_config)
+        assert options["timeout"] == 12.0
+        assert options["http2"] is False
+
+    def test_client_uses_separate_auth_pool(self):
+        """Test that the auth host gets its own pool unless a client is given."""
+        config = SFMCConfig(client=self.client_config)
+        with SFMCClient(settings=self.settings, config=config) as client:
+            assert client._authenticator._http_client is not client._http_client
+            assert client._http_client.timeout == httpx.Timeout(12.0)
+
+        shared = httpx.Client()
+        with SFMCClient(settings=self.settings, http_client=shared) as client:
+            assert client._authenticator._http_client is shared
+
+    def test_timeout_argument_overrides_config(self):
+        """Test that the explicit timeout argument wins over the config value."""
+        config = SFMCConfig(client=self.client_config)
+        with SFMCClient(settings=self.settings, timeout=3.0, config=config) as client:
+            assert client._http_client.timeout == httpx.Timeout(3.0)